@@ -1,6 +1,5 @@
-import maliput.api as api
-import maliput.math as math
-import maliput.plugin as plugin
+import functools
+import importlib
 
 __all__ = [
     'api',
@@ -9,12 +8,32 @@ __all__ = [
 ]
 
 
+def __getattr__(name):
+    """
+    Imports the `api`, `math` and `plugin` submodules on first access, so that importing `maliput`
+    only pays for the extensions actually used.
+    """
+    if name in __all__:
+        return importlib.import_module('.' + name, __name__)
+    raise AttributeError("module '{}' has no attribute '{}'".format(__name__, name))
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
+
+
 def get_maliput_backends():
     import importlib.metadata as importlib_metadata
     entry_points = importlib_metadata.entry_points()
-    if 'maliput.backends' in entry_points:
-        return entry_points['maliput.backends']
-    return []
+    if hasattr(entry_points, 'select'):
+        return entry_points.select(group='maliput.backends')
+    return entry_points.get('maliput.backends', [])
+
+
+@functools.lru_cache(maxsize=None)
+def _get_backend_plugin_paths():
+    """Returns the paths provided by the `maliput.backends` entry points, loading them once."""
+    return tuple(entry_point.load()() for entry_point in get_maliput_backends())
 
 
 def update_plugin_path():
@@ -25,17 +44,16 @@ def update_plugin_path():
       group: maliput.backends
       name: <backend_name> (e.g. 'maliput_malidrive')
       value: method that returns the path to the location of .so files
+
+    It is called when `maliput.plugin` is first imported. Entry points are
+    only scanned once and paths already in MALIPUT_PLUGIN_PATH are not
+    added again.
     """
     import os
 
-    plugin_paths = []
-    for entry_point in get_maliput_backends():
-        plugin_paths.append(entry_point.load()())
-
-    plugin_path = os.pathsep.join(plugin_paths)
+    plugin_paths = list(_get_backend_plugin_paths())
     if 'MALIPUT_PLUGIN_PATH' in os.environ:
-        plugin_path = os.pathsep.join([plugin_path, os.environ['MALIPUT_PLUGIN_PATH']])
-    os.environ['MALIPUT_PLUGIN_PATH'] = plugin_path
-
-
-update_plugin_path()
+        current_paths = os.environ['MALIPUT_PLUGIN_PATH'].split(os.pathsep)
+        plugin_paths = [path for path in plugin_paths if path not in current_paths]
+        plugin_paths.append(os.environ['MALIPUT_PLUGIN_PATH'])
+    os.environ['MALIPUT_PLUGIN_PATH'] = os.pathsep.join(plugin_paths)
@@ -0,0 +1,226 @@
+# BSD 3-Clause License
+#
+# Copyright (c) 2026, Woven by Toyota. All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# * Neither the name of the copyright holder nor the names of its
+#   contributors may be used to endorse or promote products derived from
+#   this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+"""Process-wide cache of road networks built by maliput.plugin.create_road_network()."""
+
+import collections
+import hashlib
+import os
+import threading
+import warnings
+import weakref
+
+
+def _rss_bytes():
+    """
+    Returns the resident set size of the process, or 0 when it cannot be obtained.
+
+    It is read from /proc, hence only available on Linux.
+    """
+    try:
+        with open('/proc/self/statm') as statm:
+            return int(statm.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError, IndexError):
+        return 0
+
+
+def _file_stamp(path, hash_files):
+    """Returns a tuple identifying the current contents of the file at `path`."""
+    stat = os.stat(path)
+    if not hash_files:
+        return (path, stat.st_mtime_ns, stat.st_size)
+    digest = hashlib.sha256()
+    with open(path, 'rb') as source:
+        for chunk in iter(lambda: source.read(1 << 20), b''):
+            digest.update(chunk)
+    return (path, stat.st_size, digest.hexdigest())
+
+
+# Every RoadNetworkCache, so that their locks are renewed in forked children.
+_caches = weakref.WeakSet()
+
+
+def _renew_locks():
+    """Replaces the lock of every cache, which may have been held by another thread at fork time."""
+    for cache in list(_caches):
+        cache._lock = threading.Lock()
+
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_renew_locks)
+
+
+_Entry = collections.namedtuple('_Entry', ['road_network', 'memory'])
+
+
+class RoadNetworkCache:
+    """
+    LRU cache of road networks keyed by plugin id, properties and source files.
+
+    Every property value naming an existing file, such as the OpenDRIVE file of
+    maliput_malidrive, is part of the key through its modification time and size, or through
+    its SHA-256 digest when `hash_files` is True. Editing a map therefore invalidates its entry.
+
+    Cached road networks are shared by every caller requesting the same key and must be treated
+    as immutable. Evicted road networks are only released once the callers holding them drop
+    their references.
+
+    The memory of each entry is the size `size_estimator` returns for its road network. Without
+    one, it is estimated as the growth of the process resident set size while the road network
+    was built. That estimate is best effort and Linux only: it is 0 where /proc is not
+    available, it undercounts when the allocator reuses freed pages and it is skewed when several
+    road networks are built concurrently, as the loader releases the GIL.
+
+    Cached road networks are inherited by processes forked afterwards, which then share their
+    memory copy-on-write. Locks are renewed in forked children, so a cache may be used there even
+    when another thread held it at fork time.
+    """
+
+    def __init__(self, max_entries=8, max_memory_bytes=None, hash_files=False, loader=None,
+                 size_estimator=None):
+        """
+        Constructs an empty cache.
+
+        Args:
+            max_entries: Maximum number of cached road networks. None for no limit.
+            max_memory_bytes: Maximum estimated memory of the cached road networks. None for no
+                limit. The most recently built road network is kept even when it exceeds the
+                limit on its own. A RuntimeWarning is issued when it is set without a
+                `size_estimator` and the resident set size cannot be obtained, in which case
+                the limit never evicts.
+            hash_files: Whether source files are identified by their contents rather than by
+                their modification time and size.
+            loader: Callable taking a plugin id and a properties dict and returning a road
+                network. Defaults to maliput.plugin.create_road_network.
+            size_estimator: Callable taking a road network and returning its memory in bytes.
+                Defaults to the growth of the resident set size while it is built.
+        """
+        if max_entries is not None and max_entries < 1:
+            raise ValueError('max_entries must be positive.')
+        self._max_entries = max_entries
+        self._max_memory_bytes = max_memory_bytes
+        self._hash_files = hash_files
+        self._loader = loader
+        self._size_estimator = size_estimator
+        self._entries = collections.OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        _caches.add(self)
+        if max_memory_bytes is not None and size_estimator is None and _rss_bytes() == 0:
+            warnings.warn('The resident set size of the process is not available, so '
+                          'max_memory_bytes has no effect without a size_estimator.',
+                          RuntimeWarning, stacklevel=2)
+
+    def get(self, plugin_id, properties):
+        """
+        Returns the road network `plugin_id` builds out of `properties`, building it on a miss.
+
+        Concurrent misses on the same key may build the road network more than once; only the
+        first one built is cached and returned.
+        """
+        key = self.key(plugin_id, properties)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry.road_network
+            self.misses += 1
+
+        if self._size_estimator is not None:
+            road_network = self._load(plugin_id, properties)
+            memory = self._size_estimator(road_network)
+        else:
+            rss_before = _rss_bytes()
+            road_network = self._load(plugin_id, properties)
+            memory = max(0, _rss_bytes() - rss_before)
+
+        with self._lock:
+            entry = self._entries.setdefault(key, _Entry(road_network, memory))
+            self._entries.move_to_end(key)
+            self._evict()
+            return entry.road_network
+
+    def key(self, plugin_id, properties):
+        """Returns the key `plugin_id` and `properties` are cached under."""
+        items = tuple(sorted((str(name), str(value)) for name, value in properties.items()))
+        stamps = tuple(
+            _file_stamp(value, self._hash_files) for _, value in items if os.path.isfile(value))
+        return (plugin_id, items, stamps)
+
+    def clear(self):
+        """Drops every cached road network."""
+        with self._lock:
+            self._entries.clear()
+
+    def memory_bytes(self):
+        """Returns the estimated memory of the cached road networks."""
+        with self._lock:
+            return sum(entry.memory for entry in self._entries.values())
+
+    def __len__(self):
+        with self._lock:
+            return len(self._entries)
+
+    def _load(self, plugin_id, properties):
+        if self._loader is not None:
+            return self._loader(plugin_id, properties)
+        import maliput.plugin
+        return maliput.plugin.create_road_network(plugin_id, properties)
+
+    def _evict(self):
+        """Drops least recently used entries until the limits hold. Requires the lock held."""
+        while len(self._entries) > 1 and self._exceeds_limits():
+            self._entries.popitem(last=False)
+
+    def _exceeds_limits(self):
+        if self._max_entries is not None and len(self._entries) > self._max_entries:
+            return True
+        if self._max_memory_bytes is not None:
+            return sum(entry.memory for entry in self._entries.values()) > self._max_memory_bytes
+        return False
+
+
+_default_cache = RoadNetworkCache()
+
+
+def create_road_network(plugin_id, properties):
+    """
+    Cached counterpart of maliput.plugin.create_road_network().
+
+    Returns a road network shared with every other caller passing the same `plugin_id`,
+    `properties` and unchanged source files. It must not be modified. See RoadNetworkCache.
+    """
+    return _default_cache.get(plugin_id, properties)
+
+
+def default_cache():
+    """Returns the RoadNetworkCache used by create_road_network()."""
+    return _default_cache
@@ -0,0 +1,164 @@
+# BSD 3-Clause License
+#
+# Copyright (c) 2026, Woven by Toyota. All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# * Neither the name of the copyright holder nor the names of its
+#   contributors may be used to endorse or promote products derived from
+#   this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+"""
+Picklable handles to road networks, for process pools.
+
+maliput.api.RoadNetwork objects cannot be pickled, so they cannot be sent to multiprocessing or
+concurrent.futures workers. A RoadNetworkHandle records how a road network is built, namely a
+plugin id and its properties, and optionally the path of a snapshot saved by
+maliput.road_network_snapshot.save_snapshot(). Pickling a handle only sends that record. Each
+worker builds the road network the first time it asks for it, through the process-wide
+maliput.road_network_cache, so every handle to the same map in a process shares a single road
+network. Workers that only need the data of the snapshot map it read-only instead, sharing its
+pages with every other process mapping it, without building the road network at all.
+
+Fork safety: with the 'fork' start method, road networks built before the pool is created are
+inherited by the workers and their memory is shared copy-on-write, so resolving a handle in a
+worker hits the inherited cache instead of reloading the map. Pages are only copied when written
+to. Queries do not modify a road network, so most of its memory stays shared, although Python
+reference counting still copies the pages holding the wrapper objects a worker touches. Forking
+while another thread runs a query that released the GIL, or is building a road network, is not
+safe: the child inherits the memory that thread was using in whatever state it was in. Create
+pools before starting such threads, or use the 'spawn' or 'forkserver' start methods together
+with handles.
+"""
+
+import os
+
+from maliput import road_network_cache
+
+
+class RoadNetworkHandle:
+    """
+    Picklable reference to a road network, resolved lazily in each process.
+
+    Handles compare equal when they refer to the same plugin id, properties and snapshot path.
+    """
+
+    def __init__(self, plugin_id=None, properties=None, snapshot_path=None):
+        """
+        Constructs a handle.
+
+        Args:
+            plugin_id: Id of the maliput.plugin road network loader plugin that builds the road
+                network, e.g. 'maliput_malidrive'. None when the handle only refers to a snapshot.
+            properties: Dict of string properties passed to the plugin.
+            snapshot_path: Path of a snapshot of the road network, or None.
+
+        Raises:
+            ValueError: When neither `plugin_id` nor `snapshot_path` are given.
+        """
+        if plugin_id is None and snapshot_path is None:
+            raise ValueError('Either plugin_id or snapshot_path must be given.')
+        self._plugin_id = plugin_id
+        self._properties = {str(name): str(value) for name, value in (properties or {}).items()}
+        self._snapshot_path = os.fspath(snapshot_path) if snapshot_path is not None else None
+        self._reset()
+
+    @property
+    def plugin_id(self):
+        return self._plugin_id
+
+    @property
+    def properties(self):
+        return dict(self._properties)
+
+    @property
+    def snapshot_path(self):
+        return self._snapshot_path
+
+    def road_network(self):
+        """
+        Returns the road network, building it on first use in this process.
+
+        Road networks are shared through maliput.road_network_cache and must not be modified.
+
+        Raises:
+            ValueError: When the handle has no plugin id.
+        """
+        if self._plugin_id is None:
+            raise ValueError('This handle only refers to the snapshot at {}.'.format(
+                self._snapshot_path))
+        # Concurrent first calls are resolved by the cache to the same road network.
+        if self._road_network is None:
+            self._road_network = road_network_cache.default_cache().get(
+                self._plugin_id, self._properties)
+        return self._road_network
+
+    def road_geometry(self):
+        """Returns the road geometry of road_network()."""
+        return self.road_network().road_geometry()
+
+    def snapshot(self):
+        """
+        Returns the snapshot, memory mapped on first use in this process.
+
+        Raises:
+            ValueError: When the handle has no snapshot path.
+        """
+        if self._snapshot_path is None:
+            raise ValueError('This handle has no snapshot path.')
+        if self._snapshot is None:
+            from maliput.road_network_snapshot import load_snapshot
+            self._snapshot = load_snapshot(self._snapshot_path, mmap=True)
+        return self._snapshot
+
+    def __getstate__(self):
+        return {
+            'plugin_id': self._plugin_id,
+            'properties': self._properties,
+            'snapshot_path': self._snapshot_path,
+        }
+
+    def __setstate__(self, state):
+        self._plugin_id = state['plugin_id']
+        self._properties = state['properties']
+        self._snapshot_path = state['snapshot_path']
+        self._reset()
+
+    def __eq__(self, other):
+        if not isinstance(other, RoadNetworkHandle):
+            return NotImplemented
+        return self._key() == other._key()
+
+    def __hash__(self):
+        return hash(self._key())
+
+    def __repr__(self):
+        return 'RoadNetworkHandle(plugin_id={!r}, properties={!r}, snapshot_path={!r})'.format(
+            self._plugin_id, self._properties, self._snapshot_path)
+
+    def _key(self):
+        return (self._plugin_id, tuple(sorted(self._properties.items())), self._snapshot_path)
+
+    def _reset(self):
+        """Forgets the road network and snapshot resolved in this process."""
+        self._road_network = None
+        self._snapshot = None
@@ -0,0 +1,430 @@
+# BSD 3-Clause License
+#
+# Copyright (c) 2026, Woven by Toyota. All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# * Neither the name of the copyright holder nor the names of its
+#   contributors may be used to endorse or promote products derived from
+#   this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+"""
+Binary snapshots of the contents of a maliput::api::RoadNetwork.
+
+Building a road network from a large map pays for parsing and geometry construction every time.
+A snapshot stores what workers usually need out of it, so that they can load it back in
+milliseconds through a read-only memory map instead:
+
+- Lane geometry sampled with RoadGeometry.SampleLanes().
+- Topology: segments, junctions, branch points and the LaneEndSets of each side.
+- DiscreteValueRules and RangeValueRules of the RoadRulebook.
+- TrafficLights of the TrafficLightBook.
+- PhaseRings of the PhaseRingBook.
+
+A snapshot file starts with an 8-byte magic string and the byte length of a JSON header as a
+little-endian uint64. The header holds the format version, the string-valued contents of the
+snapshot and the dtype, shape and offset of every array, whose data follows the header aligned
+to 64 bytes.
+
+Only lane geometry and topology are memory mapped. Rules, traffic lights and phase rings live
+in the JSON header, which every process parses into its own Python lists and dicts, so their
+load time and memory grow with the rulebook and are not shared between processes.
+
+Snapshots are not maliput::api::RoadNetworks: backend specific geometry queries such as
+ToRoadPosition() are only available on the road network the snapshot was saved from. Neither
+are rule queries: a snapshot lists the rules but cannot find those applying to a lane range, so
+workers needing RoadRulebook.FindRules() or a RoadRulebookIndex still pay the full build of the
+road network.
+"""
+
+import json
+import os
+import struct
+
+import numpy as np
+
+_MAGIC = b'MALISNAP'
+_VERSION = 1
+_ALIGNMENT = 64
+_PREAMBLE = struct.Struct('<8sQ')
+
+
+def _align(offset):
+    return (offset + _ALIGNMENT - 1) // _ALIGNMENT * _ALIGNMENT
+
+
+def _write(path, arrays, contents):
+    """Writes `arrays` and the JSON serializable `contents` to a snapshot file at `path`."""
+    arrays = {name: np.ascontiguousarray(array) for name, array in arrays.items()}
+    layout = {}
+    offset = 0
+    for name, array in arrays.items():
+        offset = _align(offset)
+        layout[name] = [array.dtype.str, list(array.shape), offset]
+        offset += array.nbytes
+    header = json.dumps({'version': _VERSION, 'contents': contents, 'arrays': layout},
+                        separators=(',', ':')).encode('utf-8')
+    data_offset = _align(_PREAMBLE.size + len(header))
+
+    # Written aside and renamed so that concurrent readers never see a partial snapshot.
+    temporary_path = '{}.{}.tmp'.format(path, os.getpid())
+    try:
+        with open(temporary_path, 'wb') as snapshot:
+            snapshot.write(_PREAMBLE.pack(_MAGIC, len(header)))
+            snapshot.write(header)
+            for name, array in arrays.items():
+                snapshot.seek(data_offset + layout[name][2])
+                snapshot.write(array.tobytes())
+            snapshot.truncate(data_offset + offset)
+        os.replace(temporary_path, path)
+    except BaseException:
+        if os.path.exists(temporary_path):
+            os.remove(temporary_path)
+        raise
+
+
+def _read(path, mmap):
+    """Returns the arrays and the contents of the snapshot file at `path`."""
+    with open(path, 'rb') as snapshot:
+        preamble = snapshot.read(_PREAMBLE.size)
+        if len(preamble) != _PREAMBLE.size:
+            raise ValueError('{} is not a maliput road network snapshot.'.format(path))
+        magic, header_size = _PREAMBLE.unpack(preamble)
+        if magic != _MAGIC:
+            raise ValueError('{} is not a maliput road network snapshot.'.format(path))
+        header = json.loads(snapshot.read(header_size).decode('utf-8'))
+        if header['version'] != _VERSION:
+            raise ValueError('{} is a version {} snapshot, expected version {}.'.format(
+                path, header['version'], _VERSION))
+        data_offset = _align(_PREAMBLE.size + header_size)
+        if mmap:
+            data = np.memmap(path, dtype=np.uint8, mode='r')
+        else:
+            data = np.fromfile(snapshot, dtype=np.uint8, offset=data_offset - snapshot.tell())
+            data_offset = 0
+    arrays = {}
+    for name, (dtype, shape, offset) in header['arrays'].items():
+        dtype = np.dtype(dtype)
+        begin = data_offset + offset
+        end = begin + dtype.itemsize * int(np.prod(shape, dtype=np.int64))
+        arrays[name] = data[begin:end].view(dtype).reshape(shape)
+    return arrays, header['contents']
+
+
+def _related(state):
+    return {
+        'severity': state.severity,
+        'related_rules': {group: [rule_id.string() for rule_id in rule_ids]
+                          for group, rule_ids in state.related_rules.items()},
+        'related_unique_ids': {group: [unique_id.string() for unique_id in unique_ids]
+                               for group, unique_ids in state.related_unique_ids.items()},
+    }
+
+
+def _discrete_value(state):
+    serialized = _related(state)
+    serialized['value'] = state.value
+    return serialized
+
+
+def _range(state):
+    serialized = _related(state)
+    serialized.update({'description': state.description, 'min': state.min, 'max': state.max})
+    return serialized
+
+
+def _rule(rule, states):
+    return {
+        'id': rule.id().string(),
+        'type_id': rule.type_id().string(),
+        'zone': [[lane_s_range.lane_id().string(), lane_s_range.s_range().s0(),
+                  lane_s_range.s_range().s1()] for lane_s_range in rule.zone().ranges()],
+        'states': states,
+    }
+
+
+def _position(inertial_position):
+    return [inertial_position.x(), inertial_position.y(), inertial_position.z()]
+
+
+def _quaternion(rotation):
+    quaternion = rotation.quat()
+    return [quaternion.w(), quaternion.x(), quaternion.y(), quaternion.z()]
+
+
+def _vector3(vector):
+    return [vector.x(), vector.y(), vector.z()]
+
+
+def _bulb(bulb):
+    return {
+        'id': bulb.id().string(),
+        'position_bulb_group': _position(bulb.position_bulb_group()),
+        'orientation_bulb_group': _quaternion(bulb.orientation_bulb_group()),
+        'color': bulb.color().name,
+        'type': bulb.type().name,
+        'arrow_orientation_rad': bulb.arrow_orientation_rad(),
+        'states': [state.name for state in bulb.states()],
+        'bounding_box': [_vector3(bulb.bounding_box().p_BMin),
+                         _vector3(bulb.bounding_box().p_BMax)],
+    }
+
+
+def _traffic_light(traffic_light):
+    return {
+        'id': traffic_light.id().string(),
+        'position_road_network': _position(traffic_light.position_road_network()),
+        'orientation_road_network': _quaternion(traffic_light.orientation_road_network()),
+        'bulb_groups': [{
+            'id': bulb_group.id().string(),
+            'position_traffic_light': _position(bulb_group.position_traffic_light()),
+            'orientation_traffic_light': _quaternion(bulb_group.orientation_traffic_light()),
+            'bulbs': [_bulb(bulb) for bulb in bulb_group.bulbs()],
+        } for bulb_group in traffic_light.bulb_groups()],
+    }
+
+
+def _phase_ring(phase_ring):
+    phases = []
+    for phase in phase_ring.phases():
+        bulb_states = phase.bulb_states()
+        phases.append({
+            'id': phase.id().string(),
+            'discrete_value_rule_states': {
+                rule_id.string(): _discrete_value(state)
+                for rule_id, state in phase.discrete_value_rule_states().items()},
+            'bulb_states': None if bulb_states is None else {
+                unique_bulb_id.string(): state.name
+                for unique_bulb_id, state in bulb_states.items()},
+        })
+    return {
+        'id': phase_ring.id().string(),
+        'phases': phases,
+        'next_phases': {
+            phase_id.string(): [[next_phase.id.string(), next_phase.duration_until]
+                                for next_phase in next_phases]
+            for phase_id, next_phases in phase_ring.next_phases().items()},
+    }
+
+
+def save_snapshot(road_network, path, s_resolution=1.):
+    """
+    Writes a snapshot of `road_network` to `path`.
+
+    Args:
+        road_network: maliput.api.RoadNetwork to take the snapshot of.
+        path: Path of the snapshot file, which is replaced atomically if it exists.
+        s_resolution: Maximum distance between lane geometry samples along the lanes.
+    """
+    import maliput.api
+
+    road_geometry = road_network.road_geometry()
+    samples = road_geometry.SampleLanes(s_resolution)
+    lane_ids = [lane_id.string() for lane_id in samples.lane_ids]
+    lane_indices = {lane_id: index for index, lane_id in enumerate(lane_ids)}
+    num_lanes = len(lane_ids)
+
+    junction_ids = []
+    segment_ids = []
+    segment_junction_indices = []
+    lane_segment_indices = np.zeros(num_lanes, dtype=np.int32)
+    for junction_index in range(road_geometry.num_junctions()):
+        junction = road_geometry.junction(junction_index)
+        junction_ids.append(junction.id().string())
+        for segment_index in range(junction.num_segments()):
+            segment = junction.segment(segment_index)
+            for lane_index in range(segment.num_lanes()):
+                lane_segment_indices[lane_indices[segment.lane(lane_index).id().string()]] = \
+                    len(segment_ids)
+            segment_ids.append(segment.id().string())
+            segment_junction_indices.append(junction_index)
+
+    # Lane ends are (lane index, end) pairs, end being 0 for kStart and 1 for kFinish. Side
+    # 2 * i holds the A side of the i-th branch point and side 2 * i + 1 its B side.
+    branch_point_ids = []
+    side_offsets = [0]
+    side_lane_ends = []
+    lane_end_sides = np.full((num_lanes, 2), -1, dtype=np.int32)
+    for branch_point_index in range(road_geometry.num_branch_points()):
+        branch_point = road_geometry.branch_point(branch_point_index)
+        branch_point_ids.append(branch_point.id().string())
+        for lane_end_set in (branch_point.GetASide(), branch_point.GetBSide()):
+            for i in range(lane_end_set.size()):
+                lane_end = lane_end_set.get(i)
+                lane_index = lane_indices[lane_end.lane.id().string()]
+                lane_end_sides[lane_index, int(lane_end.end)] = len(side_offsets) - 1
+                side_lane_ends.append([lane_index, int(lane_end.end)])
+            side_offsets.append(len(side_lane_ends))
+
+    default_branches = np.full((num_lanes, 2, 2), -1, dtype=np.int32)
+    for lane in road_geometry.ById().GetLanes().values():
+        lane_index = lane_indices[lane.id().string()]
+        for end, which in enumerate((maliput.api.Which.kStart, maliput.api.Which.kFinish)):
+            default_branch = lane.GetDefaultBranch(which)
+            if default_branch is not None:
+                default_branches[lane_index, end] = [
+                    lane_indices[default_branch.lane.id().string()], int(default_branch.end)]
+
+    rules = road_network.rulebook().Rules()
+    contents = {
+        'road_geometry_id': road_geometry.id().string(),
+        'linear_tolerance': road_geometry.linear_tolerance(),
+        'angular_tolerance': road_geometry.angular_tolerance(),
+        'scale_length': road_geometry.scale_length(),
+        's_resolution': s_resolution,
+        'lane_ids': lane_ids,
+        'segment_ids': segment_ids,
+        'junction_ids': junction_ids,
+        'branch_point_ids': branch_point_ids,
+        'discrete_value_rules': [
+            _rule(rule, [_discrete_value(state) for state in rule.states()])
+            for rule in rules.discrete_value_rules.values()],
+        'range_value_rules': [
+            _rule(rule, [_range(state) for state in rule.states()])
+            for rule in rules.range_value_rules.values()],
+        'traffic_lights': [_traffic_light(traffic_light)
+                           for traffic_light in road_network.traffic_light_book().TrafficLights()],
+        'phase_rings': [_phase_ring(road_network.phase_ring_book().GetPhaseRing(phase_ring_id))
+                        for phase_ring_id in road_network.phase_ring_book().GetPhaseRings()],
+    }
+    arrays = {
+        'lane_types': np.asarray(samples.lane_types, dtype=np.int32),
+        'lane_offsets': np.asarray(samples.lane_offsets, dtype=np.int64),
+        'lane_segment_indices': lane_segment_indices,
+        'segment_junction_indices': np.asarray(segment_junction_indices, dtype=np.int32),
+        's': np.asarray(samples.s, dtype=np.float64),
+        'centerlines': np.asarray(samples.centerlines, dtype=np.float64),
+        'left_boundaries': np.asarray(samples.left_boundaries, dtype=np.float64),
+        'right_boundaries': np.asarray(samples.right_boundaries, dtype=np.float64),
+        'curvatures': np.asarray(samples.curvatures, dtype=np.float64),
+        'side_offsets': np.asarray(side_offsets, dtype=np.int64),
+        'side_lane_ends': np.asarray(side_lane_ends, dtype=np.int32).reshape(-1, 2),
+        'lane_end_sides': lane_end_sides,
+        'default_branches': default_branches,
+    }
+    _write(path, arrays, contents)
+
+
+def load_snapshot(path, mmap=True):
+    """
+    Loads the snapshot at `path`.
+
+    Args:
+        path: Path of a snapshot file written by save_snapshot().
+        mmap: Whether arrays are read-only views of a memory map of the file, shared with every
+            other process mapping it, rather than copies read into memory.
+
+    Returns:
+        A RoadNetworkSnapshot.
+
+    Raises:
+        ValueError: When `path` is not a snapshot or was written by an incompatible version.
+    """
+    arrays, contents = _read(path, mmap)
+    return RoadNetworkSnapshot(arrays, contents)
+
+
+class RoadNetworkSnapshot:
+    """
+    Contents of a road network loaded by load_snapshot().
+
+    Lanes, segments, junctions and branch points are referred to by their index into
+    `lane_ids`, `segment_ids`, `junction_ids` and `branch_point_ids` respectively. Lane ends are
+    (lane index, end) pairs, end being 0 for the start of the lane and 1 for its finish.
+
+    Lane geometry samples follow RoadGeometry.SampleLanes(): the samples of the i-th lane are
+    rows `lane_offsets[i]` to `lane_offsets[i + 1]` of `s`, `centerlines`, `left_boundaries`,
+    `right_boundaries` and `curvatures`.
+
+    Rules, traffic lights and phase rings are lists of dicts mirroring the maliput.api.rules
+    accessors, e.g. `rule['zone']` holds [lane id, s0, s1] lists and `bulb['color']` holds a
+    maliput.api.rules.BulbColor name. They are parsed out of the snapshot header rather than
+    memory mapped, and cannot be queried by lane range.
+    """
+
+    def __init__(self, arrays, contents):
+        self.road_geometry_id = contents['road_geometry_id']
+        self.linear_tolerance = contents['linear_tolerance']
+        self.angular_tolerance = contents['angular_tolerance']
+        self.scale_length = contents['scale_length']
+        self.s_resolution = contents['s_resolution']
+        self.lane_ids = contents['lane_ids']
+        self.segment_ids = contents['segment_ids']
+        self.junction_ids = contents['junction_ids']
+        self.branch_point_ids = contents['branch_point_ids']
+        self.discrete_value_rules = contents['discrete_value_rules']
+        self.range_value_rules = contents['range_value_rules']
+        self.traffic_lights = contents['traffic_lights']
+        self.phase_rings = contents['phase_rings']
+
+        self.lane_types = arrays['lane_types']
+        self.lane_offsets = arrays['lane_offsets']
+        self.lane_segment_indices = arrays['lane_segment_indices']
+        self.segment_junction_indices = arrays['segment_junction_indices']
+        self.s = arrays['s']
+        self.centerlines = arrays['centerlines']
+        self.left_boundaries = arrays['left_boundaries']
+        self.right_boundaries = arrays['right_boundaries']
+        self.curvatures = arrays['curvatures']
+        self.default_branches = arrays['default_branches']
+        self._side_offsets = arrays['side_offsets']
+        self._side_lane_ends = arrays['side_lane_ends']
+        self._lane_end_sides = arrays['lane_end_sides']
+        self._lane_indices = {lane_id: index for index, lane_id in enumerate(self.lane_ids)}
+
+    def num_lanes(self):
+        return len(self.lane_ids)
+
+    def lane_index(self, lane_id):
+        """Returns the index of the lane whose id string is `lane_id`."""
+        return self._lane_indices[lane_id]
+
+    def lane_samples(self, lane_index):
+        """Returns the slice selecting the geometry samples of the `lane_index`-th lane."""
+        return slice(int(self.lane_offsets[lane_index]), int(self.lane_offsets[lane_index + 1]))
+
+    def lane_length(self, lane_index):
+        return float(self.s[self.lane_offsets[lane_index + 1] - 1])
+
+    def branch_point_index(self, lane_index, end):
+        """Returns the index of the branch point at `end` of the `lane_index`-th lane, or -1."""
+        side = self._lane_end_sides[lane_index, end]
+        return -1 if side < 0 else int(side) // 2
+
+    def confluent_branches(self, lane_index, end):
+        """Returns the (N, 2) lane ends confluent with `end` of the `lane_index`-th lane."""
+        return self._side(self._lane_end_sides[lane_index, end])
+
+    def ongoing_branches(self, lane_index, end):
+        """Returns the (N, 2) lane ends ongoing from `end` of the `lane_index`-th lane."""
+        side = self._lane_end_sides[lane_index, end]
+        return self._side(side ^ 1 if side >= 0 else side)
+
+    def default_branch(self, lane_index, end):
+        """Returns the default ongoing (lane index, end) of `end` of a lane, or None."""
+        lane_end = self.default_branches[lane_index, end]
+        return None if lane_end[0] < 0 else (int(lane_end[0]), int(lane_end[1]))
+
+    def _side(self, side):
+        if side < 0:
+            return self._side_lane_ends[:0]
+        return self._side_lane_ends[self._side_offsets[side]:self._side_offsets[side + 1]]
@@ -27,6 +27,18 @@
 // CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
 // OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
 // OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+#include <algorithm>
+#include <cmath>
+#include <cstdint>
+#include <limits>
+#include <memory>
+#include <optional>
+#include <stdexcept>
+#include <string>
+#include <unordered_map>
+#include <utility>
+#include <vector>
+
 #include <maliput/api/branch_point.h>
 #include <maliput/api/intersection.h>
 #include <maliput/api/junction.h>
@@ -37,17 +49,781 @@
 #include <maliput/api/road_network.h>
 #include <maliput/api/segment.h>
 #include <maliput/api/unique_id.h>
+#include <maliput/math/quaternion.h>
+#include <pybind11/numpy.h>
 #include <pybind11/operators.h>
 #include <pybind11/pybind11.h>
 #include <pybind11/stl.h>
 
 #include "bindings/api_rules_py.h"
+#include "bindings/parallel_for.h"
+#include "bindings/road_geometry_id_table.h"
+#include "bindings/road_geometry_router.h"
+#include "bindings/road_geometry_spatial_index.h"
+#include "bindings/road_position_tracker.h"
 
 namespace maliput {
 namespace bindings {
 
 namespace py = pybind11;
 
+namespace {
+
+// Row-major float64 array taken by the batched queries. Other dtypes and layouts are converted on the way in.
+using DoubleArray = py::array_t<double, py::array::c_style | py::array::forcecast>;
+
+// Read-only sequence of the ids of the entities of one kind interned by a RoadGeometryIdTable, indexed by their
+// handles. Ids are converted to Python objects only as they are accessed.
+template <typename Table>
+class IdSequence {
+ public:
+  using Id = typename Table::id_type;
+
+  IdSequence() = default;
+
+  IdSequence(std::shared_ptr<RoadGeometryIdTable> id_table, const Table* table)
+      : id_table_(std::move(id_table)), table_(table) {}
+
+  const std::vector<Id>& ids() const {
+    static const std::vector<Id> kNoIds;
+    return table_ == nullptr ? kNoIds : table_->ids();
+  }
+
+  // Returns the handle of `id`, or -1 when it is not in the sequence.
+  int IndexOf(const Id& id) const { return table_ == nullptr ? -1 : table_->IndexOf(id); }
+
+ private:
+  // Keeps `table_` alive.
+  std::shared_ptr<RoadGeometryIdTable> id_table_;
+  const Table* table_{};
+};
+
+using JunctionIdSequence = IdSequence<RoadGeometryIdTable::JunctionTable>;
+using SegmentIdSequence = IdSequence<RoadGeometryIdTable::SegmentTable>;
+using LaneIdSequence = IdSequence<RoadGeometryIdTable::LaneTable>;
+using BranchPointIdSequence = IdSequence<RoadGeometryIdTable::BranchPointTable>;
+
+// Road geometries of the live RoadNetworks and their lazily built RoadGeometryIdTables. An entry is dropped as soon as
+// the RoadNetwork owning its road geometry is garbage collected, so a road geometry later allocated at the same
+// address never gets a stale table. Only accessed with the GIL held.
+struct RoadGeometryRegistryEntry {
+  // Weak reference to the RoadNetwork owning the road geometry.
+  py::object road_network_weakref;
+  std::shared_ptr<RoadGeometryIdTable> id_table;
+};
+
+std::unordered_map<const api::RoadGeometry*, RoadGeometryRegistryEntry>& RoadGeometryRegistry() {
+  // Never destroyed, so Python objects are not released after the interpreter finalizes.
+  static auto* registry = new std::unordered_map<const api::RoadGeometry*, RoadGeometryRegistryEntry>();
+  return *registry;
+}
+
+// Registers `road_geometry` as owned by `road_network` until the latter is garbage collected.
+void RegisterRoadGeometry(py::handle road_network, const api::RoadGeometry* road_geometry) {
+  auto& registry = RoadGeometryRegistry();
+  if (road_geometry == nullptr || registry.count(road_geometry) != 0) {
+    return;
+  }
+  registry[road_geometry].road_network_weakref =
+      py::weakref(road_network, py::cpp_function([road_geometry](py::handle) {
+                    auto& registry = RoadGeometryRegistry();
+                    const auto it = registry.find(road_geometry);
+                    // Releases the weak reference only once the entry is gone.
+                    const py::object road_network_weakref = std::move(it->second.road_network_weakref);
+                    registry.erase(it);
+                  }));
+}
+
+// Returns the RoadGeometryIdTable of `road_geometry`, built once per road geometry and released along with the
+// RoadNetwork owning it.
+//
+// @throws std::invalid_argument When `road_geometry` is not registered, as nothing would own its table, which would
+// then be rebuilt on every call.
+std::shared_ptr<RoadGeometryIdTable> GetIdTable(const api::RoadGeometry& road_geometry) {
+  auto& registry = RoadGeometryRegistry();
+  const auto it = registry.find(&road_geometry);
+  if (it == registry.end()) {
+    throw std::invalid_argument(
+        "The road geometry is not owned by a known RoadNetwork; obtain it through RoadNetwork.road_geometry().");
+  }
+  if (it->second.id_table == nullptr) {
+    it->second.id_table = std::make_shared<RoadGeometryIdTable>(&road_geometry);
+  }
+  return it->second.id_table;
+}
+
+// Returns the sequence of the ids of the lanes of `road_geometry`, indexed by their handles.
+LaneIdSequence GetLaneIds(const api::RoadGeometry& road_geometry) {
+  std::shared_ptr<RoadGeometryIdTable> id_table = GetIdTable(road_geometry);
+  const RoadGeometryIdTable::LaneTable* lanes = &id_table->lanes();
+  return LaneIdSequence(std::move(id_table), lanes);
+}
+
+const api::RoadGeometry* RoadGeometryOf(const api::Junction* junction) { return junction->road_geometry(); }
+
+const api::RoadGeometry* RoadGeometryOf(const api::Segment* segment) { return RoadGeometryOf(segment->junction()); }
+
+const api::RoadGeometry* RoadGeometryOf(const api::Lane* lane) { return RoadGeometryOf(lane->segment()); }
+
+const api::RoadGeometry* RoadGeometryOf(const api::BranchPoint* branch_point) { return branch_point->road_geometry(); }
+
+// Returns the RoadNetwork owning `road_geometry` when it is registered, None otherwise.
+py::object RoadNetworkOf(const api::RoadGeometry* road_geometry) {
+  auto& registry = RoadGeometryRegistry();
+  const auto it = registry.find(road_geometry);
+  return it == registry.end() ? py::none() : it->second.road_network_weakref();
+}
+
+// Returns the `_wrappers` dict of `road_network`, creating it when missing.
+py::dict WrapperCache(py::handle road_network) {
+  py::object wrappers = py::getattr(road_network, "_wrappers", py::none());
+  if (wrappers.is_none()) {
+    wrappers = py::dict();
+    py::setattr(road_network, "_wrappers", wrappers);
+  }
+  return wrappers;
+}
+
+// Returns the Python wrapper of `entity`, a junction, segment, lane or branch point.
+//
+// The entities of a registered road geometry are wrapped once: their wrappers are owned by the `_wrappers` dict of the
+// RoadNetwork owning the road geometry, and keep that RoadNetwork alive through their own `_road_network` attribute.
+// The same entity is then always the same Python object for as long as the RoadNetwork lives, and the reference cycle
+// between the RoadNetwork and the wrappers, made of instance attributes only, is collected by the garbage collector.
+// Other entities are wrapped as references kept alive by `parent`.
+template <typename Entity>
+py::object Wrap(const Entity* entity, py::handle parent) {
+  if (entity == nullptr) {
+    return py::none();
+  }
+  const py::object road_network = RoadNetworkOf(RoadGeometryOf(entity));
+  if (road_network.is_none()) {
+    return py::cast(entity, py::return_value_policy::reference_internal, parent);
+  }
+  const py::dict wrappers = WrapperCache(road_network);
+  const py::int_ key(reinterpret_cast<std::uintptr_t>(entity));
+  py::object wrapper = wrappers.attr("get")(key);
+  if (wrapper.is_none()) {
+    wrapper = py::cast(entity, py::return_value_policy::reference);
+    py::setattr(wrapper, "_road_network", road_network);
+    wrappers[key] = wrapper;
+  }
+  return wrapper;
+}
+
+// Adapts `method`, an accessor returning a junction, segment, lane or branch point, to return its Wrap()ped result.
+template <typename Class, typename Entity, typename... Args>
+auto Wrapped(const Entity* (Class::*method)(Args...) const) {
+  return [method](py::object self, Args... args) { return Wrap((self.cast<const Class&>().*method)(args...), self); };
+}
+
+// Columnar counterpart of api::RoadPositionResult holding the results of N queries.
+struct RoadPositionResultArrays {
+  // Ids of all the lanes of the road geometry, indexed by the handles in `lane_indices`.
+  LaneIdSequence lane_ids;
+  // (N,) lane handles, indices into `lane_ids`.
+  py::array_t<int> lane_indices;
+  // (N, 3) lane positions as [s, r, h] rows.
+  py::array_t<double> lane_positions;
+  // (N, 3) nearest inertial positions as [x, y, z] rows.
+  py::array_t<double> nearest_positions;
+  // (N,) distances between the queried and the nearest inertial positions.
+  py::array_t<double> distances;
+};
+
+// Columnar results of N radius queries. The results of the i-th query are the rows in
+// [query_offsets[i], query_offsets[i + 1]).
+struct RoadPositionQueryResultArrays : public RoadPositionResultArrays {
+  // (N + 1,) offsets of the results of each query.
+  py::array_t<std::int64_t> query_offsets;
+};
+
+// Columnar counterpart of api::LanePositionResult holding the results of N queries.
+struct LanePositionResultArrays {
+  // (N, 3) lane positions as [s, r, h] rows.
+  py::array_t<double> lane_positions;
+  // (N, 3) nearest inertial positions as [x, y, z] rows.
+  py::array_t<double> nearest_positions;
+  // (N,) distances between the queried and the nearest inertial positions.
+  py::array_t<double> distances;
+};
+
+// Columnar counterpart of api::Rotation holding the results of N queries.
+struct RotationArrays {
+  // (N, 4) quaternions as [w, x, y, z] rows.
+  py::array_t<double> quaternions;
+  // (N, 3) Tait-Bryan angles as [roll, pitch, yaw] rows.
+  py::array_t<double> rpys;
+};
+
+// Samples of all the lanes of an api::RoadGeometry packed in flat arrays. The M samples of all the lanes are
+// concatenated; the samples of the i-th lane are the rows in [lane_offsets[i], lane_offsets[i + 1]).
+struct LaneSamples {
+  // Ids of the L sampled lanes, which are all the lanes of the road geometry indexed by their handles.
+  LaneIdSequence lane_ids;
+  // (L,) api::LaneType of each lane.
+  py::array_t<int> lane_types;
+  // (L + 1,) offsets of the samples of each lane.
+  py::array_t<std::int64_t> lane_offsets;
+  // (M,) s coordinate of each sample.
+  py::array_t<double> s;
+  // (M, 3) centerline inertial positions as [x, y, z] rows.
+  py::array_t<double> centerlines;
+  // (M, 3) left lane boundary inertial positions as [x, y, z] rows.
+  py::array_t<double> left_boundaries;
+  // (M, 3) right lane boundary inertial positions as [x, y, z] rows.
+  py::array_t<double> right_boundaries;
+  // (M,) centerline curvature of each sample.
+  py::array_t<double> curvatures;
+};
+
+// N waypoints sampled along an api::LaneSRoute.
+struct WaypointArrays {
+  // Ids of all the lanes of the road geometry, indexed by the handles in `lane_indices`.
+  LaneIdSequence lane_ids;
+  // (N,) handles of the lanes waypoints were sampled from, indices into `lane_ids`.
+  py::array_t<int> lane_indices;
+  // (N,) s coordinate of each waypoint.
+  py::array_t<double> s;
+  // (N, 3) inertial positions as [x, y, z] rows.
+  py::array_t<double> xyz;
+};
+
+// Results of the route searches from N start to M end positions.
+struct RouteMatrix {
+  // N lists of the routes from each start position to the M end positions, None where an end position is not
+  // reachable.
+  std::vector<std::vector<std::optional<api::LaneSRoute>>> routes;
+  // (N, M) lengths of the routes, infinity where an end position is not reachable.
+  py::array_t<double> lengths;
+};
+
+// Throws std::invalid_argument when `array` is not shaped (N, 3).
+void ThrowUnlessNx3(const DoubleArray& array, const std::string& name) {
+  if (array.ndim() != 2 || array.shape(1) != 3) {
+    throw std::invalid_argument(name + " must be an (N, 3) array.");
+  }
+}
+
+// Allocates an uninitialized (`n`, `cols`) array.
+py::array_t<double> MakeArray(py::ssize_t n, py::ssize_t cols) { return py::array_t<double>({n, cols}); }
+
+// Packs `results`, found on `road_geometry`, into a RoadPositionResultArrays.
+RoadPositionResultArrays ToRoadPositionResultArrays(const api::RoadGeometry& road_geometry,
+                                                    const std::vector<api::RoadPositionResult>& results) {
+  const py::ssize_t n = static_cast<py::ssize_t>(results.size());
+  RoadPositionResultArrays arrays;
+  const std::shared_ptr<RoadGeometryIdTable> id_table = GetIdTable(road_geometry);
+  const RoadGeometryIdTable::LaneTable& lanes = id_table->lanes();
+  arrays.lane_ids = LaneIdSequence(id_table, &lanes);
+  arrays.lane_indices = py::array_t<int>(n);
+  arrays.lane_positions = MakeArray(n, 3);
+  arrays.nearest_positions = MakeArray(n, 3);
+  arrays.distances = py::array_t<double>(n);
+
+  auto lane_indices = arrays.lane_indices.mutable_unchecked<1>();
+  auto lane_positions = arrays.lane_positions.mutable_unchecked<2>();
+  auto nearest_positions = arrays.nearest_positions.mutable_unchecked<2>();
+  auto distances = arrays.distances.mutable_unchecked<1>();
+  for (py::ssize_t i = 0; i < n; ++i) {
+    const api::RoadPositionResult& result = results[i];
+    lane_indices(i) = lanes.IndexOf(result.road_position.lane);
+    for (py::ssize_t j = 0; j < 3; ++j) {
+      lane_positions(i, j) = result.road_position.pos.srh()[j];
+      nearest_positions(i, j) = result.nearest_position.xyz()[j];
+    }
+    distances(i) = result.distance;
+  }
+  return arrays;
+}
+
+// Evaluates api::RoadGeometry::ToRoadPosition() for each [x, y, z] row of `inertial_positions`.
+RoadPositionResultArrays ToRoadPositions(const api::RoadGeometry& road_geometry,
+                                         const DoubleArray& inertial_positions) {
+  ThrowUnlessNx3(inertial_positions, "inertial_positions");
+  const py::ssize_t n = inertial_positions.shape(0);
+  const auto xyz = inertial_positions.unchecked<2>();
+  std::vector<api::RoadPositionResult> results;
+  results.reserve(n);
+  {
+    py::gil_scoped_release release;
+    for (py::ssize_t i = 0; i < n; ++i) {
+      results.push_back(road_geometry.ToRoadPosition(api::InertialPosition(xyz(i, 0), xyz(i, 1), xyz(i, 2))));
+    }
+  }
+  return ToRoadPositionResultArrays(road_geometry, results);
+}
+
+// Evaluates RoadGeometrySpatialIndex::FindRoadPositions() for each [x, y, z] row of `inertial_positions` with the
+// matching entry of `radii`, which is either a scalar or an (N,) array. Points are distributed among `num_threads`
+// threads.
+RoadPositionQueryResultArrays FindRoadPositions(const RoadGeometrySpatialIndex& index,
+                                                const DoubleArray& inertial_positions, const DoubleArray& radii,
+                                                int num_threads) {
+  ThrowUnlessNx3(inertial_positions, "inertial_positions");
+  const py::ssize_t n = inertial_positions.shape(0);
+  if (radii.ndim() != 0 && (radii.ndim() != 1 || radii.shape(0) != n)) {
+    throw std::invalid_argument("radii must be a scalar or an (N,) array.");
+  }
+  const auto xyz = inertial_positions.unchecked<2>();
+  const double* radius = radii.data();
+  const py::ssize_t radius_stride = radii.ndim() == 0 ? 0 : 1;
+  std::vector<std::vector<api::RoadPositionResult>> results_per_query(n);
+  {
+    py::gil_scoped_release release;
+    ParallelFor(static_cast<int>(n), num_threads, [&](int i) {
+      results_per_query[i] =
+          index.FindRoadPositions(api::InertialPosition(xyz(i, 0), xyz(i, 1), xyz(i, 2)), radius[i * radius_stride]);
+    });
+  }
+
+  RoadPositionQueryResultArrays arrays;
+  arrays.query_offsets = py::array_t<std::int64_t>(n + 1);
+  auto query_offsets = arrays.query_offsets.mutable_unchecked<1>();
+  query_offsets(0) = 0;
+  std::vector<api::RoadPositionResult> results;
+  for (py::ssize_t i = 0; i < n; ++i) {
+    results.insert(results.end(), results_per_query[i].begin(), results_per_query[i].end());
+    query_offsets(i + 1) = static_cast<std::int64_t>(results.size());
+  }
+  static_cast<RoadPositionResultArrays&>(arrays) = ToRoadPositionResultArrays(*index.road_geometry(), results);
+  return arrays;
+}
+
+// Samples the centerline of every range of an api::LaneSRoute from its s0 to its s1 coordinate every
+// `path_length_sampling_rate`, always including s1. Waypoints are numbered consecutively along the route and may be
+// sampled in any number of slices.
+class WaypointSampler {
+ public:
+  WaypointSampler(const api::RoadGeometry& road_geometry, const api::LaneSRoute& lane_s_route,
+                  double path_length_sampling_rate)
+      : path_length_sampling_rate_(path_length_sampling_rate), lane_ids_(GetLaneIds(road_geometry)) {
+    if (path_length_sampling_rate <= 0.) {
+      throw std::invalid_argument("path_length_sampling_rate must be positive.");
+    }
+    range_offsets_.push_back(0);
+    for (const api::LaneSRange& range : lane_s_route.ranges()) {
+      const int lane_index = lane_ids_.IndexOf(range.lane_id());
+      if (lane_index < 0) {
+        throw std::invalid_argument("Unknown lane: " + range.lane_id().string());
+      }
+      lane_indices_.push_back(lane_index);
+      lanes_.push_back(road_geometry.ById().GetLane(range.lane_id()));
+      s_ranges_.push_back(range.s_range());
+      const double length = std::abs(range.s_range().s1() - range.s_range().s0());
+      range_offsets_.push_back(range_offsets_.back() +
+                               static_cast<py::ssize_t>(std::ceil(length / path_length_sampling_rate)) + 1);
+    }
+  }
+
+  py::ssize_t num_waypoints() const { return range_offsets_.back(); }
+
+  // Allocates the arrays of `count` waypoints.
+  WaypointArrays MakeArrays(py::ssize_t count) const {
+    WaypointArrays waypoints;
+    waypoints.lane_ids = lane_ids_;
+    waypoints.lane_indices = py::array_t<int>(count);
+    waypoints.s = py::array_t<double>(count);
+    waypoints.xyz = MakeArray(count, 3);
+    return waypoints;
+  }
+
+  // Samples the waypoints in [first, first + count) into the first `count` rows of `waypoints`. Neither acquires nor
+  // requires the GIL.
+  void Sample(py::ssize_t first, py::ssize_t count, WaypointArrays* waypoints) const {
+    int* lane_indices = waypoints->lane_indices.mutable_data();
+    double* s = waypoints->s.mutable_data();
+    double* xyz = waypoints->xyz.mutable_data();
+    int range = static_cast<int>(std::upper_bound(range_offsets_.begin(), range_offsets_.end(), first) -
+                                 range_offsets_.begin()) -
+                1;
+    for (py::ssize_t i = 0; i < count; ++i) {
+      const py::ssize_t waypoint = first + i;
+      while (waypoint >= range_offsets_[range + 1]) {
+        ++range;
+      }
+      const api::SRange& s_range = s_ranges_[range];
+      const py::ssize_t k = waypoint - range_offsets_[range];
+      const double direction = s_range.s1() >= s_range.s0() ? 1. : -1.;
+      // The last waypoint of each range lands on s1, the others are `path_length_sampling_rate_` apart from s0.
+      const double lane_s = waypoint + 1 == range_offsets_[range + 1]
+                                ? s_range.s1()
+                                : s_range.s0() + direction * static_cast<double>(k) * path_length_sampling_rate_;
+      const math::Vector3 position = lanes_[range]->ToInertialPosition(api::LanePosition(lane_s, 0., 0.)).xyz();
+      lane_indices[i] = lane_indices_[range];
+      s[i] = lane_s;
+      for (int j = 0; j < 3; ++j) {
+        xyz[3 * i + j] = position[j];
+      }
+    }
+  }
+
+ private:
+  double path_length_sampling_rate_{};
+  LaneIdSequence lane_ids_;
+  // Handle and lane of each range.
+  std::vector<int> lane_indices_;
+  std::vector<const api::Lane*> lanes_;
+  std::vector<api::SRange> s_ranges_;
+  // Offsets of the waypoints of each range.
+  std::vector<py::ssize_t> range_offsets_;
+};
+
+// Iterates over the waypoints of a WaypointSampler in WaypointArrays of up to `chunk_size` waypoints.
+class WaypointChunkIterator {
+ public:
+  WaypointChunkIterator(WaypointSampler sampler, py::ssize_t chunk_size)
+      : sampler_(std::move(sampler)), chunk_size_(chunk_size) {
+    if (chunk_size <= 0) {
+      throw std::invalid_argument("chunk_size must be positive.");
+    }
+  }
+
+  py::ssize_t num_waypoints() const { return sampler_.num_waypoints(); }
+
+  WaypointArrays Next() {
+    if (next_ == sampler_.num_waypoints()) {
+      throw py::stop_iteration();
+    }
+    const py::ssize_t count = std::min(chunk_size_, sampler_.num_waypoints() - next_);
+    WaypointArrays waypoints = sampler_.MakeArrays(count);
+    {
+      py::gil_scoped_release release;
+      sampler_.Sample(next_, count, &waypoints);
+    }
+    next_ += count;
+    return waypoints;
+  }
+
+ private:
+  WaypointSampler sampler_;
+  py::ssize_t chunk_size_{};
+  py::ssize_t next_{0};
+};
+
+// Samples all the waypoints of `lane_s_route` at once.
+WaypointArrays SampleAheadWaypointArrays(const api::RoadGeometry& road_geometry, const api::LaneSRoute& lane_s_route,
+                                         double path_length_sampling_rate) {
+  const WaypointSampler sampler(road_geometry, lane_s_route, path_length_sampling_rate);
+  WaypointArrays waypoints = sampler.MakeArrays(sampler.num_waypoints());
+  {
+    py::gil_scoped_release release;
+    sampler.Sample(0, sampler.num_waypoints(), &waypoints);
+  }
+  return waypoints;
+}
+
+// Evaluates RoadPositionTracker::Update() for each agent with the matching [x, y, z] row of `inertial_positions`.
+// Agents are distributed among `num_threads` threads.
+RoadPositionResultArrays UpdateRoadPositions(RoadPositionTracker& tracker, const DoubleArray& inertial_positions,
+                                             int num_threads) {
+  ThrowUnlessNx3(inertial_positions, "inertial_positions");
+  if (inertial_positions.shape(0) != tracker.num_agents()) {
+    throw std::invalid_argument("inertial_positions must have a row per agent.");
+  }
+  const int n = tracker.num_agents();
+  const auto xyz = inertial_positions.unchecked<2>();
+  std::vector<api::RoadPositionResult> results(n);
+  {
+    py::gil_scoped_release release;
+    ParallelFor(n, num_threads,
+                [&](int i) { results[i] = tracker.Update(i, api::InertialPosition(xyz(i, 0), xyz(i, 1), xyz(i, 2))); });
+  }
+  return ToRoadPositionResultArrays(*tracker.road_geometry(), results);
+}
+
+// Evaluates RoadGeometryRouter::FindRoutes() for each of `starts`, distributed among `num_threads` threads.
+RouteMatrix FindRoutes(const RoadGeometryRouter& router, const std::vector<api::RoadPosition>& starts,
+                       const std::vector<api::RoadPosition>& ends, int num_threads) {
+  const py::ssize_t n = static_cast<py::ssize_t>(starts.size());
+  const py::ssize_t m = static_cast<py::ssize_t>(ends.size());
+  RouteMatrix matrix;
+  matrix.routes.resize(n);
+  {
+    py::gil_scoped_release release;
+    ParallelFor(static_cast<int>(n), num_threads,
+                [&](int i) { matrix.routes[i] = router.FindRoutes(starts[i], ends); });
+  }
+  matrix.lengths = MakeArray(n, m);
+  auto lengths = matrix.lengths.mutable_unchecked<2>();
+  for (py::ssize_t i = 0; i < n; ++i) {
+    for (py::ssize_t j = 0; j < m; ++j) {
+      const std::optional<api::LaneSRoute>& route = matrix.routes[i][j];
+      lengths(i, j) = route.has_value() ? route->length() : std::numeric_limits<double>::infinity();
+    }
+  }
+  return matrix;
+}
+
+// Evaluates api::Lane::ToInertialPosition() for each [s, r, h] row of `lane_positions`.
+py::array_t<double> ToInertialPositions(const api::Lane& lane, const DoubleArray& lane_positions) {
+  ThrowUnlessNx3(lane_positions, "lane_positions");
+  const py::ssize_t n = lane_positions.shape(0);
+  py::array_t<double> inertial_positions = MakeArray(n, 3);
+
+  const auto srh = lane_positions.unchecked<2>();
+  auto xyz = inertial_positions.mutable_unchecked<2>();
+  {
+    py::gil_scoped_release release;
+    for (py::ssize_t i = 0; i < n; ++i) {
+      const api::InertialPosition result = lane.ToInertialPosition(api::LanePosition(srh(i, 0), srh(i, 1), srh(i, 2)));
+      for (py::ssize_t j = 0; j < 3; ++j) {
+        xyz(i, j) = result.xyz()[j];
+      }
+    }
+  }
+  return inertial_positions;
+}
+
+// Evaluates api::Lane::ToLanePosition() for each [x, y, z] row of `inertial_positions`.
+LanePositionResultArrays ToLanePositions(const api::Lane& lane, const DoubleArray& inertial_positions) {
+  ThrowUnlessNx3(inertial_positions, "inertial_positions");
+  const py::ssize_t n = inertial_positions.shape(0);
+  LanePositionResultArrays results;
+  results.lane_positions = MakeArray(n, 3);
+  results.nearest_positions = MakeArray(n, 3);
+  results.distances = py::array_t<double>(n);
+
+  const auto xyz = inertial_positions.unchecked<2>();
+  auto lane_positions = results.lane_positions.mutable_unchecked<2>();
+  auto nearest_positions = results.nearest_positions.mutable_unchecked<2>();
+  auto distances = results.distances.mutable_unchecked<1>();
+  {
+    py::gil_scoped_release release;
+    for (py::ssize_t i = 0; i < n; ++i) {
+      const api::LanePositionResult result =
+          lane.ToLanePosition(api::InertialPosition(xyz(i, 0), xyz(i, 1), xyz(i, 2)));
+      for (py::ssize_t j = 0; j < 3; ++j) {
+        lane_positions(i, j) = result.lane_position.srh()[j];
+        nearest_positions(i, j) = result.nearest_position.xyz()[j];
+      }
+      distances(i) = result.distance;
+    }
+  }
+  return results;
+}
+
+// Evaluates api::Lane::GetOrientation() for each [s, r, h] row of `lane_positions`.
+RotationArrays GetOrientations(const api::Lane& lane, const DoubleArray& lane_positions) {
+  ThrowUnlessNx3(lane_positions, "lane_positions");
+  const py::ssize_t n = lane_positions.shape(0);
+  RotationArrays results;
+  results.quaternions = MakeArray(n, 4);
+  results.rpys = MakeArray(n, 3);
+
+  const auto srh = lane_positions.unchecked<2>();
+  auto quaternions = results.quaternions.mutable_unchecked<2>();
+  auto rpys = results.rpys.mutable_unchecked<2>();
+  {
+    py::gil_scoped_release release;
+    for (py::ssize_t i = 0; i < n; ++i) {
+      const api::Rotation rotation = lane.GetOrientation(api::LanePosition(srh(i, 0), srh(i, 1), srh(i, 2)));
+      const math::Quaternion& quaternion = rotation.quat();
+      quaternions(i, 0) = quaternion.w();
+      quaternions(i, 1) = quaternion.x();
+      quaternions(i, 2) = quaternion.y();
+      quaternions(i, 3) = quaternion.z();
+      rpys(i, 0) = rotation.roll();
+      rpys(i, 1) = rotation.pitch();
+      rpys(i, 2) = rotation.yaw();
+    }
+  }
+  return results;
+}
+
+// Copies `xyz` into the `i`-th row of an (N, 3) array.
+template <typename ArrayProxy>
+void SetRow(ArrayProxy& array, py::ssize_t i, const math::Vector3& xyz) {
+  for (py::ssize_t j = 0; j < 3; ++j) {
+    array(i, j) = xyz[j];
+  }
+}
+
+// Returns the number of samples needed to cover `length` with a step no longer than `s_resolution`.
+py::ssize_t NumSamples(double length, double s_resolution) {
+  return std::max<py::ssize_t>(2, static_cast<py::ssize_t>(std::ceil(length / s_resolution)) + 1);
+}
+
+// Samples the centerline, lane boundaries and curvature of every lane in `road_geometry` at evenly spaced s
+// coordinates, no farther apart than `s_resolution`, including both lane ends. Lanes are distributed among
+// `num_threads` threads.
+LaneSamples SampleLanes(const api::RoadGeometry& road_geometry, double s_resolution, int num_threads) {
+  if (s_resolution <= 0.) {
+    throw std::invalid_argument("s_resolution must be positive.");
+  }
+  const std::shared_ptr<RoadGeometryIdTable> id_table = GetIdTable(road_geometry);
+  const std::vector<const api::Lane*>& lanes = id_table->lanes().entities();
+  const int num_lanes = static_cast<int>(lanes.size());
+
+  LaneSamples samples;
+  samples.lane_ids = LaneIdSequence(id_table, &id_table->lanes());
+  samples.lane_types = py::array_t<int>(num_lanes);
+  samples.lane_offsets = py::array_t<std::int64_t>(num_lanes + 1);
+  auto lane_types = samples.lane_types.mutable_unchecked<1>();
+  auto lane_offsets = samples.lane_offsets.mutable_unchecked<1>();
+  lane_offsets(0) = 0;
+  for (int i = 0; i < num_lanes; ++i) {
+    lane_types(i) = static_cast<int>(lanes[i]->type());
+    lane_offsets(i + 1) = lane_offsets(i) + NumSamples(lanes[i]->length(), s_resolution);
+  }
+  const py::ssize_t num_samples = lane_offsets(num_lanes);
+  samples.s = py::array_t<double>(num_samples);
+  samples.centerlines = MakeArray(num_samples, 3);
+  samples.left_boundaries = MakeArray(num_samples, 3);
+  samples.right_boundaries = MakeArray(num_samples, 3);
+  samples.curvatures = py::array_t<double>(num_samples);
+
+  auto s = samples.s.mutable_unchecked<1>();
+  auto centerlines = samples.centerlines.mutable_unchecked<2>();
+  auto left_boundaries = samples.left_boundaries.mutable_unchecked<2>();
+  auto right_boundaries = samples.right_boundaries.mutable_unchecked<2>();
+  auto curvatures = samples.curvatures.mutable_unchecked<1>();
+  {
+    py::gil_scoped_release release;
+    ParallelFor(num_lanes, num_threads, [&](int i) {
+      const api::Lane* lane = lanes[i];
+      const py::ssize_t first_sample = lane_offsets(i);
+      const py::ssize_t lane_num_samples = lane_offsets(i + 1) - first_sample;
+      for (py::ssize_t k = 0; k < lane_num_samples; ++k) {
+        const py::ssize_t sample = first_sample + k;
+        const double lane_s = lane->length() * static_cast<double>(k) / static_cast<double>(lane_num_samples - 1);
+        const api::LanePosition centerline_position(lane_s, 0., 0.);
+        const api::RBounds lane_bounds = lane->lane_bounds(lane_s);
+        s(sample) = lane_s;
+        SetRow(centerlines, sample, lane->ToInertialPosition(centerline_position).xyz());
+        SetRow(left_boundaries, sample,
+               lane->ToInertialPosition(api::LanePosition(lane_s, lane_bounds.max(), 0.)).xyz());
+        SetRow(right_boundaries, sample,
+               lane->ToInertialPosition(api::LanePosition(lane_s, lane_bounds.min(), 0.)).xyz());
+        curvatures(sample) = lane->GetCurvature(centerline_position);
+      }
+    });
+  }
+  return samples;
+}
+
+// Returns a read-only (`rows`, `cols`) NumPy view of `values` kept alive by `owner`.
+py::array_t<int> ToReadOnlyArray(const std::vector<int>& values, py::ssize_t rows, py::ssize_t cols, py::handle owner) {
+  py::array_t<int> array =
+      cols == 1 ? py::array_t<int>(rows, values.data(), owner) : py::array_t<int>({rows, cols}, values.data(), owner);
+  py::detail::array_proxy(array.ptr())->flags &= ~py::detail::npy_api::NPY_ARRAY_WRITEABLE_;
+  return array;
+}
+
+// Binds IdSequence<Table> as `name`.
+template <typename Table>
+void BindIdSequence(py::module_& m, const char* name) {
+  using Sequence = IdSequence<Table>;
+  using Id = typename Sequence::Id;
+  py::class_<Sequence>(m, name)
+      .def(py::init<>())
+      .def("__len__", [](const Sequence& self) { return self.ids().size(); })
+      .def(
+          "__getitem__",
+          [](const Sequence& self, py::ssize_t index) {
+            const py::ssize_t size = static_cast<py::ssize_t>(self.ids().size());
+            if (index < 0) {
+              index += size;
+            }
+            if (index < 0 || index >= size) {
+              throw py::index_error("index out of range.");
+            }
+            return self.ids()[index];
+          },
+          py::arg("index"))
+      .def(
+          "__getitem__",
+          [](const Sequence& self,
+             const py::array_t<std::int64_t, py::array::c_style | py::array::forcecast>& indices) {
+            const std::int64_t size = static_cast<std::int64_t>(self.ids().size());
+            std::vector<Id> ids;
+            ids.reserve(indices.size());
+            for (py::ssize_t i = 0; i < indices.size(); ++i) {
+              const std::int64_t index = indices.data()[i];
+              if (index < 0 || index >= size) {
+                throw py::index_error("index out of range.");
+              }
+              ids.push_back(self.ids()[index]);
+            }
+            return ids;
+          },
+          "Returns the ids of an array of handles as a list.", py::arg("indices"))
+      .def(
+          "__iter__", [](const Sequence& self) { return py::make_iterator(self.ids().begin(), self.ids().end()); },
+          // Keep alive, reference: the iterator keeps `self` alive.
+          py::keep_alive<0, 1>())
+      .def("__contains__", [](const Sequence& self, const Id& id) { return self.IndexOf(id) >= 0; })
+      .def(
+          "index",
+          [](const Sequence& self, const Id& id) {
+            const int index = self.IndexOf(id);
+            if (index < 0) {
+              throw py::value_error("Unknown id: " + id.string());
+            }
+            return index;
+          },
+          "Returns the handle of `id`.", py::arg("id"));
+}
+
+// Defines the accessors of the `kind` entities of a RoadGeometryIdTable, e.g. num_lanes(), lanes(), lane(), lane_ids()
+// and LaneIndex() for lanes. The tuples of all the entities of registered road geometries are cached in their
+// RoadNetwork along with their wrappers.
+template <typename Table>
+void DefIdTableAccessors(py::class_<RoadGeometryIdTable, std::shared_ptr<RoadGeometryIdTable>>* cls,
+                         const std::string& kind, const std::string& kind_plural, const std::string& type_name,
+                         const Table& (RoadGeometryIdTable::*table)() const) {
+  using Entity = typename Table::entity_type;
+  using Id = typename Table::id_type;
+  const auto index_of = [kind](const auto& entity_table, const auto& entity_or_id) {
+    const int index = entity_table.IndexOf(entity_or_id);
+    if (index < 0) {
+      throw py::value_error("Unknown " + kind + ".");
+    }
+    return index;
+  };
+  cls->def(("num_" + kind_plural).c_str(), [table](const RoadGeometryIdTable& self) { return (self.*table)().size(); })
+      .def(
+          kind_plural.c_str(),
+          [table, kind_plural](py::object self) {
+            const RoadGeometryIdTable& id_table = self.cast<const RoadGeometryIdTable&>();
+            const std::vector<const Entity*>& entities = (id_table.*table)().entities();
+            const py::object road_network = RoadNetworkOf(id_table.road_geometry());
+            const py::str key(kind_plural);
+            if (!road_network.is_none() && WrapperCache(road_network).contains(key)) {
+              return py::tuple(WrapperCache(road_network)[key]);
+            }
+            py::tuple result(entities.size());
+            for (size_t i = 0; i < entities.size(); ++i) {
+              result[i] = Wrap(entities[i], self);
+            }
+            if (!road_network.is_none()) {
+              WrapperCache(road_network)[key] = result;
+            }
+            return result;
+          },
+          ("Returns a tuple of all the " + kind_plural + " by handle.").c_str())
+      .def(
+          kind.c_str(),
+          [table](py::object self, int index) {
+            return Wrap((self.cast<const RoadGeometryIdTable&>().*table)().get(index), self);
+          },
+          py::arg("index"))
+      .def((kind + "_ids").c_str(),
+           [table](const std::shared_ptr<RoadGeometryIdTable>& self) {
+             return IdSequence<Table>(self, &((*self).*table)());
+           })
+      .def((type_name + "Index").c_str(),
+           [table, index_of](const RoadGeometryIdTable& self, const Entity* entity) {
+             return index_of((self.*table)(), entity);
+           },
+           py::arg(kind.c_str()))
+      .def((type_name + "Index").c_str(),
+           [table, index_of](const RoadGeometryIdTable& self, const Id& id) { return index_of((self.*table)(), id); },
+           py::arg("id"));
+}
+
+}  // namespace
+
 PYBIND11_MODULE(api, m) {
   // TODO(jadecastro) These bindings are work-in-progress. Expose additional
   // Maliput API features, as necessary (see #7918).
@@ -97,7 +873,8 @@ PYBIND11_MODULE(api, m) {
            // Keep alive, reference: `self` keeps `Lane*` alive.
            py::keep_alive<1, 2>())
       .def_readwrite("pos", &api::RoadPosition::pos)
-      .def_readonly("lane", &api::RoadPosition::lane)
+      .def_property_readonly("lane",
+                             [](py::object self) { return Wrap(self.cast<const api::RoadPosition&>().lane, self); })
       .def("ToInertialPosition", &api::RoadPosition::ToInertialPosition);
 
   py::class_<api::RoadPositionResult>(m, "RoadPositionResult")
@@ -106,6 +883,57 @@ PYBIND11_MODULE(api, m) {
       .def_readwrite("nearest_position", &api::RoadPositionResult::nearest_position)
       .def_readwrite("distance", &api::RoadPositionResult::distance);
 
+  BindIdSequence<RoadGeometryIdTable::JunctionTable>(m, "JunctionIdSequence");
+  BindIdSequence<RoadGeometryIdTable::SegmentTable>(m, "SegmentIdSequence");
+  BindIdSequence<RoadGeometryIdTable::LaneTable>(m, "LaneIdSequence");
+  BindIdSequence<RoadGeometryIdTable::BranchPointTable>(m, "BranchPointIdSequence");
+
+  py::class_<RoadPositionResultArrays>(m, "RoadPositionResultArrays")
+      .def(py::init<>())
+      .def_readonly("lane_ids", &RoadPositionResultArrays::lane_ids)
+      .def_readonly("lane_indices", &RoadPositionResultArrays::lane_indices)
+      .def_readonly("lane_positions", &RoadPositionResultArrays::lane_positions)
+      .def_readonly("nearest_positions", &RoadPositionResultArrays::nearest_positions)
+      .def_readonly("distances", &RoadPositionResultArrays::distances);
+
+  py::class_<RoadPositionQueryResultArrays, RoadPositionResultArrays>(m, "RoadPositionQueryResultArrays")
+      .def(py::init<>())
+      .def_readonly("query_offsets", &RoadPositionQueryResultArrays::query_offsets);
+
+  py::class_<LanePositionResultArrays>(m, "LanePositionResultArrays")
+      .def(py::init<>())
+      .def_readonly("lane_positions", &LanePositionResultArrays::lane_positions)
+      .def_readonly("nearest_positions", &LanePositionResultArrays::nearest_positions)
+      .def_readonly("distances", &LanePositionResultArrays::distances);
+
+  py::class_<RotationArrays>(m, "RotationArrays")
+      .def(py::init<>())
+      .def_readonly("quaternions", &RotationArrays::quaternions)
+      .def_readonly("rpys", &RotationArrays::rpys);
+
+  py::class_<LaneSamples>(m, "LaneSamples")
+      .def(py::init<>())
+      .def_readonly("lane_ids", &LaneSamples::lane_ids)
+      .def_readonly("lane_types", &LaneSamples::lane_types)
+      .def_readonly("lane_offsets", &LaneSamples::lane_offsets)
+      .def_readonly("s", &LaneSamples::s)
+      .def_readonly("centerlines", &LaneSamples::centerlines)
+      .def_readonly("left_boundaries", &LaneSamples::left_boundaries)
+      .def_readonly("right_boundaries", &LaneSamples::right_boundaries)
+      .def_readonly("curvatures", &LaneSamples::curvatures);
+
+  py::class_<WaypointArrays>(m, "WaypointArrays")
+      .def(py::init<>())
+      .def_readonly("lane_ids", &WaypointArrays::lane_ids)
+      .def_readonly("lane_indices", &WaypointArrays::lane_indices)
+      .def_readonly("s", &WaypointArrays::s)
+      .def_readonly("xyz", &WaypointArrays::xyz);
+
+  py::class_<WaypointChunkIterator>(m, "WaypointChunkIterator")
+      .def("num_waypoints", &WaypointChunkIterator::num_waypoints)
+      .def("__iter__", [](py::object self) { return self; })
+      .def("__next__", &WaypointChunkIterator::Next);
+
   py::class_<api::Rotation>(m, "Rotation")
       .def(py::init<>())
       .def("quat", &api::Rotation::quat, py::return_value_policy::reference_internal)
@@ -163,10 +991,17 @@ PYBIND11_MODULE(api, m) {
 
 #pragma GCC diagnostic push
 #pragma GCC diagnostic ignored "-Wdeprecated-declarations"
-  py::class_<api::RoadNetwork>(m, "RoadNetwork")
+  py::class_<api::RoadNetwork>(m, "RoadNetwork", py::dynamic_attr())
       // TODO(https://github.com/maliput/maliput_infrastructure/issues/225): Add constructor binding once it is
       // supported by pybind11.
-      .def("road_geometry", &api::RoadNetwork::road_geometry, py::return_value_policy::reference_internal)
+      .def(
+          "road_geometry",
+          [](py::object self) {
+            const api::RoadGeometry* road_geometry = self.cast<const api::RoadNetwork&>().road_geometry();
+            RegisterRoadGeometry(self, road_geometry);
+            return road_geometry;
+          },
+          py::return_value_policy::reference_internal)
       .def("rulebook", &api::RoadNetwork::rulebook, py::return_value_policy::reference_internal)
       .def("traffic_light_book", &api::RoadNetwork::traffic_light_book, py::return_value_policy::reference_internal)
       .def("intersection_book", &api::RoadNetwork::intersection_book, py::return_value_policy::reference_internal)
@@ -189,36 +1024,167 @@ PYBIND11_MODULE(api, m) {
       .def("id", &api::RoadGeometry::id)
       .def("num_junctions", &api::RoadGeometry::num_junctions)
       .def("num_branch_points", &api::RoadGeometry::num_branch_points)
-      .def("junction", &api::RoadGeometry::junction, py::arg("index"), py::return_value_policy::reference_internal)
-      .def("branch_point", &api::RoadGeometry::branch_point, py::arg("index"),
-           py::return_value_policy::reference_internal)
+      .def("junction", Wrapped(&api::RoadGeometry::junction), py::arg("index"))
+      .def("branch_point", Wrapped(&api::RoadGeometry::branch_point), py::arg("index"))
       .def("ById", &api::RoadGeometry::ById, py::return_value_policy::reference_internal)
       // clang-format off
       .def("ToRoadPosition",
            [](const api::RoadGeometry& self, const api::InertialPosition& inertial_position) {
              return self.ToRoadPosition(inertial_position);
-           }, py::arg("inertial_position"))
+           }, py::arg("inertial_position"), py::call_guard<py::gil_scoped_release>())
       .def("ToRoadPositionByHint",
            [](const api::RoadGeometry& self, const api::InertialPosition& inertial_position,
               const api::RoadPosition& road_position) { return self.ToRoadPosition(inertial_position, road_position); },
-           py::arg("inertial_position"), py::arg("hint"))
+           py::arg("inertial_position"), py::arg("hint"), py::call_guard<py::gil_scoped_release>())
       // clang-format on
-      .def("FindRoadPositions", &api::RoadGeometry::FindRoadPositions, py::arg("inertial_position"), py::arg("radius"))
+      .def("ToRoadPositions", &ToRoadPositions,
+           "Evaluates ToRoadPosition() for each [x, y, z] row of an (N, 3) array and returns the results as arrays.",
+           py::arg("inertial_positions"))
+      .def("FindRoadPositions", &api::RoadGeometry::FindRoadPositions, py::arg("inertial_position"), py::arg("radius"),
+           py::call_guard<py::gil_scoped_release>())
       .def("linear_tolerance", &api::RoadGeometry::linear_tolerance)
       .def("angular_tolerance", &api::RoadGeometry::angular_tolerance)
       .def("scale_length", &api::RoadGeometry::scale_length)
       .def("CheckInvariants", &api::RoadGeometry::CheckInvariants)
       .def("SampleAheadWaypoints", &api::RoadGeometry::SampleAheadWaypoints, py::arg("lane_s_route"),
-           py::arg("path_length_sampling_rate"))
-      .def("inertial_to_backend_frame_translation", &api::RoadGeometry::inertial_to_backend_frame_translation);
+           py::arg("path_length_sampling_rate"), py::call_guard<py::gil_scoped_release>())
+      .def("SampleAheadWaypointArrays", &SampleAheadWaypointArrays,
+           "Samples the centerline of each range of `lane_s_route` from s0 to s1 every `path_length_sampling_rate`, "
+           "always including s1, into the preallocated arrays of a WaypointArrays.",
+           py::arg("lane_s_route"), py::arg("path_length_sampling_rate"))
+      .def(
+          "SampleAheadWaypointChunks",
+          [](const api::RoadGeometry& self, const api::LaneSRoute& lane_s_route, double path_length_sampling_rate,
+             py::ssize_t chunk_size) {
+            return WaypointChunkIterator(WaypointSampler(self, lane_s_route, path_length_sampling_rate), chunk_size);
+          },
+          "Returns an iterator over the waypoints SampleAheadWaypointArrays() returns, in WaypointArrays of up to "
+          "`chunk_size` waypoints which are sampled as they are requested.",
+          py::arg("lane_s_route"), py::arg("path_length_sampling_rate"), py::arg("chunk_size") = 4096,
+          // Keep alive, reference: the iterator keeps `self` alive.
+          py::keep_alive<0, 1>())
+      .def("inertial_to_backend_frame_translation", &api::RoadGeometry::inertial_to_backend_frame_translation)
+      .def("SampleLanes", &SampleLanes,
+           "Samples the centerline, lane boundaries and curvature of every lane at evenly spaced s coordinates no "
+           "farther apart than `s_resolution`. Lanes are sampled in parallel by up to `num_threads` threads, all the "
+           "available cores when non-positive. Values other than 1 require the backend's lane queries to be safe to "
+           "call concurrently, which maliput does not guarantee.",
+           py::arg("s_resolution"), py::arg("num_threads") = 1)
+      .def(
+          "id_table",
+          [](py::object self) {
+            const std::shared_ptr<RoadGeometryIdTable> id_table = GetIdTable(self.cast<const api::RoadGeometry&>());
+            const bool wrapped = static_cast<bool>(py::detail::find_registered_python_instance(
+                id_table.get(), py::detail::get_type_info(typeid(RoadGeometryIdTable))));
+            py::object result = py::cast(id_table);
+            // Keep alive, reference: the table keeps `self` alive. Only done when the table is first wrapped, as the
+            // same wrapper is returned while it is alive.
+            if (!wrapped) {
+              py::detail::keep_alive_impl(result, self);
+            }
+            return result;
+          },
+          "Returns the RoadGeometryIdTable interning the junctions, segments, lanes and branch points of this road "
+          "geometry as integer handles. It is built once per road geometry.");
+
+  auto road_geometry_id_table =
+      py::class_<RoadGeometryIdTable, std::shared_ptr<RoadGeometryIdTable>>(m, "RoadGeometryIdTable")
+          .def("road_geometry", &RoadGeometryIdTable::road_geometry, py::return_value_policy::reference_internal);
+  DefIdTableAccessors(&road_geometry_id_table, "junction", "junctions", "Junction", &RoadGeometryIdTable::junctions);
+  DefIdTableAccessors(&road_geometry_id_table, "segment", "segments", "Segment", &RoadGeometryIdTable::segments);
+  DefIdTableAccessors(&road_geometry_id_table, "lane", "lanes", "Lane", &RoadGeometryIdTable::lanes);
+  DefIdTableAccessors(&road_geometry_id_table, "branch_point", "branch_points", "BranchPoint",
+                      &RoadGeometryIdTable::branch_points);
+  road_geometry_id_table
+      .def(
+          "junction_segment_offsets",
+          [](const RoadGeometryIdTable& self) {
+            return ToReadOnlyArray(self.junction_segment_offsets(), self.junctions().size() + 1, 1,
+                                   py::cast(&self, py::return_value_policy::reference));
+          },
+          "Returns the (J + 1,) offsets of the segments of each junction as a read-only array: the segments of the "
+          "j-th junction are those in [offsets[j], offsets[j + 1]).")
+      .def(
+          "segment_junction_indices",
+          [](const RoadGeometryIdTable& self) {
+            return ToReadOnlyArray(self.segment_junction_indices(), self.segments().size(), 1,
+                                   py::cast(&self, py::return_value_policy::reference));
+          },
+          "Returns the (S,) handles of the junction of each segment as a read-only array.")
+      .def(
+          "segment_lane_offsets",
+          [](const RoadGeometryIdTable& self) {
+            return ToReadOnlyArray(self.segment_lane_offsets(), self.segments().size() + 1, 1,
+                                   py::cast(&self, py::return_value_policy::reference));
+          },
+          "Returns the (S + 1,) offsets of the lanes of each segment as a read-only array: the lanes of the i-th "
+          "segment are those in [offsets[i], offsets[i + 1]).")
+      .def(
+          "lane_segment_indices",
+          [](const RoadGeometryIdTable& self) {
+            return ToReadOnlyArray(self.lane_segment_indices(), self.lanes().size(), 1,
+                                   py::cast(&self, py::return_value_policy::reference));
+          },
+          "Returns the (L,) handles of the segment of each lane as a read-only array.")
+      .def(
+          "lane_branch_point_indices",
+          [](const RoadGeometryIdTable& self) {
+            return ToReadOnlyArray(self.lane_branch_point_indices(), self.lanes().size(), 2,
+                                   py::cast(&self, py::return_value_policy::reference));
+          },
+          "Returns the (L, 2) handles of the branch points at the [kStart, kFinish] ends of each lane as a read-only "
+          "array, -1 where a lane end has no branch point.");
+
+  py::class_<RoadGeometrySpatialIndex>(m, "RoadGeometrySpatialIndex")
+      .def(py::init<const api::RoadGeometry*, double, double>(),
+           "Indexes the bounding boxes of the chunks of every lane, no longer than `sampling_step`, in a grid of "
+           "`cell_size` cells to speed up FindRoadPositions() queries.",
+           py::arg("road_geometry"), py::arg("sampling_step") = 1., py::arg("cell_size") = 10.,
+           // Keep alive, reference: `self` keeps `road_geometry` alive.
+           py::keep_alive<1, 2>(), py::call_guard<py::gil_scoped_release>())
+      .def("road_geometry", &RoadGeometrySpatialIndex::road_geometry, py::return_value_policy::reference_internal)
+      .def("num_boxes", &RoadGeometrySpatialIndex::num_boxes)
+      .def("FindRoadPositions", &RoadGeometrySpatialIndex::FindRoadPositions, py::arg("inertial_position"),
+           py::arg("radius"), py::call_guard<py::gil_scoped_release>())
+      .def("FindRoadPositions", &FindRoadPositions,
+           "Evaluates FindRoadPositions() for each [x, y, z] row of an (N, 3) array, with either a common radius or "
+           "an (N,) array of radii, and returns the results as arrays. Points are distributed among up to "
+           "`num_threads` threads, all the available cores when non-positive. Refining candidates calls the backend's "
+           "ToSegmentPosition(), so values other than 1 require it to be safe to call concurrently.",
+           py::arg("inertial_positions"), py::arg("radii"), py::arg("num_threads") = 1);
+
+  py::class_<RoadPositionTracker>(m, "RoadPositionTracker")
+      .def(py::init<const api::RoadGeometry*, int>(),
+           "Tracks the RoadPosition of `num_agents` agents, using the lane each one was last localized on and its "
+           "neighbours as a hint for the next update.",
+           py::arg("road_geometry"), py::arg("num_agents"),
+           // Keep alive, reference: `self` keeps `road_geometry` alive.
+           py::keep_alive<1, 2>())
+      .def("road_geometry", &RoadPositionTracker::road_geometry, py::return_value_policy::reference_internal)
+      .def("num_agents", &RoadPositionTracker::num_agents)
+      .def("num_full_searches", &RoadPositionTracker::num_full_searches)
+      .def("Update", &UpdateRoadPositions,
+           "Localizes every agent at the matching [x, y, z] row of an (N, 3) array, where N is num_agents(), and "
+           "returns the results as arrays. A full ToRoadPosition() search is only run for the agents not found on "
+           "their hint lane or next to it. Agents are distributed among up to `num_threads` threads, all the "
+           "available cores when non-positive. Values other than 1 require the backend's ToLanePosition() and "
+           "ToRoadPosition() to be safe to call concurrently, which maliput does not guarantee.",
+           py::arg("inertial_positions"), py::arg("num_threads") = 1)
+      .def("Reset", &RoadPositionTracker::Reset, "Forgets the hints of all agents.");
 
   py::class_<api::RoadGeometry::IdIndex>(m, "RoadGeometry.IdIndex")
-      .def("GetLane", &api::RoadGeometry::IdIndex::GetLane, py::arg("id"), py::return_value_policy::reference_internal)
-      .def("GetLanes", &api::RoadGeometry::IdIndex::GetLanes, py::return_value_policy::reference_internal)
-      .def("GetSegment", &api::RoadGeometry::IdIndex::GetSegment, py::arg("id"),
-           py::return_value_policy::reference_internal)
-      .def("GetJunction", &api::RoadGeometry::IdIndex::GetJunction, py::arg("id"),
-           py::return_value_policy::reference_internal);
+      .def("GetLane", Wrapped(&api::RoadGeometry::IdIndex::GetLane), py::arg("id"))
+      .def("GetLanes",
+           [](py::object self) {
+             py::dict lanes;
+             for (const auto& id_lane : self.cast<const api::RoadGeometry::IdIndex&>().GetLanes()) {
+               lanes[py::cast(id_lane.first)] = Wrap(id_lane.second, self);
+             }
+             return lanes;
+           })
+      .def("GetSegment", Wrapped(&api::RoadGeometry::IdIndex::GetSegment), py::arg("id"))
+      .def("GetJunction", Wrapped(&api::RoadGeometry::IdIndex::GetJunction), py::arg("id"))
+      .def("GetBranchPoint", Wrapped(&api::RoadGeometry::IdIndex::GetBranchPoint), py::arg("id"));
 
   py::class_<api::JunctionId>(m, "JunctionId")
       .def(py::init<std::string>())
@@ -227,11 +1193,15 @@ PYBIND11_MODULE(api, m) {
       .def("__eq__", &api::JunctionId::operator==)
       .def("__repr__", [](const api::JunctionId& id) { return id.string(); });
 
-  py::class_<api::Junction>(m, "Junction")
+  py::class_<api::Junction>(m, "Junction", py::dynamic_attr())
       .def("num_segments", &api::Junction::num_segments)
-      .def("segment", &api::Junction::segment, py::return_value_policy::reference_internal)
+      .def("segment", Wrapped(&api::Junction::segment))
       .def("id", &api::Junction::id, py::return_value_policy::reference_internal)
-      .def("road_geometry", &api::Junction::road_geometry, py::return_value_policy::reference_internal);
+      .def("road_geometry", &api::Junction::road_geometry, py::return_value_policy::reference_internal)
+      .def(
+          "index_in_geometry",
+          [](const api::Junction& self) { return GetIdTable(*self.road_geometry())->junctions().IndexOf(&self); },
+          "Returns the handle of this junction in RoadGeometry.id_table().");
 
   py::class_<api::SegmentId>(m, "SegmentId")
       .def(py::init<std::string>())
@@ -240,11 +1210,17 @@ PYBIND11_MODULE(api, m) {
       .def("__eq__", &api::SegmentId::operator==)
       .def("__repr__", [](const api::SegmentId& id) { return id.string(); });
 
-  py::class_<api::Segment>(m, "Segment")
+  py::class_<api::Segment>(m, "Segment", py::dynamic_attr())
       .def("num_lanes", &api::Segment::num_lanes)
-      .def("lane", &api::Segment::lane, py::return_value_policy::reference_internal)
-      .def("junction", &api::Segment::num_lanes, py::return_value_policy::reference_internal)
-      .def("id", &api::Segment::id, py::return_value_policy::reference_internal);
+      .def("lane", Wrapped(&api::Segment::lane))
+      .def("junction", Wrapped(&api::Segment::junction))
+      .def("id", &api::Segment::id, py::return_value_policy::reference_internal)
+      .def(
+          "index_in_geometry",
+          [](const api::Segment& self) {
+            return GetIdTable(*self.junction()->road_geometry())->segments().IndexOf(&self);
+          },
+          "Returns the handle of this segment in RoadGeometry.id_table().");
 
   py::class_<api::LaneId>(m, "LaneId")
       .def(py::init<std::string>())
@@ -253,24 +1229,40 @@ PYBIND11_MODULE(api, m) {
       .def("__eq__", &api::LaneId::operator==)
       .def("__repr__", [](const api::LaneId& id) { return id.string(); });
 
-  py::class_<api::Lane>(m, "Lane")
+  py::class_<api::Lane>(m, "Lane", py::dynamic_attr())
       .def("id", &api::Lane::id)
-      .def("segment", &api::Lane::segment, py::return_value_policy::reference_internal)
+      .def("segment", Wrapped(&api::Lane::segment))
       .def("index", &api::Lane::index)
-      .def("to_left", &api::Lane::to_left, py::return_value_policy::reference_internal)
-      .def("to_right", &api::Lane::to_right, py::return_value_policy::reference_internal)
+      .def(
+          "index_in_geometry",
+          [](const api::Lane& self) {
+            return GetIdTable(*self.segment()->junction()->road_geometry())->lanes().IndexOf(&self);
+          },
+          "Returns the handle of this lane in RoadGeometry.id_table().")
+      .def("to_left", Wrapped(&api::Lane::to_left))
+      .def("to_right", Wrapped(&api::Lane::to_right))
       .def("length", &api::Lane::length)
       .def("type", &api::Lane::type)
       .def("lane_bounds", &api::Lane::lane_bounds, py::arg("s"))
       .def("segment_bounds", &api::Lane::segment_bounds, py::arg("s"))
       .def("elevation_bounds", &api::Lane::elevation_bounds, py::arg("s"), py::arg("r"))
-      .def("ToInertialPosition", &api::Lane::ToInertialPosition)
+      .def("ToInertialPosition", &api::Lane::ToInertialPosition, py::call_guard<py::gil_scoped_release>())
       .def("GetCurvature", &api::Lane::GetCurvature)
-      .def("ToLanePosition", &api::Lane::ToLanePosition)
-      .def("ToSegmentPosition", &api::Lane::ToSegmentPosition)
+      .def("ToLanePosition", &api::Lane::ToLanePosition, py::call_guard<py::gil_scoped_release>())
+      .def("ToInertialPositions", &ToInertialPositions,
+           "Evaluates ToInertialPosition() for each [s, r, h] row of an (N, 3) array and returns an (N, 3) array.",
+           py::arg("lane_positions"))
+      .def("ToLanePositions", &ToLanePositions,
+           "Evaluates ToLanePosition() for each [x, y, z] row of an (N, 3) array and returns the results as arrays.",
+           py::arg("inertial_positions"))
+      .def("ToSegmentPosition", &api::Lane::ToSegmentPosition, py::call_guard<py::gil_scoped_release>())
       .def("GetOrientation", &api::Lane::GetOrientation)
+      .def("GetOrientations", &GetOrientations,
+           "Evaluates GetOrientation() for each [s, r, h] row of an (N, 3) array and returns the (N, 4) [w, x, y, z] "
+           "quaternions and (N, 3) [roll, pitch, yaw] angles as arrays.",
+           py::arg("lane_positions"))
       .def("EvalMotionDerivatives", &api::Lane::EvalMotionDerivatives, py::arg("lane_postion"), py::arg("velocity"))
-      .def("GetBranchPoint", &api::Lane::GetBranchPoint, py::arg("which_end"))
+      .def("GetBranchPoint", Wrapped(&api::Lane::GetBranchPoint), py::arg("which_end"))
       .def("GetConfluentBranches", &api::Lane::GetConfluentBranches, py::arg("which_end"),
            py::return_value_policy::reference_internal)
       .def("GetOngoingBranches", &api::Lane::GetOngoingBranches, py::arg("which_end"),
@@ -305,6 +1297,31 @@ PYBIND11_MODULE(api, m) {
       .def("length", &api::LaneSRoute::length)
       .def("Intersects", &api::LaneSRoute::Intersects, py::arg("lane_s_route"), py::arg("tolerance"));
 
+  py::class_<RouteMatrix>(m, "RouteMatrix")
+      .def(py::init<>())
+      .def_readonly("routes", &RouteMatrix::routes)
+      .def_readonly("lengths", &RouteMatrix::lengths);
+
+  py::class_<RoadGeometryRouter>(m, "RoadGeometryRouter")
+      .def(py::init<const api::RoadGeometry*>(),
+           "Builds the lane end adjacency of `road_geometry` to find routes over its BranchPoint graph.",
+           py::arg("road_geometry"),
+           // Keep alive, reference: `self` keeps `road_geometry` alive.
+           py::keep_alive<1, 2>(), py::call_guard<py::gil_scoped_release>())
+      .def("road_geometry", &RoadGeometryRouter::road_geometry, py::return_value_policy::reference_internal)
+      .def("num_nodes", &RoadGeometryRouter::num_nodes)
+      .def("num_edges", &RoadGeometryRouter::num_edges)
+      .def("FindRoute", &RoadGeometryRouter::FindRoute,
+           "Finds the shortest LaneSRoute from `start` to `end`, or None when `end` is not reachable. The search is "
+           "an A* search guided by the straight line distance to `end` unless `use_heuristic` is False.",
+           py::arg("start"), py::arg("end"), py::arg("use_heuristic") = true, py::call_guard<py::gil_scoped_release>())
+      .def("FindRoutes", &FindRoutes,
+           "Finds the shortest routes from each of `starts` to each of `ends` with one search per start position. "
+           "Start positions are distributed among up to `num_threads` threads, all the available cores when "
+           "non-positive. Searches call the backend's Lane::length(), so values other than 1 require it to be safe to "
+           "call concurrently.",
+           py::arg("starts"), py::arg("ends"), py::arg("num_threads") = 1);
+
   py::enum_<api::LaneEnd::Which>(m, "Which")
       .value("kStart", api::LaneEnd::Which::kStart)
       .value("kFinish", api::LaneEnd::Which::kFinish)
@@ -315,7 +1332,9 @@ PYBIND11_MODULE(api, m) {
       .def(py::init<const api::Lane*, api::LaneEnd::Which>(), py::arg("lane"), py::arg("end"),
            // Keep alive, reference: `self` keeps `Lane*` alive.
            py::keep_alive<1, 2>())
-      .def_readwrite("lane", &api::LaneEnd::lane)
+      .def_property(
+          "lane", [](py::object self) { return Wrap(self.cast<const api::LaneEnd&>().lane, self); },
+          [](api::LaneEnd& self, const api::Lane* lane) { self.lane = lane; })
       .def_readwrite("end", &api::LaneEnd::end);
 
   py::class_<api::LaneEndSet>(m, "LaneEndSet")
@@ -329,9 +1348,15 @@ PYBIND11_MODULE(api, m) {
       .def("__eq__", &api::BranchPointId::operator==)
       .def("__repr__", [](const api::BranchPointId& id) { return id.string(); });
 
-  py::class_<api::BranchPoint>(m, "BranchPoint")
+  py::class_<api::BranchPoint>(m, "BranchPoint", py::dynamic_attr())
       .def("id", &api::BranchPoint::id)
       .def("road_geometry", &api::BranchPoint::road_geometry, py::return_value_policy::reference_internal)
+      .def(
+          "index_in_geometry",
+          [](const api::BranchPoint& self) {
+            return GetIdTable(*self.road_geometry())->branch_points().IndexOf(&self);
+          },
+          "Returns the handle of this branch point in RoadGeometry.id_table().")
       .def("GetConfluentBranches", &api::BranchPoint::GetConfluentBranches, py::arg("end"),
            py::return_value_policy::reference_internal)
       .def("GetOngoingBranches", &api::BranchPoint::GetOngoingBranches, py::arg("end"),
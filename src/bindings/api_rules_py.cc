@@ -29,6 +29,15 @@
 // OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 #include "bindings/api_rules_py.h"
 
+#include <algorithm>
+#include <cstdint>
+#include <limits>
+#include <map>
+#include <optional>
+#include <string>
+#include <unordered_map>
+#include <vector>
+
 #include <maliput/api/rules/discrete_value_rule.h>
 #include <maliput/api/rules/discrete_value_rule_state_provider.h>
 // TODO: Should be removed as DirectionUsageRule gets deprecated.
@@ -48,16 +57,332 @@
 #include <maliput/api/rules/traffic_lights.h>
 // TODO: Should be removed as SpeedLimitRule gets deprecated.
 #include <maliput/api/rules/speed_limit_rule.h>
+#include <pybind11/numpy.h>
 #include <pybind11/operators.h>
 #include <pybind11/pybind11.h>
 #include <pybind11/stl.h>
 
+#include "bindings/road_rulebook_index.h"
+
 namespace maliput {
 namespace api {
 namespace bindings {
 
 namespace py = pybind11;
 
+namespace {
+
+// Columnar description of the rules of one kind matched by a batch of RoadRulebook queries. Every matched rule is
+// described once and referred to by its index into `rule_ids`. The results of the i-th query are the rows of
+// `rule_indices` in [query_offsets[i], query_offsets[i + 1]); the zone ranges and the states of the j-th rule are
+// the rows in [zone_offsets[j], zone_offsets[j + 1]) and [state_offsets[j], state_offsets[j + 1]) respectively.
+struct RuleArrays {
+  // Ids of the R matched rules.
+  std::vector<rules::Rule::Id> rule_ids;
+  // Type ids referenced by `type_indices`, in order of first appearance.
+  std::vector<rules::Rule::TypeId> type_ids;
+  // (R,) indices into `type_ids`.
+  py::array_t<int> type_indices;
+  // Ids of the lanes referenced by `zone_lane_indices`, in order of first appearance.
+  std::vector<LaneId> lane_ids;
+  // (R + 1,) offsets of the zone ranges of each rule.
+  py::array_t<std::int64_t> zone_offsets;
+  // (M,) indices into `lane_ids` of each zone range.
+  py::array_t<int> zone_lane_indices;
+  // (M, 2) zone ranges as [s0, s1] rows.
+  py::array_t<double> zone_s_ranges;
+  // (R + 1,) offsets of the states of each rule.
+  py::array_t<std::int64_t> state_offsets;
+  // (K,) severity of each state.
+  py::array_t<int> severities;
+  // (Q + 1,) offsets of the results of each query.
+  py::array_t<std::int64_t> query_offsets;
+  // Indices into `rule_ids` of the rules matched by each query.
+  py::array_t<int> rule_indices;
+};
+
+// RuleArrays of rules::DiscreteValueRules.
+struct DiscreteValueRuleArrays : public RuleArrays {
+  // Values referenced by `value_indices`, in order of first appearance.
+  std::vector<std::string> values;
+  // (K,) indices into `values` of each state.
+  py::array_t<int> value_indices;
+};
+
+// RuleArrays of rules::RangeValueRules.
+struct RangeValueRuleArrays : public RuleArrays {
+  // Descriptions referenced by `description_indices`, in order of first appearance.
+  std::vector<std::string> descriptions;
+  // (K,) indices into `descriptions` of each state.
+  py::array_t<int> description_indices;
+  // (K, 2) ranges as [min, max] rows.
+  py::array_t<double> ranges;
+};
+
+// Columnar counterpart of rules::RoadRulebook::QueryResults holding the results of Q queries.
+struct RuleQueryResultArrays {
+  DiscreteValueRuleArrays discrete_value_rules;
+  RangeValueRuleArrays range_value_rules;
+};
+
+// Maps keys to consecutive indices in order of first appearance.
+template <typename Key>
+class Interner {
+ public:
+  int Intern(const Key& key) {
+    const auto it = indices_.emplace(key, static_cast<int>(keys_.size()));
+    if (it.second) {
+      keys_.push_back(key);
+    }
+    return it.first->second;
+  }
+
+  int size() const { return static_cast<int>(keys_.size()); }
+  const std::vector<Key>& keys() const { return keys_; }
+
+ private:
+  std::unordered_map<Key, int> indices_;
+  std::vector<Key> keys_;
+};
+
+template <typename T>
+py::array_t<T> ToArray(const std::vector<T>& values) {
+  py::array_t<T> array(static_cast<py::ssize_t>(values.size()));
+  std::copy(values.begin(), values.end(), array.mutable_data());
+  return array;
+}
+
+// Packs flat [a, b, a, b, ...] `values` into an (N, 2) array.
+py::array_t<double> ToArrayNx2(const std::vector<double>& values) {
+  py::array_t<double> array({static_cast<py::ssize_t>(values.size() / 2), py::ssize_t{2}});
+  std::copy(values.begin(), values.end(), array.mutable_data());
+  return array;
+}
+
+// Accumulates the RuleArrays columns of rules of type `RuleType` in plain containers, so that queries can be
+// evaluated without holding the GIL.
+template <typename RuleType>
+class RuleColumns {
+ public:
+  void AddQuery(const std::map<rules::Rule::Id, RuleType>& matches) {
+    for (const auto& id_rule : matches) {
+      const int num_rules = rule_ids_.size();
+      const int rule_index = rule_ids_.Intern(id_rule.first);
+      if (rule_index == num_rules) {
+        AddRule(id_rule.second);
+      }
+      rule_indices_.push_back(rule_index);
+    }
+    query_offsets_.push_back(static_cast<std::int64_t>(rule_indices_.size()));
+  }
+
+  void Fill(DiscreteValueRuleArrays* arrays) const {
+    FillRuleArrays(arrays);
+    arrays->values = strings_.keys();
+    arrays->value_indices = ToArray(string_indices_);
+  }
+
+  void Fill(RangeValueRuleArrays* arrays) const {
+    FillRuleArrays(arrays);
+    arrays->descriptions = strings_.keys();
+    arrays->description_indices = ToArray(string_indices_);
+    arrays->ranges = ToArrayNx2(ranges_);
+  }
+
+ private:
+  void AddRule(const RuleType& rule) {
+    type_indices_.push_back(type_ids_.Intern(rule.type_id()));
+    for (const LaneSRange& range : rule.zone().ranges()) {
+      zone_lane_indices_.push_back(lane_ids_.Intern(range.lane_id()));
+      zone_s_ranges_.push_back(range.s_range().s0());
+      zone_s_ranges_.push_back(range.s_range().s1());
+    }
+    zone_offsets_.push_back(static_cast<std::int64_t>(zone_lane_indices_.size()));
+    for (const auto& state : rule.states()) {
+      severities_.push_back(state.severity);
+      AddState(state);
+    }
+    state_offsets_.push_back(static_cast<std::int64_t>(severities_.size()));
+  }
+
+  void AddState(const rules::DiscreteValueRule::DiscreteValue& state) {
+    string_indices_.push_back(strings_.Intern(state.value));
+  }
+
+  void AddState(const rules::RangeValueRule::Range& state) {
+    string_indices_.push_back(strings_.Intern(state.description));
+    ranges_.push_back(state.min);
+    ranges_.push_back(state.max);
+  }
+
+  void FillRuleArrays(RuleArrays* arrays) const {
+    arrays->rule_ids = rule_ids_.keys();
+    arrays->type_ids = type_ids_.keys();
+    arrays->type_indices = ToArray(type_indices_);
+    arrays->lane_ids = lane_ids_.keys();
+    arrays->zone_offsets = ToArray(zone_offsets_);
+    arrays->zone_lane_indices = ToArray(zone_lane_indices_);
+    arrays->zone_s_ranges = ToArrayNx2(zone_s_ranges_);
+    arrays->state_offsets = ToArray(state_offsets_);
+    arrays->severities = ToArray(severities_);
+    arrays->query_offsets = ToArray(query_offsets_);
+    arrays->rule_indices = ToArray(rule_indices_);
+  }
+
+  Interner<rules::Rule::Id> rule_ids_;
+  Interner<rules::Rule::TypeId> type_ids_;
+  Interner<LaneId> lane_ids_;
+  Interner<std::string> strings_;
+  std::vector<int> type_indices_;
+  std::vector<std::int64_t> zone_offsets_{0};
+  std::vector<int> zone_lane_indices_;
+  std::vector<double> zone_s_ranges_;
+  std::vector<std::int64_t> state_offsets_{0};
+  std::vector<int> severities_;
+  std::vector<int> string_indices_;
+  std::vector<double> ranges_;
+  std::vector<std::int64_t> query_offsets_{0};
+  std::vector<int> rule_indices_;
+};
+
+// Columnar counterpart of N DiscreteValueRuleStateProvider::StateResults or RangeValueRuleStateProvider::StateResults.
+template <typename State>
+struct RuleStateArrays {
+  // Distinct states referenced by `state_indices` and `next_state_indices`, in order of first appearance.
+  std::vector<State> states;
+  // (N,) indices into `states` of the current states, -1 where no state was found.
+  py::array_t<int> state_indices;
+  // (N,) indices into `states` of the next states, -1 where unknown.
+  py::array_t<int> next_state_indices;
+  // (N,) durations until the next states, NaN where unknown.
+  py::array_t<double> next_durations;
+};
+
+using DiscreteValueRuleStateArrays = RuleStateArrays<rules::DiscreteValueRule::DiscreteValue>;
+using RangeValueRuleStateArrays = RuleStateArrays<rules::RangeValueRule::Range>;
+
+const std::string& StateKey(const rules::DiscreteValueRule::DiscreteValue& state) { return state.value; }
+
+const std::string& StateKey(const rules::RangeValueRule::Range& state) { return state.description; }
+
+// Maps states to consecutive indices in order of first appearance. States are bucketed by StateKey() and only compared
+// with operator==() within a bucket, as they are not hashable.
+template <typename State>
+class StateInterner {
+ public:
+  int Intern(const State& state) {
+    std::vector<int>& bucket = buckets_[StateKey(state)];
+    for (const int index : bucket) {
+      if (states_[index] == state) {
+        return index;
+      }
+    }
+    bucket.push_back(static_cast<int>(states_.size()));
+    states_.push_back(state);
+    return bucket.back();
+  }
+
+  const std::vector<State>& states() const { return states_; }
+
+ private:
+  std::unordered_map<std::string, std::vector<int>> buckets_;
+  std::vector<State> states_;
+};
+
+// Evaluates `get_state(i)` for i in [0, `n`), which returns a std::optional<StateResult>, and packs the results into a
+// RuleStateArrays.
+template <typename StateResult, typename GetState>
+RuleStateArrays<decltype(StateResult::state)> GetStates(std::size_t n, const GetState& get_state) {
+  using State = decltype(StateResult::state);
+  StateInterner<State> interner;
+  std::vector<int> state_indices(n, -1);
+  std::vector<int> next_state_indices(n, -1);
+  std::vector<double> next_durations(n, std::numeric_limits<double>::quiet_NaN());
+  {
+    py::gil_scoped_release release;
+    for (std::size_t i = 0; i < n; ++i) {
+      const std::optional<StateResult> result = get_state(i);
+      if (!result.has_value()) {
+        continue;
+      }
+      state_indices[i] = interner.Intern(result->state);
+      if (result->next.has_value()) {
+        next_state_indices[i] = interner.Intern(result->next->state);
+        next_durations[i] = result->next->duration_until.value_or(next_durations[i]);
+      }
+    }
+  }
+  RuleStateArrays<State> arrays;
+  arrays.states = interner.states();
+  arrays.state_indices = ToArray(state_indices);
+  arrays.next_state_indices = ToArray(next_state_indices);
+  arrays.next_durations = ToArray(next_durations);
+  return arrays;
+}
+
+// Binds the RuleStateArrays<State> class as `name`.
+template <typename State>
+void BindRuleStateArrays(py::module* m, const char* name) {
+  py::class_<RuleStateArrays<State>>(*m, name)
+      .def(py::init<>())
+      .def_readonly("states", &RuleStateArrays<State>::states)
+      .def_readonly("state_indices", &RuleStateArrays<State>::state_indices)
+      .def_readonly("next_state_indices", &RuleStateArrays<State>::next_state_indices)
+      .def_readonly("next_durations", &RuleStateArrays<State>::next_durations);
+}
+
+// Adds to `provider_type` the GetStates() batched counterparts of the GetState() overloads of `Provider`.
+template <typename Provider>
+void DefGetStates(py::class_<Provider>* provider_type) {
+  using StateResult = typename Provider::StateResult;
+  provider_type
+      ->def(
+          "GetStates",
+          [](const Provider& self, const std::vector<rules::Rule::Id>& ids) {
+            return GetStates<StateResult>(ids.size(), [&](std::size_t i) { return self.GetState(ids[i]); });
+          },
+          "Evaluates GetState() for each rule id in `ids` and returns the results as arrays.", py::arg("ids"))
+      .def(
+          "GetStates",
+          [](const Provider& self, const std::vector<RoadPosition>& road_positions,
+             const rules::Rule::TypeId& rule_type, double tolerance) {
+            return GetStates<StateResult>(road_positions.size(), [&](std::size_t i) {
+              return self.GetState(road_positions[i], rule_type, tolerance);
+            });
+          },
+          "Evaluates GetState() for each road position in `road_positions` and returns the results as arrays.",
+          py::arg("road_positions"), py::arg("rule_type"), py::arg("tolerance"));
+}
+
+// Wraps `indices` in a read-only array sharing memory with `owner`.
+py::array_t<int> ToReadOnlyArray(const maliput::bindings::RuleIndices& indices, py::handle owner) {
+  py::array_t<int> array(static_cast<py::ssize_t>(indices.size), indices.data, owner);
+  py::detail::array_proxy(array.ptr())->flags &= ~py::detail::npy_api::NPY_ARRAY_WRITEABLE_;
+  return array;
+}
+
+// Evaluates rules::RoadRulebook::FindRules() for each of `queries` and packs the DiscreteValueRules and
+// RangeValueRules found into a RuleQueryResultArrays.
+RuleQueryResultArrays FindRulesBatch(const rules::RoadRulebook& rulebook,
+                                     const std::vector<std::vector<LaneSRange>>& queries, double tolerance) {
+  RuleColumns<rules::DiscreteValueRule> discrete_value_rules;
+  RuleColumns<rules::RangeValueRule> range_value_rules;
+  {
+    py::gil_scoped_release release;
+    for (const std::vector<LaneSRange>& ranges : queries) {
+      const rules::RoadRulebook::QueryResults results = rulebook.FindRules(ranges, tolerance);
+      discrete_value_rules.AddQuery(results.discrete_value_rules);
+      range_value_rules.AddQuery(results.range_value_rules);
+    }
+  }
+  RuleQueryResultArrays arrays;
+  discrete_value_rules.Fill(&arrays.discrete_value_rules);
+  range_value_rules.Fill(&arrays.range_value_rules);
+  return arrays;
+}
+
+}  // namespace
+
 void InitializeRulesNamespace(py::module* m) {
   auto rule_type = py::class_<rules::Rule>(*m, "Rule")
                        .def(py::init<const rules::Rule::Id&, const rules::Rule::TypeId&, const LaneSRoute&>(),
@@ -217,9 +542,43 @@ void InitializeRulesNamespace(py::module* m) {
       .def("__repr__", [](const rules::SpeedLimitRule::Id& id) { return id.string(); });
   // @}
 
+  py::class_<RuleArrays>(*m, "RuleArrays")
+      .def(py::init<>())
+      .def_readonly("rule_ids", &RuleArrays::rule_ids)
+      .def_readonly("type_ids", &RuleArrays::type_ids)
+      .def_readonly("type_indices", &RuleArrays::type_indices)
+      .def_readonly("lane_ids", &RuleArrays::lane_ids)
+      .def_readonly("zone_offsets", &RuleArrays::zone_offsets)
+      .def_readonly("zone_lane_indices", &RuleArrays::zone_lane_indices)
+      .def_readonly("zone_s_ranges", &RuleArrays::zone_s_ranges)
+      .def_readonly("state_offsets", &RuleArrays::state_offsets)
+      .def_readonly("severities", &RuleArrays::severities)
+      .def_readonly("query_offsets", &RuleArrays::query_offsets)
+      .def_readonly("rule_indices", &RuleArrays::rule_indices);
+
+  py::class_<DiscreteValueRuleArrays, RuleArrays>(*m, "DiscreteValueRuleArrays")
+      .def(py::init<>())
+      .def_readonly("values", &DiscreteValueRuleArrays::values)
+      .def_readonly("value_indices", &DiscreteValueRuleArrays::value_indices);
+
+  py::class_<RangeValueRuleArrays, RuleArrays>(*m, "RangeValueRuleArrays")
+      .def(py::init<>())
+      .def_readonly("descriptions", &RangeValueRuleArrays::descriptions)
+      .def_readonly("description_indices", &RangeValueRuleArrays::description_indices)
+      .def_readonly("ranges", &RangeValueRuleArrays::ranges);
+
+  py::class_<RuleQueryResultArrays>(*m, "RuleQueryResultArrays")
+      .def(py::init<>())
+      .def_readonly("discrete_value_rules", &RuleQueryResultArrays::discrete_value_rules)
+      .def_readonly("range_value_rules", &RuleQueryResultArrays::range_value_rules);
+
   auto road_rulebook_type =
       py::class_<rules::RoadRulebook>(*m, "RoadRulebook")
           .def("FindRules", &rules::RoadRulebook::FindRules, py::arg("ranges"), py::arg("tolerance"))
+          .def("FindRulesBatch", &FindRulesBatch,
+               "Evaluates FindRules() for each list of ranges in `queries`, returning the DiscreteValueRules and "
+               "RangeValueRules found as a RuleQueryResultArrays.",
+               py::arg("queries"), py::arg("tolerance"))
           .def("Rules", &rules::RoadRulebook::Rules)
           .def("GetRule",
                py::overload_cast<const rules::RightOfWayRule::Id&>(&rules::RoadRulebook::GetRule, py::const_),
@@ -241,6 +600,35 @@ void InitializeRulesNamespace(py::module* m) {
       .def_readwrite("discrete_value_rules", &rules::RoadRulebook::QueryResults::discrete_value_rules)
       .def_readwrite("range_value_rules", &rules::RoadRulebook::QueryResults::range_value_rules);
 
+  py::class_<maliput::bindings::RoadRulebookIndex>(*m, "RoadRulebookIndex")
+      .def(py::init<const rules::RoadRulebook*, double>(),
+           "Indexes the zones of every DiscreteValueRule and RangeValueRule of `rulebook` by lane, extending them by "
+           "`tolerance` at both ends.",
+           py::arg("rulebook"), py::arg("tolerance") = 0., py::call_guard<py::gil_scoped_release>())
+      .def("discrete_value_rule_ids", &maliput::bindings::RoadRulebookIndex::discrete_value_rule_ids)
+      .def("range_value_rule_ids", &maliput::bindings::RoadRulebookIndex::range_value_rule_ids)
+      .def(
+          "FindDiscreteValueRules",
+          [](const maliput::bindings::RoadRulebookIndex& self, const LaneId& lane_id, double s) {
+            return ToReadOnlyArray(self.FindDiscreteValueRules(lane_id, s),
+                                   py::cast(&self, py::return_value_policy::reference));
+          },
+          "Returns the indices into discrete_value_rule_ids() of the rules whose zone contains `s` on the lane "
+          "`lane_id`, as a read-only array sharing memory with the index.",
+          py::arg("lane_id"), py::arg("s"))
+      .def(
+          "FindRangeValueRules",
+          [](const maliput::bindings::RoadRulebookIndex& self, const LaneId& lane_id, double s) {
+            return ToReadOnlyArray(self.FindRangeValueRules(lane_id, s),
+                                   py::cast(&self, py::return_value_policy::reference));
+          },
+          "Returns the indices into range_value_rule_ids() of the rules whose zone contains `s` on the lane "
+          "`lane_id`, as a read-only array sharing memory with the index.",
+          py::arg("lane_id"), py::arg("s"));
+
+  BindRuleStateArrays<rules::DiscreteValueRule::DiscreteValue>(m, "DiscreteValueRuleStateArrays");
+  BindRuleStateArrays<rules::RangeValueRule::Range>(m, "RangeValueRuleStateArrays");
+
   auto dvr_state_provider_type =
       py::class_<rules::DiscreteValueRuleStateProvider>(*m, "DiscreteValueRuleStateProvider")
           .def("GetState",
@@ -251,6 +639,8 @@ void InitializeRulesNamespace(py::module* m) {
                    &rules::DiscreteValueRuleStateProvider::GetState, py::const_),
                py::arg("road_position"), py::arg("rule_type"), py::arg("tolerance"));
 
+  DefGetStates(&dvr_state_provider_type);
+
   auto dvr_state_provider_state_result_type =
       py::class_<rules::DiscreteValueRuleStateProvider::StateResult>(dvr_state_provider_type, "StateResult")
           .def_readwrite("state", &rules::DiscreteValueRuleStateProvider::StateResult::state)
@@ -270,6 +660,8 @@ void InitializeRulesNamespace(py::module* m) {
                    &rules::RangeValueRuleStateProvider::GetState, py::const_),
                py::arg("road_position"), py::arg("rule_type"), py::arg("tolerance"));
 
+  DefGetStates(&rvr_state_provider_type);
+
   auto rvr_state_provider_state_result_type =
       py::class_<rules::RangeValueRuleStateProvider::StateResult>(rvr_state_provider_type, "StateResult")
           .def_readwrite("state", &rules::RangeValueRuleStateProvider::StateResult::state)
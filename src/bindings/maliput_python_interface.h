@@ -41,6 +41,7 @@
 ///  - maliput::api
 ///  - maliput::math
 ///  - maliput::plugin
+///  - maliput::utility
 ///
 /// Python bindings are created using [pybind11](https://github.com/pybind/pybind11) library.
 /// @subsection maliput_api_bindings Maliput api
@@ -67,6 +68,116 @@
 /// inertial_position = maliput.api.InertialPosition(x=1., y=2., z=3.)
 /// @endcode
 ///
+/// Queries that are usually evaluated many times in a row also have batched counterparts which take and return
+/// [NumPy](https://numpy.org) arrays, so the per-point overhead of crossing the Python/C++ boundary is paid once per
+/// batch.
+///
+/// Code example:
+/// @code{.py}
+/// import numpy as np
+///
+/// results = road_geometry.ToRoadPositions(np.array([[1., 2., 3.], [4., 5., 6.]]))
+/// lane_ids = [results.lane_ids[i] for i in results.lane_indices]
+/// srh = results.lane_positions  # (2, 3) array.
+/// @endcode
+///
+/// `RoadGeometry.id_table()` interns the junctions, segments, lanes and branch points of a road geometry as integer
+/// handles, built once per road geometry and kept until its `RoadNetwork` is released. `Lane.index_in_geometry()` and
+/// its `Segment`, `Junction` and `BranchPoint` counterparts return those handles, which make cheap dictionary keys.
+/// Batched queries return lane handles too, in `lane_indices`, along with a `lane_ids` sequence that converts handles
+/// back to `LaneId`s only when they are accessed. Only road geometries obtained through `RoadNetwork.road_geometry()`
+/// have handles; the accessors raise `ValueError` for any other.
+///
+/// Code example:
+/// @code{.py}
+/// id_table = road_geometry.id_table()
+/// lane_index = id_table.LaneIndex(maliput.api.LaneId("my_lane"))
+/// lane = id_table.lane(lane_index)
+/// results = road_geometry.ToRoadPositions(inertial_positions)
+/// on_my_lane = results.lane_indices == lane_index  # (N,) boolean array.
+/// lane_ids = results.lane_ids[results.lane_indices]  # List of N LaneIds.
+/// @endcode
+///
+/// The table also lists all the junctions, segments, lanes and branch points at once, as tuples of the same objects
+/// their other accessors return, and relates them by handle through read-only NumPy arrays.
+///
+/// Code example:
+/// @code{.py}
+/// lanes = id_table.lanes()  # Tuple of all the Lanes, by handle.
+/// segments = id_table.segments()
+/// segment_of_each_lane = [segments[i] for i in id_table.lane_segment_indices()]
+/// start_branch_points = id_table.lane_branch_point_indices()[:, 0]  # -1 where there is none.
+/// @endcode
+///
+/// The Python objects of the junctions, segments, lanes and branch points of the road geometry of a `RoadNetwork` built
+/// by `maliput.plugin.create_road_network()` are created once and owned by the `RoadNetwork`, so traversals do not
+/// allocate them again. The same lane is therefore always the same object, whether it is reached through
+/// `Segment.lane()`, `Lane.to_left()`, `LaneEnd.lane` or `RoadGeometry.ById().GetLane()`, so lanes compare with `is`
+/// and make cheap dictionary keys. Because those objects and the `RoadNetwork` reference each other, a `RoadNetwork`
+/// whose lanes were accessed is released by the garbage collector instead of as soon as its last reference is dropped.
+///
+/// `RoadRulebook.FindRulesBatch()` likewise takes a list of queries, each one a list of `LaneSRange`s, and returns the
+/// `DiscreteValueRule`s and `RangeValueRule`s found as a `RuleQueryResultArrays` of flat columns in which rule ids,
+/// type ids, lane ids and values are interned to integer indices.
+///
+/// `RoadRulebookIndex` indexes the zones of those rules by lane once, so that the rules applying at a lane position are
+/// found in logarithmic time without querying the rulebook.
+///
+/// Code example:
+/// @code{.py}
+/// import maliput.api
+/// import maliput.api.rules
+///
+/// index = maliput.api.rules.RoadRulebookIndex(road_network.rulebook())
+/// rule_ids = index.range_value_rule_ids()
+/// speed_limits = [rule_ids[i] for i in index.FindRangeValueRules(maliput.api.LaneId("my_lane"), 12.5)]
+/// @endcode
+///
+/// `RoadPositionTracker` keeps the lane each of N moving agents was last localized on. `RoadPositionTracker.Update()`
+/// looks for every agent on that lane, its left and right neighbours and the lanes ongoing from its ends before
+/// falling back to a full `RoadGeometry.ToRoadPosition()` search, which makes localizing agents that move little
+/// between updates much cheaper.
+///
+/// Code example:
+/// @code{.py}
+/// tracker = maliput.api.RoadPositionTracker(road_geometry, num_agents=len(agent_positions))
+/// while running:
+///     results = tracker.Update(agent_positions)  # (N, 3) array, one row per agent.
+///     srh = results.lane_positions
+/// @endcode
+///
+/// `RoadGeometry.SampleAheadWaypointArrays()` samples a `LaneSRoute` into a `WaypointArrays` of preallocated arrays
+/// instead of a list of `InertialPosition`s. `RoadGeometry.SampleAheadWaypointChunks()` yields the same waypoints in
+/// chunks of a fixed size as they are sampled, which bounds the memory taken by long routes sampled finely.
+///
+/// Code example:
+/// @code{.py}
+/// for chunk in road_geometry.SampleAheadWaypointChunks(route, 0.1, chunk_size=4096):
+///     lane_ids = [chunk.lane_ids[i] for i in chunk.lane_indices]
+///     consume(chunk.xyz)  # (N, 3) array, N <= 4096.
+/// @endcode
+///
+/// `RoadGeometryRouter` builds the adjacency of the lane ends of a maliput::api::RoadGeometry once and finds the
+/// shortest `LaneSRoute`s between `RoadPosition`s over its BranchPoint graph, one at a time with `FindRoute()` or from
+/// many start to many end positions with `FindRoutes()`.
+///
+/// Code example:
+/// @code{.py}
+/// import maliput.api
+///
+/// router = maliput.api.RoadGeometryRouter(road_network.road_geometry())
+/// route = router.FindRoute(start, end)  # None when `end` is not reachable from `start`.
+/// waypoints = road_network.road_geometry().SampleAheadWaypoints(route, 1.)
+/// @endcode
+///
+/// Geometric queries such as `RoadGeometry.ToRoadPosition()`, `RoadGeometry.FindRoadPositions()`,
+/// `RoadGeometry.SampleAheadWaypoints()` and `Lane.ToLanePosition()` release the GIL while they run, so they can be
+/// evaluated concurrently from several Python threads. The maliput::api::RoadNetwork they query must outlive those
+/// calls and must not be modified meanwhile. Maliput does not guarantee that the const queries of a backend are safe
+/// to call concurrently, as some backends fill lazy caches in them, so concurrent evaluation is only safe with backends
+/// that document it. For the same reason, the bindings that can spread their work among threads, such as
+/// `RoadGeometry.SampleLanes()`, take a `num_threads` argument that defaults to a single thread.
+///
 /// @subsection maliput_math_bindings Maliput math
 ///
 /// `maliput.math` submodule provides bindings to maliput::math entities such as:
@@ -82,6 +193,21 @@
 /// quaternion = rpy.ToQuaternion()
 /// @endcode
 ///
+/// `Vector3` and `Vector4` implement the buffer protocol and `Quaternion` the `__array__` protocol, so they convert to
+/// NumPy arrays directly; `Vector3` and `Vector4` do so without copies. All of them can be constructed from NumPy
+/// arrays as well. `Vector3Array` holds N vectors in a contiguous (N, 3) buffer and provides vectorized `dot()`,
+/// `cross()`, `norm()` and `normalized()` operations.
+///
+/// Code example:
+/// @code{.py}
+/// import numpy as np
+/// import maliput.math
+///
+/// xyz = np.asarray(maliput.math.Vector3(1., 2., 3.))
+/// vectors = maliput.math.Vector3Array(np.array([[1., 0., 0.], [0., 3., 4.]]))
+/// norms = vectors.norm()  # array([1., 5.])
+/// @endcode
+///
 /// @subsection maliput_plugin_bindings Maliput plugin
 ///
 /// `maliput.plugin` submodule provides bindings for the \subpage maliput_plugin_architecture.
@@ -108,3 +234,118 @@
 /// road_network = maliput.plugin.create_road_network("my_road_network_loader_plugin", dict())
 /// num_junctions = road_network.road_geometry().num_junctions()
 /// @endcode
+///
+/// Building a maliput::api::RoadNetwork from a large map may take seconds. `maliput.road_network_cache` keeps the
+/// most recently used ones in a process-wide LRU cache keyed by plugin id, properties and the modification time of the
+/// files they name, so repeated requests share a single road network which must not be modified.
+///
+/// Code example:
+/// @code{.py}
+/// import maliput.road_network_cache
+///
+/// properties = {"opendrive_file": "/path/to/map.xodr"}
+/// road_network = maliput.road_network_cache.create_road_network("maliput_malidrive", properties)
+/// # Hits the cache unless map.xodr changed in the meantime.
+/// same_road_network = maliput.road_network_cache.create_road_network("maliput_malidrive", properties)
+/// @endcode
+///
+/// `maliput.road_network_snapshot` dumps the lane geometry samples, topology, rules, traffic lights and phase rings of
+/// a maliput::api::RoadNetwork to a compact binary file that other processes load back in milliseconds, memory mapped
+/// and shared between them, without building the road network.
+///
+/// Code example:
+/// @code{.py}
+/// import maliput.road_network_snapshot
+///
+/// maliput.road_network_snapshot.save_snapshot(road_network, "map.snapshot", s_resolution=0.5)
+/// # In a worker process:
+/// snapshot = maliput.road_network_snapshot.load_snapshot("map.snapshot")
+/// lane_index = snapshot.lane_index("my_lane")
+/// centerline = snapshot.centerlines[snapshot.lane_samples(lane_index)]  # (N, 3) array.
+/// @endcode
+///
+/// maliput::api::RoadNetwork objects cannot be pickled. `maliput.road_network_handle.RoadNetworkHandle` records the
+/// plugin id and properties a road network is built from, and optionally the path of its snapshot, and can be sent to
+/// `multiprocessing` and `concurrent.futures` workers. Each worker builds the road network through
+/// `maliput.road_network_cache` the first time it is needed, or only maps the snapshot. Workers forked after the road
+/// network was built inherit it and share its memory copy-on-write instead; see the module documentation for the
+/// fork-safety caveats.
+///
+/// Code example:
+/// @code{.py}
+/// import concurrent.futures
+/// from maliput.road_network_handle import RoadNetworkHandle
+///
+/// def count_junctions(handle):
+///     return handle.road_geometry().num_junctions()
+///
+/// handle = RoadNetworkHandle("maliput_malidrive", {"opendrive_file": "/path/to/map.xodr"})
+/// with concurrent.futures.ProcessPoolExecutor() as executor:
+///     num_junctions = list(executor.map(count_junctions, [handle] * 4))
+/// @endcode
+///
+/// @subsection maliput_utility_bindings Maliput utility
+///
+/// `maliput.utility` submodule provides bindings to generate Wavefront OBJ models of a maliput::api::RoadNetwork.
+/// `GenerateRoadMeshObjFile()` tessellates segments and branch points with several threads and streams them to disk
+/// in batches, reporting progress after each one, so large maps are exported without holding the whole mesh in
+/// memory. Its output does not depend on the number of threads, which default to one since the backend's
+/// `Lane::ToInertialPosition()` must be thread-safe to use more. It is a separate, approximate tessellation rather
+/// than a parallel `GenerateObjFile()`. The road surface covers the same area, but:
+///
+/// - it is sampled on its own grid, so vertices and faces differ;
+/// - the MTL file declares the `RoadMeshMaterial` materials instead of `GenerateObjFile()`'s;
+/// - stripes, arrows and branch points have their own glyph shapes;
+/// - elevation bounds are drawn as a translucent surface at the upper bound of each lane;
+/// - `off_grid_mesh_generation` and `simplify_mesh_threshold` are rejected.
+///
+/// Code example:
+/// @code{.py}
+/// import maliput.utility
+///
+/// features = maliput.utility.ObjFeatures()
+/// maliput.utility.GenerateRoadMeshObjFile(road_network, "/tmp", "my_map", features, num_threads=8,
+///                                         progress=lambda done, total: print(f"{done}/{total}"))
+/// @endcode
+///
+/// `GenerateRoadMesh()` builds the meshes `GenerateRoadMeshObjFile()` writes in memory and returns them as NumPy
+/// arrays of vertices, normals, faces and per face `RoadMeshMaterial` values, without writing or parsing any file.
+///
+/// Code example:
+/// @code{.py}
+/// import maliput.utility
+///
+/// mesh = maliput.utility.GenerateRoadMesh(road_network, maliput.utility.ObjFeatures())
+/// asphalt_faces = mesh.faces[mesh.face_materials == maliput.utility.RoadMeshMaterial.kAsphalt]
+/// @endcode
+///
+/// `RoadMeshCache` keeps the mesh of each segment and branch point keyed by the `ObjFeatures` fields it depends on,
+/// so generating the mesh again only tessellates what changed, e.g. the segments whose highlighting changed. The
+/// least recently used meshes are evicted once they take more than `max_memory_bytes`.
+///
+/// Code example:
+/// @code{.py}
+/// import maliput.utility
+///
+/// cache = maliput.utility.RoadMeshCache(road_network, max_memory_bytes=512 << 20)
+/// features = maliput.utility.ObjFeatures()
+/// mesh = cache.Generate(features)
+/// features.highlighted_segments = [maliput.api.SegmentId("my_segment")]
+/// mesh = cache.Generate(features)  # Only re-tessellates the segments that got grayed.
+/// @endcode
+///
+/// `GenerateRoadMeshLods()` generates several levels of detail at once, one per `max_grid_unit`, and every
+/// `RoadMeshArrays` carries the bounding box of each of its objects for culling. `min_grid_resolution` still bounds
+/// the grid unit of short or narrow segments, so it should be lowered for the coarsest levels to pay off. Items that
+/// are sampled with the same grid units at several levels, like branch points, are tessellated once for all of them;
+/// the others are sampled again at every level.
+///
+/// Code example:
+/// @code{.py}
+/// import maliput.utility
+///
+/// features = maliput.utility.ObjFeatures()
+/// features.min_grid_resolution = 1.
+/// near, middle, far = maliput.utility.GenerateRoadMeshLods(road_network, features, [0.5, 2., 8.])
+/// lower_corners, upper_corners = far.object_bounding_boxes[:, 0], far.object_bounding_boxes[:, 1]
+/// @endcode
@@ -27,11 +27,16 @@
 // CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
 // OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
 // OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+#include <cmath>
 #include <sstream>
+#include <stdexcept>
+#include <string>
+#include <vector>
 
 #include <maliput/math/quaternion.h>
 #include <maliput/math/roll_pitch_yaw.h>
 #include <maliput/math/vector.h>
+#include <pybind11/numpy.h>
 #include <pybind11/pybind11.h>
 
 namespace maliput {
@@ -39,9 +44,147 @@ namespace bindings {
 
 namespace py = pybind11;
 
+namespace {
+
+// Row-major float64 array taken by the NumPy constructors. Other dtypes and layouts are converted on the way in.
+using DoubleArray = py::array_t<double, py::array::c_style | py::array::forcecast>;
+
+// Throws std::invalid_argument when `array` is not a one-dimensional array of `size` elements.
+void ThrowUnlessSize(const DoubleArray& array, py::ssize_t size) {
+  if (array.ndim() != 1 || array.shape(0) != size) {
+    throw std::invalid_argument("Expected an array of " + std::to_string(size) + " elements.");
+  }
+}
+
+// Returns `size`, throwing std::invalid_argument when it is negative.
+py::ssize_t ThrowIfNegative(py::ssize_t size) {
+  if (size < 0) {
+    throw std::invalid_argument("size must be non-negative.");
+  }
+  return size;
+}
+
+// Contiguous sequence of N three-dimensional vectors stored as an (N, 3) row-major buffer, so whole sequences are
+// exchanged with NumPy without copies and operated on in a single call.
+class Vector3Array {
+ public:
+  // Constructs `size` zero vectors.
+  explicit Vector3Array(py::ssize_t size) : data_(3 * ThrowIfNegative(size), 0.) {}
+
+  // Copies the [x, y, z] rows of an (N, 3) array.
+  explicit Vector3Array(const DoubleArray& vectors) {
+    if (vectors.ndim() != 2 || vectors.shape(1) != 3) {
+      throw std::invalid_argument("vectors must be an (N, 3) array.");
+    }
+    data_.assign(vectors.data(), vectors.data() + vectors.size());
+  }
+
+  py::ssize_t size() const { return static_cast<py::ssize_t>(data_.size() / 3); }
+
+  double* data() { return data_.data(); }
+
+  // Returns a copy of the `i`-th vector. Negative indices count from the end.
+  math::Vector3 get(py::ssize_t i) const {
+    const double* xyz = &data_[3 * ToIndex(i)];
+    return math::Vector3(xyz[0], xyz[1], xyz[2]);
+  }
+
+  // Sets the `i`-th vector. Negative indices count from the end.
+  void set(py::ssize_t i, const math::Vector3& vector) {
+    double* xyz = &data_[3 * ToIndex(i)];
+    xyz[0] = vector.x();
+    xyz[1] = vector.y();
+    xyz[2] = vector.z();
+  }
+
+  // Returns the (N,) dot products of each vector with the vector of `other` at the same index.
+  py::array_t<double> dot(const Vector3Array& other) const {
+    ThrowUnlessSameSize(other);
+    py::array_t<double> result(size());
+    auto dots = result.mutable_unchecked<1>();
+    for (py::ssize_t i = 0; i < size(); ++i) {
+      const double* a = &data_[3 * i];
+      const double* b = &other.data_[3 * i];
+      dots(i) = a[0] * b[0] + a[1] * b[1] + a[2] * b[2];
+    }
+    return result;
+  }
+
+  // Returns the cross products of each vector with the vector of `other` at the same index.
+  Vector3Array cross(const Vector3Array& other) const {
+    ThrowUnlessSameSize(other);
+    Vector3Array result(size());
+    for (py::ssize_t i = 0; i < size(); ++i) {
+      const double* a = &data_[3 * i];
+      const double* b = &other.data_[3 * i];
+      double* c = &result.data_[3 * i];
+      c[0] = a[1] * b[2] - a[2] * b[1];
+      c[1] = a[2] * b[0] - a[0] * b[2];
+      c[2] = a[0] * b[1] - a[1] * b[0];
+    }
+    return result;
+  }
+
+  // Returns the (N,) Euclidean norms of the vectors.
+  py::array_t<double> norm() const {
+    py::array_t<double> result(size());
+    auto norms = result.mutable_unchecked<1>();
+    for (py::ssize_t i = 0; i < size(); ++i) {
+      norms(i) = Norm(i);
+    }
+    return result;
+  }
+
+  // Returns the vectors scaled to unit norm. Throws std::invalid_argument when any of them has zero norm.
+  Vector3Array normalized() const {
+    Vector3Array result(size());
+    for (py::ssize_t i = 0; i < size(); ++i) {
+      const double norm = Norm(i);
+      if (norm == 0.) {
+        throw std::invalid_argument("Cannot normalize the zero vector at index " + std::to_string(i) + ".");
+      }
+      for (py::ssize_t j = 0; j < 3; ++j) {
+        result.data_[3 * i + j] = data_[3 * i + j] / norm;
+      }
+    }
+    return result;
+  }
+
+ private:
+  // Maps `i` into [0, size()), throwing py::index_error when it is out of range.
+  py::ssize_t ToIndex(py::ssize_t i) const {
+    const py::ssize_t index = i < 0 ? i + size() : i;
+    if (index < 0 || index >= size()) {
+      throw py::index_error("Vector3Array index out of range.");
+    }
+    return index;
+  }
+
+  void ThrowUnlessSameSize(const Vector3Array& other) const {
+    if (other.size() != size()) {
+      throw std::invalid_argument("Vector3Array sizes differ.");
+    }
+  }
+
+  double Norm(py::ssize_t i) const {
+    const double* xyz = &data_[3 * i];
+    return std::sqrt(xyz[0] * xyz[0] + xyz[1] * xyz[1] + xyz[2] * xyz[2]);
+  }
+
+  std::vector<double> data_;
+};
+
+}  // namespace
+
 PYBIND11_MODULE(math, m) {
-  py::class_<math::Vector3>(m, "Vector3")
+  py::class_<math::Vector3>(m, "Vector3", py::buffer_protocol())
       .def(py::init<double, double, double>())
+      .def(py::init([](const DoubleArray& xyz) {
+             ThrowUnlessSize(xyz, 3);
+             return math::Vector3(xyz.at(0), xyz.at(1), xyz.at(2));
+           }),
+           py::arg("xyz"))
+      .def_buffer([](math::Vector3& self) { return py::buffer_info(&self[0], 3); })
       .def("__getitem__", py::overload_cast<std::size_t>(&math::Vector3::operator[]), py::is_operator())
       .def("__eq__", [](const math::Vector3& a, const math::Vector3& b) { return a == b; })
       .def("__ne__", [](const math::Vector3& a, const math::Vector3& b) { return a != b; })
@@ -65,8 +208,14 @@ PYBIND11_MODULE(math, m) {
       .def("y", py::overload_cast<>(&math::Vector3::y))
       .def("z", py::overload_cast<>(&math::Vector3::z));
 
-  py::class_<math::Vector4>(m, "Vector4")
+  py::class_<math::Vector4>(m, "Vector4", py::buffer_protocol())
       .def(py::init<double, double, double, double>())
+      .def(py::init([](const DoubleArray& xyzw) {
+             ThrowUnlessSize(xyzw, 4);
+             return math::Vector4(xyzw.at(0), xyzw.at(1), xyzw.at(2), xyzw.at(3));
+           }),
+           py::arg("xyzw"))
+      .def_buffer([](math::Vector4& self) { return py::buffer_info(&self[0], 4); })
       .def("__getitem__", py::overload_cast<std::size_t>(&math::Vector4::operator[]), py::is_operator())
       .def("__eq__", [](const math::Vector4& a, const math::Vector4& b) { return a == b; })
       .def("__ne__", [](const math::Vector4& a, const math::Vector4& b) { return a != b; })
@@ -105,6 +254,24 @@ PYBIND11_MODULE(math, m) {
 
   py::class_<math::Quaternion>(m, "Quaternion")
       .def(py::init<double, double, double, double>())
+      .def(py::init([](const DoubleArray& wxyz) {
+             ThrowUnlessSize(wxyz, 4);
+             return math::Quaternion(wxyz.at(0), wxyz.at(1), wxyz.at(2), wxyz.at(3));
+           }),
+           py::arg("wxyz"))
+      // Quaternion does not expose its coefficients' storage, so they are copied into a [w, x, y, z] array.
+      .def(
+          "__array__",
+          [](const math::Quaternion& self, const py::object& dtype, const py::object& /* copy */) -> py::object {
+            py::array_t<double> wxyz(4);
+            auto coefficients = wxyz.mutable_unchecked<1>();
+            coefficients(0) = self.w();
+            coefficients(1) = self.x();
+            coefficients(2) = self.y();
+            coefficients(3) = self.z();
+            return dtype.is_none() ? py::object(wxyz) : wxyz.attr("astype")(dtype);
+          },
+          py::arg("dtype") = py::none(), py::arg("copy") = py::none())
       .def("__str__",
            [](const math::Quaternion& self) {
              std::stringstream ss;
@@ -116,6 +283,23 @@ PYBIND11_MODULE(math, m) {
       .def("x", py::overload_cast<>(&math::Quaternion::x))
       .def("y", py::overload_cast<>(&math::Quaternion::y))
       .def("z", py::overload_cast<>(&math::Quaternion::z));
+
+  py::class_<Vector3Array>(m, "Vector3Array", py::buffer_protocol())
+      .def(py::init<py::ssize_t>(), py::arg("size"))
+      .def(py::init<const DoubleArray&>(), py::arg("vectors"))
+      .def_buffer([](Vector3Array& self) {
+        return py::buffer_info(
+            self.data(), {self.size(), py::ssize_t{3}},
+            {static_cast<py::ssize_t>(3 * sizeof(double)), static_cast<py::ssize_t>(sizeof(double))});
+      })
+      .def("__len__", &Vector3Array::size)
+      .def("__getitem__", &Vector3Array::get, py::arg("index"))
+      .def("__setitem__", &Vector3Array::set, py::arg("index"), py::arg("vector"))
+      .def("size", &Vector3Array::size)
+      .def("dot", &Vector3Array::dot, py::arg("other"))
+      .def("cross", &Vector3Array::cross, py::arg("other"))
+      .def("norm", &Vector3Array::norm)
+      .def("normalized", &Vector3Array::normalized);
 }
 
 }  // namespace bindings
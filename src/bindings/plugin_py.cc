@@ -27,6 +27,8 @@
 // CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
 // OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
 // OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+#include <map>
+#include <memory>
 #include <string>
 
 #include <maliput/plugin/create_road_network.h>
@@ -42,6 +44,12 @@ namespace bindings {
 namespace py = pybind11;
 
 PYBIND11_MODULE(plugin, m) {
+  // Plugin paths provided by the `maliput.backends` entry points are discovered once, when this module is first
+  // imported, instead of whenever `maliput` is imported.
+  py::module_::import("maliput").attr("update_plugin_path")();
+  // Registers api::RoadNetwork, which create_road_network() returns.
+  py::module_::import("maliput.api");
+
   py::enum_<plugin::MaliputPluginType>(m, "MaliputPluginType")
       .value("kRoadNetworkLoader", plugin::MaliputPluginType::kRoadNetworkLoader)
       .export_values();
@@ -67,9 +75,24 @@ PYBIND11_MODULE(plugin, m) {
       .def("AddPlugin", &plugin::MaliputPluginManager::AddPlugin)
       .def("ListPlugins", &plugin::MaliputPluginManager::ListPlugins);
 
-  m.def("create_road_network", &maliput::plugin::CreateRoadNetwork,
-        "Creates a maliput::api::plugin::RoadNetwork using `plugin_id` implementation.", py::arg("plugin_id"),
-        py::arg("properties"));
+  m.def(
+      "create_road_network",
+      [](const std::string& plugin_id, const std::map<std::string, std::string>& properties) {
+        std::unique_ptr<api::RoadNetwork> road_network;
+        {
+          py::gil_scoped_release release;
+          road_network = plugin::CreateRoadNetwork(plugin_id, properties);
+        }
+        py::object result = py::cast(std::move(road_network));
+        // Registers the road geometry with the RoadNetwork, so its junctions, segments, lanes and branch points are
+        // wrapped once however they are reached.
+        if (!result.is_none()) {
+          result.attr("road_geometry")();
+        }
+        return result;
+      },
+      "Creates a maliput::api::plugin::RoadNetwork using `plugin_id` implementation.", py::arg("plugin_id"),
+      py::arg("properties"));
 }
 
 }  // namespace bindings
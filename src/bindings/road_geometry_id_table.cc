@@ -0,0 +1,70 @@
+// BSD 3-Clause License
+//
+// Copyright (c) 2026, Woven by Toyota. All rights reserved.
+//
+// Redistribution and use in source and binary forms, with or without
+// modification, are permitted provided that the following conditions are met:
+//
+// * Redistributions of source code must retain the above copyright notice, this
+//   list of conditions and the following disclaimer.
+//
+// * Redistributions in binary form must reproduce the above copyright notice,
+//   this list of conditions and the following disclaimer in the documentation
+//   and/or other materials provided with the distribution.
+//
+// * Neither the name of the copyright holder nor the names of its
+//   contributors may be used to endorse or promote products derived from
+//   this software without specific prior written permission.
+//
+// THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+// AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+// IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+// DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+// FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+// DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+// SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+// CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+// OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+// OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+#include "bindings/road_geometry_id_table.h"
+
+namespace maliput {
+namespace bindings {
+
+RoadGeometryIdTable::RoadGeometryIdTable(const api::RoadGeometry* road_geometry) : road_geometry_(road_geometry) {
+  if (road_geometry_ == nullptr) {
+    throw std::invalid_argument("road_geometry must not be nullptr.");
+  }
+  junction_segment_offsets_.push_back(0);
+  segment_lane_offsets_.push_back(0);
+  for (int i = 0; i < road_geometry_->num_junctions(); ++i) {
+    const api::Junction* junction = road_geometry_->junction(i);
+    const int junction_index = junctions_.size();
+    junctions_.Add(junction);
+    for (int j = 0; j < junction->num_segments(); ++j) {
+      const api::Segment* segment = junction->segment(j);
+      const int segment_index = segments_.size();
+      segments_.Add(segment);
+      segment_junction_indices_.push_back(junction_index);
+      for (int k = 0; k < segment->num_lanes(); ++k) {
+        lanes_.Add(segment->lane(k));
+        lane_segment_indices_.push_back(segment_index);
+      }
+      segment_lane_offsets_.push_back(lanes_.size());
+    }
+    junction_segment_offsets_.push_back(segments_.size());
+  }
+  for (int i = 0; i < road_geometry_->num_branch_points(); ++i) {
+    branch_points_.Add(road_geometry_->branch_point(i));
+  }
+  lane_branch_point_indices_.reserve(2 * lanes_.size());
+  for (const api::Lane* lane : lanes_.entities()) {
+    for (const api::LaneEnd::Which end : {api::LaneEnd::kStart, api::LaneEnd::kFinish}) {
+      const api::BranchPoint* branch_point = lane->GetBranchPoint(end);
+      lane_branch_point_indices_.push_back(branch_point == nullptr ? -1 : branch_points_.IndexOf(branch_point));
+    }
+  }
+}
+
+}  // namespace bindings
+}  // namespace maliput
@@ -0,0 +1,159 @@
+// BSD 3-Clause License
+//
+// Copyright (c) 2026, Woven by Toyota. All rights reserved.
+//
+// Redistribution and use in source and binary forms, with or without
+// modification, are permitted provided that the following conditions are met:
+//
+// * Redistributions of source code must retain the above copyright notice, this
+//   list of conditions and the following disclaimer.
+//
+// * Redistributions in binary form must reproduce the above copyright notice,
+//   this list of conditions and the following disclaimer in the documentation
+//   and/or other materials provided with the distribution.
+//
+// * Neither the name of the copyright holder nor the names of its
+//   contributors may be used to endorse or promote products derived from
+//   this software without specific prior written permission.
+//
+// THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+// AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+// IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+// DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+// FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+// DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+// SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+// CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+// OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+// OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+#pragma once
+
+#include <stdexcept>
+#include <string>
+#include <unordered_map>
+#include <vector>
+
+#include <maliput/api/branch_point.h>
+#include <maliput/api/junction.h>
+#include <maliput/api/lane.h>
+#include <maliput/api/road_geometry.h>
+#include <maliput/api/segment.h>
+
+namespace maliput {
+namespace bindings {
+
+// Numbers entities of one kind, e.g. the lanes of an api::RoadGeometry, with consecutive integer indices and maps them
+// back and forth to their pointers and ids.
+template <typename Entity, typename Id>
+class IdTable {
+ public:
+  using entity_type = Entity;
+  using id_type = Id;
+
+  // Appends `entity` with the next index.
+  void Add(const Entity* entity) {
+    const int index = size();
+    entities_.push_back(entity);
+    ids_.push_back(entity->id());
+    indices_by_entity_.emplace(entity, index);
+    indices_by_id_.emplace(entity->id(), index);
+  }
+
+  int size() const { return static_cast<int>(entities_.size()); }
+
+  // @throws std::out_of_range When `index` is not in [0, size()).
+  const Entity* get(int index) const {
+    if (index < 0 || index >= size()) {
+      throw std::out_of_range("index " + std::to_string(index) + " is out of range.");
+    }
+    return entities_[index];
+  }
+
+  const std::vector<const Entity*>& entities() const { return entities_; }
+
+  // Ids of the entities, by index.
+  const std::vector<Id>& ids() const { return ids_; }
+
+  // Returns the index of `entity`, or -1 when it is not in the table.
+  int IndexOf(const Entity* entity) const {
+    const auto it = indices_by_entity_.find(entity);
+    return it == indices_by_entity_.end() ? -1 : it->second;
+  }
+
+  // Returns the index of the entity identified by `id`, or -1 when it is not in the table.
+  int IndexOf(const Id& id) const {
+    const auto it = indices_by_id_.find(id);
+    return it == indices_by_id_.end() ? -1 : it->second;
+  }
+
+ private:
+  std::vector<const Entity*> entities_;
+  std::vector<Id> ids_;
+  std::unordered_map<const Entity*, int> indices_by_entity_;
+  std::unordered_map<Id, int> indices_by_id_;
+};
+
+// Interns the junctions, segments, lanes and branch points of an api::RoadGeometry as integer handles, so that they
+// can be stored in arrays and used as cheap keys. Junctions, segments and lanes are numbered in the order they are
+// found when walking junctions, segments and lanes by index; branch points in their own index order.
+//
+// The parent and child relations among them are tabulated by handle too. As children are numbered in the order of
+// their parents, the segments of the j-th junction are those in [junction_segment_offsets()[j],
+// junction_segment_offsets()[j + 1]), and the lanes of the i-th segment those in [segment_lane_offsets()[i],
+// segment_lane_offsets()[i + 1]).
+//
+// The table is immutable once built, so it can be queried concurrently.
+class RoadGeometryIdTable {
+ public:
+  using JunctionTable = IdTable<api::Junction, api::JunctionId>;
+  using SegmentTable = IdTable<api::Segment, api::SegmentId>;
+  using LaneTable = IdTable<api::Lane, api::LaneId>;
+  using BranchPointTable = IdTable<api::BranchPoint, api::BranchPointId>;
+
+  // Builds the table.
+  //
+  // @param road_geometry The interned road geometry. It must outlive this table.
+  // @throws std::invalid_argument When `road_geometry` is nullptr.
+  explicit RoadGeometryIdTable(const api::RoadGeometry* road_geometry);
+
+  const api::RoadGeometry* road_geometry() const { return road_geometry_; }
+
+  const JunctionTable& junctions() const { return junctions_; }
+
+  const SegmentTable& segments() const { return segments_; }
+
+  const LaneTable& lanes() const { return lanes_; }
+
+  const BranchPointTable& branch_points() const { return branch_points_; }
+
+  // Offsets of the segments of each junction, num_junctions + 1 of them.
+  const std::vector<int>& junction_segment_offsets() const { return junction_segment_offsets_; }
+
+  // Handle of the junction of each segment.
+  const std::vector<int>& segment_junction_indices() const { return segment_junction_indices_; }
+
+  // Offsets of the lanes of each segment, num_segments + 1 of them.
+  const std::vector<int>& segment_lane_offsets() const { return segment_lane_offsets_; }
+
+  // Handle of the segment of each lane.
+  const std::vector<int>& lane_segment_indices() const { return lane_segment_indices_; }
+
+  // Handles of the branch points at the api::LaneEnd::kStart and api::LaneEnd::kFinish ends of each lane, interleaved,
+  // -1 where a lane end has no branch point.
+  const std::vector<int>& lane_branch_point_indices() const { return lane_branch_point_indices_; }
+
+ private:
+  const api::RoadGeometry* road_geometry_{};
+  JunctionTable junctions_;
+  SegmentTable segments_;
+  LaneTable lanes_;
+  BranchPointTable branch_points_;
+  std::vector<int> junction_segment_offsets_;
+  std::vector<int> segment_junction_indices_;
+  std::vector<int> segment_lane_offsets_;
+  std::vector<int> lane_segment_indices_;
+  std::vector<int> lane_branch_point_indices_;
+};
+
+}  // namespace bindings
+}  // namespace maliput
@@ -0,0 +1,202 @@
+// BSD 3-Clause License
+//
+// Copyright (c) 2026, Woven by Toyota. All rights reserved.
+//
+// Redistribution and use in source and binary forms, with or without
+// modification, are permitted provided that the following conditions are met:
+//
+// * Redistributions of source code must retain the above copyright notice, this
+//   list of conditions and the following disclaimer.
+//
+// * Redistributions in binary form must reproduce the above copyright notice,
+//   this list of conditions and the following disclaimer in the documentation
+//   and/or other materials provided with the distribution.
+//
+// * Neither the name of the copyright holder nor the names of its
+//   contributors may be used to endorse or promote products derived from
+//   this software without specific prior written permission.
+//
+// THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+// AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+// IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+// DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+// FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+// DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+// SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+// CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+// OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+// OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+#include "bindings/road_geometry_router.h"
+
+#include <algorithm>
+#include <functional>
+#include <limits>
+#include <queue>
+#include <stdexcept>
+#include <tuple>
+
+#include <maliput/api/branch_point.h>
+#include <maliput/api/junction.h>
+#include <maliput/api/segment.h>
+
+namespace maliput {
+namespace bindings {
+namespace {
+
+// Parent of the nodes entered from the start position.
+constexpr int kStartNode = -1;
+
+bool IsForward(int node) { return node % 2 == 0; }
+
+}  // namespace
+
+RoadGeometryRouter::RoadGeometryRouter(const api::RoadGeometry* road_geometry) : road_geometry_(road_geometry) {
+  if (road_geometry_ == nullptr) {
+    throw std::invalid_argument("road_geometry must not be nullptr.");
+  }
+  for (int i = 0; i < road_geometry_->num_junctions(); ++i) {
+    const api::Junction* junction = road_geometry_->junction(i);
+    for (int j = 0; j < junction->num_segments(); ++j) {
+      const api::Segment* segment = junction->segment(j);
+      for (int k = 0; k < segment->num_lanes(); ++k) {
+        lane_indices_.emplace(segment->lane(k), static_cast<int>(lanes_.size()));
+        lanes_.push_back(segment->lane(k));
+      }
+    }
+  }
+  offsets_.push_back(0);
+  for (const api::Lane* lane : lanes_) {
+    for (const api::LaneEnd::Which exit_end : {api::LaneEnd::kFinish, api::LaneEnd::kStart}) {
+      const double entry_s = exit_end == api::LaneEnd::kFinish ? 0. : lane->length();
+      entry_positions_.push_back(lane->ToInertialPosition(api::LanePosition(entry_s, 0., 0.)).xyz());
+      const api::LaneEndSet* ongoing_branches = lane->GetOngoingBranches(exit_end);
+      for (int i = 0; ongoing_branches != nullptr && i < ongoing_branches->size(); ++i) {
+        const api::LaneEnd& lane_end = ongoing_branches->get(i);
+        const auto lane_it = lane_indices_.find(lane_end.lane);
+        if (lane_it != lane_indices_.end()) {
+          targets_.push_back(2 * lane_it->second + (lane_end.end == api::LaneEnd::kStart ? 0 : 1));
+        }
+      }
+      offsets_.push_back(static_cast<std::int64_t>(targets_.size()));
+    }
+  }
+}
+
+RoadGeometryRouter::LaneS RoadGeometryRouter::ToLaneS(const api::RoadPosition& road_position) const {
+  const auto lane_it = lane_indices_.find(road_position.lane);
+  if (lane_it == lane_indices_.end()) {
+    throw std::invalid_argument("Road position is not on a lane of the road geometry.");
+  }
+  const double s = std::clamp(road_position.pos.s(), 0., road_position.lane->length());
+  return {lane_it->second, s};
+}
+
+std::optional<api::LaneSRoute> RoadGeometryRouter::FindRoute(const api::RoadPosition& start,
+                                                             const api::RoadPosition& end, bool use_heuristic) const {
+  const LaneS goal = ToLaneS(end);
+  const math::Vector3 target = lanes_[goal.lane_index]->ToInertialPosition(api::LanePosition(goal.s, 0., 0.)).xyz();
+  return Search(ToLaneS(start), {goal}, use_heuristic ? &target : nullptr).front();
+}
+
+std::vector<std::optional<api::LaneSRoute>> RoadGeometryRouter::FindRoutes(
+    const api::RoadPosition& start, const std::vector<api::RoadPosition>& ends) const {
+  std::vector<LaneS> goals;
+  goals.reserve(ends.size());
+  for (const api::RoadPosition& end : ends) {
+    goals.push_back(ToLaneS(end));
+  }
+  return Search(ToLaneS(start), goals, nullptr);
+}
+
+std::vector<std::optional<api::LaneSRoute>> RoadGeometryRouter::Search(const LaneS& start,
+                                                                       const std::vector<LaneS>& goals,
+                                                                       const math::Vector3* target) const {
+  // Nodes past the lane traversals are the goals. The cost of a lane traversal is the distance travelled from the start
+  // position to its entry end; the traversals of the start lane begin at a negative cost, so that leaving it costs the
+  // distance from the start position to its exit end.
+  const int num_lane_nodes = num_nodes();
+  const int num_goals = static_cast<int>(goals.size());
+  std::unordered_map<int, std::vector<int>> lane_goals;
+  for (int goal = 0; goal < num_goals; ++goal) {
+    lane_goals[goals[goal].lane_index].push_back(goal);
+  }
+  const double tolerance = road_geometry_->linear_tolerance();
+  const auto heuristic = [&](int node) {
+    if (target == nullptr || node >= num_lane_nodes) {
+      return 0.;
+    }
+    return std::max(0., (entry_positions_[node] - *target).norm() - tolerance);
+  };
+
+  constexpr double kInfinity = std::numeric_limits<double>::infinity();
+  std::vector<double> costs(num_lane_nodes + num_goals, kInfinity);
+  std::vector<int> parents(num_lane_nodes + num_goals, kStartNode);
+  std::vector<bool> settled(num_lane_nodes + num_goals, false);
+  // Entries are (cost + heuristic, node).
+  using Entry = std::pair<double, int>;
+  std::priority_queue<Entry, std::vector<Entry>, std::greater<Entry>> queue;
+  const auto relax = [&](int node, double cost, int parent) {
+    if (cost < costs[node]) {
+      costs[node] = cost;
+      parents[node] = parent;
+      queue.emplace(cost + heuristic(node), node);
+    }
+  };
+  const double start_length = lanes_[start.lane_index]->length();
+  relax(2 * start.lane_index, -start.s, kStartNode);
+  relax(2 * start.lane_index + 1, start.s - start_length, kStartNode);
+
+  int num_settled_goals = 0;
+  while (!queue.empty() && num_settled_goals < num_goals) {
+    const int node = queue.top().second;
+    queue.pop();
+    if (settled[node]) {
+      continue;
+    }
+    settled[node] = true;
+    if (node >= num_lane_nodes) {
+      ++num_settled_goals;
+      continue;
+    }
+    const int lane_index = node / 2;
+    const double length = lanes_[lane_index]->length();
+    const auto goals_it = lane_goals.find(lane_index);
+    if (goals_it != lane_goals.end()) {
+      for (const int goal : goals_it->second) {
+        const double distance = IsForward(node) ? goals[goal].s : length - goals[goal].s;
+        // On the start lane, goals behind the start position are reached travelling the other way.
+        if (parents[node] != kStartNode || costs[node] + distance >= 0.) {
+          relax(num_lane_nodes + goal, costs[node] + distance, node);
+        }
+      }
+    }
+    for (std::int64_t edge = offsets_[node]; edge < offsets_[node + 1]; ++edge) {
+      relax(targets_[edge], costs[node] + length, node);
+    }
+  }
+
+  std::vector<std::optional<api::LaneSRoute>> routes(num_goals);
+  for (int goal = 0; goal < num_goals; ++goal) {
+    if (!settled[num_lane_nodes + goal]) {
+      continue;
+    }
+    std::vector<int> nodes;
+    for (int node = parents[num_lane_nodes + goal]; node != kStartNode; node = parents[node]) {
+      nodes.push_back(node);
+    }
+    std::reverse(nodes.begin(), nodes.end());
+    std::vector<api::LaneSRange> ranges;
+    for (std::size_t i = 0; i < nodes.size(); ++i) {
+      const api::Lane* lane = lanes_[nodes[i] / 2];
+      const bool forward = IsForward(nodes[i]);
+      const double s0 = i == 0 ? start.s : (forward ? 0. : lane->length());
+      const double s1 = i + 1 == nodes.size() ? goals[goal].s : (forward ? lane->length() : 0.);
+      ranges.emplace_back(lane->id(), api::SRange(s0, s1));
+    }
+    routes[goal] = api::LaneSRoute(ranges);
+  }
+  return routes;
+}
+
+}  // namespace bindings
+}  // namespace maliput
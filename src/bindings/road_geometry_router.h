@@ -0,0 +1,111 @@
+// BSD 3-Clause License
+//
+// Copyright (c) 2026, Woven by Toyota. All rights reserved.
+//
+// Redistribution and use in source and binary forms, with or without
+// modification, are permitted provided that the following conditions are met:
+//
+// * Redistributions of source code must retain the above copyright notice, this
+//   list of conditions and the following disclaimer.
+//
+// * Redistributions in binary form must reproduce the above copyright notice,
+//   this list of conditions and the following disclaimer in the documentation
+//   and/or other materials provided with the distribution.
+//
+// * Neither the name of the copyright holder nor the names of its
+//   contributors may be used to endorse or promote products derived from
+//   this software without specific prior written permission.
+//
+// THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+// AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+// IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+// DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+// FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+// DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+// SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+// CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+// OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+// OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+#pragma once
+
+#include <cstdint>
+#include <optional>
+#include <unordered_map>
+#include <vector>
+
+#include <maliput/api/lane.h>
+#include <maliput/api/lane_data.h>
+#include <maliput/api/regions.h>
+#include <maliput/api/road_geometry.h>
+#include <maliput/math/vector.h>
+
+namespace maliput {
+namespace bindings {
+
+// Finds shortest routes between api::RoadPositions over the api::BranchPoint graph of an api::RoadGeometry.
+//
+// Each lane is traversed in either direction: node 2 * i of the graph travels the i-th lane from its kStart to its
+// kFinish end, and node 2 * i + 1 the other way around. A node connects to the traversals entering the lane ends
+// ongoing from the end it leaves through, at the cost of the length of its lane. The adjacency is built once as a
+// compressed sparse row (CSR) table, so searches do not call into the road geometry.
+//
+// The router is immutable once built, but its searches call Lane::length() and FindRoute() calls
+// Lane::ToInertialPosition(), so it can only be queried concurrently when the backend's lane queries can.
+class RoadGeometryRouter {
+ public:
+  // Builds the lane end adjacency of `road_geometry`.
+  //
+  // @param road_geometry The routed road geometry. It must outlive this router.
+  // @throws std::invalid_argument When `road_geometry` is nullptr.
+  explicit RoadGeometryRouter(const api::RoadGeometry* road_geometry);
+
+  // Finds the shortest route from `start` to `end`.
+  //
+  // @param use_heuristic Whether to run an A* search guided by the straight line distance to `end` instead of a
+  // Dijkstra search.
+  // @returns The route as an api::LaneSRoute whose api::LaneSRanges go from `start` to `end`, with s decreasing along
+  // lanes traversed backwards, or std::nullopt when `end` is not reachable.
+  // @throws std::invalid_argument When `start` or `end` are not on a lane of the road geometry.
+  std::optional<api::LaneSRoute> FindRoute(const api::RoadPosition& start, const api::RoadPosition& end,
+                                           bool use_heuristic) const;
+
+  // Finds the shortest routes from `start` to each of `ends` with a single Dijkstra search.
+  //
+  // @throws std::invalid_argument When `start` or any of `ends` are not on a lane of the road geometry.
+  std::vector<std::optional<api::LaneSRoute>> FindRoutes(const api::RoadPosition& start,
+                                                         const std::vector<api::RoadPosition>& ends) const;
+
+  const api::RoadGeometry* road_geometry() const { return road_geometry_; }
+
+  // Number of nodes of the graph, two per lane.
+  int num_nodes() const { return static_cast<int>(entry_positions_.size()); }
+
+  // Number of edges of the graph.
+  int num_edges() const { return static_cast<int>(targets_.size()); }
+
+ private:
+  // Position on the i-th lane.
+  struct LaneS {
+    int lane_index{};
+    double s{};
+  };
+
+  LaneS ToLaneS(const api::RoadPosition& road_position) const;
+
+  // Runs a search from `start` until every one of `goals` is reached or found unreachable. When `target` is not
+  // nullptr, the search is guided by the distance to it, which must be the position of the only goal.
+  std::vector<std::optional<api::LaneSRoute>> Search(const LaneS& start, const std::vector<LaneS>& goals,
+                                                     const math::Vector3* target) const;
+
+  const api::RoadGeometry* road_geometry_{};
+  std::vector<const api::Lane*> lanes_;
+  std::unordered_map<const api::Lane*, int> lane_indices_;
+  // Inertial position where each node enters its lane.
+  std::vector<math::Vector3> entry_positions_;
+  // The edges of the n-th node lead to the nodes in targets_[offsets_[n]] to targets_[offsets_[n + 1] - 1].
+  std::vector<std::int64_t> offsets_;
+  std::vector<int> targets_;
+};
+
+}  // namespace bindings
+}  // namespace maliput
@@ -0,0 +1,187 @@
+// BSD 3-Clause License
+//
+// Copyright (c) 2026, Woven by Toyota. All rights reserved.
+//
+// Redistribution and use in source and binary forms, with or without
+// modification, are permitted provided that the following conditions are met:
+//
+// * Redistributions of source code must retain the above copyright notice, this
+//   list of conditions and the following disclaimer.
+//
+// * Redistributions in binary form must reproduce the above copyright notice,
+//   this list of conditions and the following disclaimer in the documentation
+//   and/or other materials provided with the distribution.
+//
+// * Neither the name of the copyright holder nor the names of its
+//   contributors may be used to endorse or promote products derived from
+//   this software without specific prior written permission.
+//
+// THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+// AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+// IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+// DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+// FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+// DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+// SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+// CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+// OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+// OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+#include "bindings/road_geometry_spatial_index.h"
+
+#include <algorithm>
+#include <cmath>
+#include <limits>
+#include <stdexcept>
+#include <utility>
+
+#include <maliput/api/junction.h>
+#include <maliput/api/segment.h>
+
+namespace maliput {
+namespace bindings {
+
+RoadGeometrySpatialIndex::RoadGeometrySpatialIndex(const api::RoadGeometry* road_geometry, double sampling_step,
+                                                   double cell_size)
+    : road_geometry_(road_geometry), cell_size_(cell_size) {
+  if (road_geometry_ == nullptr) {
+    throw std::invalid_argument("road_geometry must not be nullptr.");
+  }
+  if (sampling_step <= 0. || cell_size_ <= 0.) {
+    throw std::invalid_argument("sampling_step and cell_size must be positive.");
+  }
+  for (int i = 0; i < road_geometry_->num_junctions(); ++i) {
+    const api::Junction* junction = road_geometry_->junction(i);
+    for (int j = 0; j < junction->num_segments(); ++j) {
+      const api::Segment* segment = junction->segment(j);
+      for (int k = 0; k < segment->num_lanes(); ++k) {
+        lanes_.push_back(segment->lane(k));
+      }
+    }
+  }
+  for (int lane_index = 0; lane_index < static_cast<int>(lanes_.size()); ++lane_index) {
+    const double length = lanes_[lane_index]->length();
+    const int num_chunks = std::max(1, static_cast<int>(std::ceil(length / sampling_step)));
+    for (int chunk = 0; chunk < num_chunks; ++chunk) {
+      boxes_.push_back(MakeBox(lane_index, length * chunk / num_chunks, length * (chunk + 1) / num_chunks));
+    }
+  }
+  for (int box_index = 0; box_index < static_cast<int>(boxes_.size()); ++box_index) {
+    const Box& box = boxes_[box_index];
+    for (std::int64_t x = ToCell(box.min.x()); x <= ToCell(box.max.x()); ++x) {
+      for (std::int64_t y = ToCell(box.min.y()); y <= ToCell(box.max.y()); ++y) {
+        cells_[{x, y}].push_back(box_index);
+        min_cell_ = {std::min(min_cell_.first, x), std::min(min_cell_.second, y)};
+        max_cell_ = {std::max(max_cell_.first, x), std::max(max_cell_.second, y)};
+      }
+    }
+  }
+}
+
+RoadGeometrySpatialIndex::Box RoadGeometrySpatialIndex::MakeBox(int lane_index, double s0, double s1) const {
+  // Number of pieces the chunk is sampled in along s.
+  constexpr int kNumPieces = 4;
+  const api::Lane* lane = lanes_[lane_index];
+  constexpr double kInfinity = std::numeric_limits<double>::infinity();
+  Box box{lane_index, math::Vector3(kInfinity, kInfinity, kInfinity),
+          math::Vector3(-kInfinity, -kInfinity, -kInfinity)};
+  // Longest distance between consecutive samples along s at the same r and h.
+  double max_step = 0.;
+  // Samples at the previous s, at each r and h.
+  std::vector<math::Vector3> previous;
+  std::vector<math::Vector3> current;
+  for (int piece = 0; piece <= kNumPieces; ++piece) {
+    const double s = s0 + (s1 - s0) * piece / kNumPieces;
+    const api::RBounds segment_bounds = lane->segment_bounds(s);
+    current.clear();
+    for (const double r : {segment_bounds.min(), 0., segment_bounds.max()}) {
+      const api::HBounds elevation_bounds = lane->elevation_bounds(s, r);
+      for (const double h : {elevation_bounds.min(), elevation_bounds.max()}) {
+        const math::Vector3 xyz = lane->ToInertialPosition(api::LanePosition(s, r, h)).xyz();
+        for (std::size_t i = 0; i < 3; ++i) {
+          box.min[i] = std::min(box.min[i], xyz[i]);
+          box.max[i] = std::max(box.max[i], xyz[i]);
+        }
+        if (!previous.empty()) {
+          max_step = std::max(max_step, (xyz - previous[current.size()]).norm());
+        }
+        current.push_back(xyz);
+      }
+    }
+    std::swap(previous, current);
+  }
+  // Between consecutive samples the lane bulges out of their box by no more than half the arc length in between,
+  // which stays below the chord between them unless the lane turns by over 200 degrees within a piece. Sampling both
+  // sides of the lane accounts for the outer edge of a curve being longer than the centerline.
+  const double margin = max_step + road_geometry_->linear_tolerance();
+  for (std::size_t i = 0; i < 3; ++i) {
+    box.min[i] -= margin;
+    box.max[i] += margin;
+  }
+  return box;
+}
+
+std::int64_t RoadGeometrySpatialIndex::ToCell(double coordinate) const {
+  return static_cast<std::int64_t>(std::floor(coordinate / cell_size_));
+}
+
+std::int64_t RoadGeometrySpatialIndex::ToClampedCell(double coordinate, std::int64_t min_cell,
+                                                     std::int64_t max_cell) const {
+  const double cell = std::floor(coordinate / cell_size_);
+  if (cell <= static_cast<double>(min_cell)) {
+    return min_cell;
+  }
+  if (cell >= static_cast<double>(max_cell)) {
+    return max_cell;
+  }
+  return static_cast<std::int64_t>(cell);
+}
+
+std::vector<api::RoadPositionResult> RoadGeometrySpatialIndex::FindRoadPositions(
+    const api::InertialPosition& inertial_position, double radius) const {
+  if (!std::isfinite(radius) || radius < 0.) {
+    throw std::invalid_argument("radius must be finite and non-negative.");
+  }
+  const math::Vector3& xyz = inertial_position.xyz();
+  if (!std::isfinite(xyz.x()) || !std::isfinite(xyz.y()) || !std::isfinite(xyz.z())) {
+    throw std::invalid_argument("inertial_position must be finite.");
+  }
+  std::vector<int> lane_indices;
+  // Only the cells spanned by the occupied ones are probed, however large the radius is.
+  const std::int64_t min_x = ToClampedCell(xyz.x() - radius, min_cell_.first, max_cell_.first);
+  const std::int64_t max_x = ToClampedCell(xyz.x() + radius, min_cell_.first, max_cell_.first);
+  const std::int64_t min_y = ToClampedCell(xyz.y() - radius, min_cell_.second, max_cell_.second);
+  const std::int64_t max_y = ToClampedCell(xyz.y() + radius, min_cell_.second, max_cell_.second);
+  for (std::int64_t x = min_x; x <= max_x && !cells_.empty(); ++x) {
+    for (std::int64_t y = min_y; y <= max_y; ++y) {
+      const auto cell_it = cells_.find({x, y});
+      if (cell_it == cells_.end()) {
+        continue;
+      }
+      for (const int box_index : cell_it->second) {
+        const Box& box = boxes_[box_index];
+        bool overlaps = true;
+        for (std::size_t i = 0; i < 3 && overlaps; ++i) {
+          overlaps = box.min[i] <= xyz[i] + radius && xyz[i] - radius <= box.max[i];
+        }
+        if (overlaps) {
+          lane_indices.push_back(box.lane_index);
+        }
+      }
+    }
+  }
+  std::sort(lane_indices.begin(), lane_indices.end());
+  lane_indices.erase(std::unique(lane_indices.begin(), lane_indices.end()), lane_indices.end());
+
+  std::vector<api::RoadPositionResult> results;
+  for (const int lane_index : lane_indices) {
+    const api::Lane* lane = lanes_[lane_index];
+    const api::LanePositionResult result = lane->ToSegmentPosition(inertial_position);
+    if (result.distance <= radius) {
+      results.push_back({api::RoadPosition(lane, result.lane_position), result.nearest_position, result.distance});
+    }
+  }
+  return results;
+}
+
+}  // namespace bindings
+}  // namespace maliput
@@ -0,0 +1,113 @@
+// BSD 3-Clause License
+//
+// Copyright (c) 2026, Woven by Toyota. All rights reserved.
+//
+// Redistribution and use in source and binary forms, with or without
+// modification, are permitted provided that the following conditions are met:
+//
+// * Redistributions of source code must retain the above copyright notice, this
+//   list of conditions and the following disclaimer.
+//
+// * Redistributions in binary form must reproduce the above copyright notice,
+//   this list of conditions and the following disclaimer in the documentation
+//   and/or other materials provided with the distribution.
+//
+// * Neither the name of the copyright holder nor the names of its
+//   contributors may be used to endorse or promote products derived from
+//   this software without specific prior written permission.
+//
+// THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+// AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+// IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+// DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+// FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+// DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+// SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+// CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+// OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+// OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+#pragma once
+
+#include <cstddef>
+#include <cstdint>
+#include <limits>
+#include <unordered_map>
+#include <utility>
+#include <vector>
+
+#include <maliput/api/lane.h>
+#include <maliput/api/lane_data.h>
+#include <maliput/api/road_geometry.h>
+#include <maliput/math/vector.h>
+
+namespace maliput {
+namespace bindings {
+
+// Accelerates api::RoadGeometry::FindRoadPositions() queries over large road geometries.
+//
+// Lanes are split in chunks no longer than a sampling step. The axis aligned bounding box of each chunk, including its
+// segment and elevation bounds, is registered in a uniform grid over the x-y plane. A query only evaluates the lanes
+// with a box that overlaps the query sphere's bounding box, so its cost depends on the local lane density instead of on
+// the size of the road geometry.
+//
+// The index is immutable once built, so it can be queried concurrently.
+class RoadGeometrySpatialIndex {
+ public:
+  // Builds the index.
+  //
+  // @param road_geometry The indexed road geometry. It must outlive this index.
+  // @param sampling_step Maximum s length of the lane chunks. Must be positive.
+  // @param cell_size Side length of the grid cells. Must be positive.
+  // @throws std::invalid_argument When `road_geometry` is nullptr or `sampling_step` or `cell_size` are not positive.
+  RoadGeometrySpatialIndex(const api::RoadGeometry* road_geometry, double sampling_step, double cell_size);
+
+  // Obtains the api::RoadPositionResult of every lane whose segment region is within `radius` of `inertial_position`,
+  // with the same semantics as api::RoadGeometry::FindRoadPositions(). Results are sorted by lane, in the order lanes
+  // are found when walking junctions, segments and lanes by index.
+  //
+  // @throws std::invalid_argument When `radius` is negative or not finite, or `inertial_position` is not finite.
+  std::vector<api::RoadPositionResult> FindRoadPositions(const api::InertialPosition& inertial_position,
+                                                         double radius) const;
+
+  const api::RoadGeometry* road_geometry() const { return road_geometry_; }
+
+  // Number of lane chunk boxes registered in the index.
+  int num_boxes() const { return static_cast<int>(boxes_.size()); }
+
+ private:
+  // Bounding box of a lane chunk.
+  struct Box {
+    // Position of the lane in `lanes_`.
+    int lane_index{};
+    math::Vector3 min;
+    math::Vector3 max;
+  };
+
+  using CellKey = std::pair<std::int64_t, std::int64_t>;
+
+  struct CellKeyHash {
+    std::size_t operator()(const CellKey& key) const {
+      return static_cast<std::size_t>(key.first * 73856093) ^ static_cast<std::size_t>(key.second * 19349663);
+    }
+  };
+
+  // Returns the bounding box of the chunk of `lane` in [`s0`, `s1`].
+  Box MakeBox(int lane_index, double s0, double s1) const;
+
+  std::int64_t ToCell(double coordinate) const;
+
+  // Returns the cell of `coordinate`, clamped to [`min_cell`, `max_cell`].
+  std::int64_t ToClampedCell(double coordinate, std::int64_t min_cell, std::int64_t max_cell) const;
+
+  const api::RoadGeometry* road_geometry_{};
+  double cell_size_{};
+  std::vector<const api::Lane*> lanes_;
+  std::vector<Box> boxes_;
+  std::unordered_map<CellKey, std::vector<int>, CellKeyHash> cells_;
+  // Lowest and highest x and y of the occupied cells.
+  CellKey min_cell_{std::numeric_limits<std::int64_t>::max(), std::numeric_limits<std::int64_t>::max()};
+  CellKey max_cell_{std::numeric_limits<std::int64_t>::min(), std::numeric_limits<std::int64_t>::min()};
+};
+
+}  // namespace bindings
+}  // namespace maliput
@@ -0,0 +1,566 @@
+// BSD 3-Clause License
+//
+// Copyright (c) 2026, Woven by Toyota. All rights reserved.
+//
+// Redistribution and use in source and binary forms, with or without
+// modification, are permitted provided that the following conditions are met:
+//
+// * Redistributions of source code must retain the above copyright notice, this
+//   list of conditions and the following disclaimer.
+//
+// * Redistributions in binary form must reproduce the above copyright notice,
+//   this list of conditions and the following disclaimer in the documentation
+//   and/or other materials provided with the distribution.
+//
+// * Neither the name of the copyright holder nor the names of its
+//   contributors may be used to endorse or promote products derived from
+//   this software without specific prior written permission.
+//
+// THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+// AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+// IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+// DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+// FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+// DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+// SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+// CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+// OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+// OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+#include "bindings/road_mesh.h"
+
+#include <algorithm>
+#include <cmath>
+#include <cstdio>
+#include <stdexcept>
+#include <utility>
+
+#include <maliput/api/junction.h>
+#include <maliput/api/lane.h>
+#include <maliput/api/lane_data.h>
+
+#include "bindings/parallel_for.h"
+
+namespace maliput {
+namespace bindings {
+namespace {
+
+// Diffuse color of each RoadMeshMaterial, by index.
+constexpr std::array<std::array<double, 3>, kNumRoadMeshMaterials> kDiffuseColors{{
+    {0.2, 0.2, 0.2},
+    {0.1, 0.1, 0.1},
+    {0.9, 0.9, 0.9},
+    {0.8, 0.8, 0.0},
+    {0.0, 0.0, 0.9},
+    {0.3, 0.6, 0.9},
+}};
+
+// Opacity of each RoadMeshMaterial, by index.
+constexpr std::array<double, kNumRoadMeshMaterials> kOpacities{1., 1., 0.2, 1., 0.5, 0.1};
+
+math::Vector3 Normalized(const math::Vector3& vector) {
+  const double norm = vector.norm();
+  return norm > 0. ? vector * (1. / norm) : math::Vector3(0., 0., 1.);
+}
+
+// Returns the number of cells of at most `grid_unit` needed to cover `extent`.
+int NumCells(double extent, double grid_unit) { return std::max(1, static_cast<int>(std::ceil(extent / grid_unit))); }
+
+// Returns the side of the grid cells of a `length` by `width` grid: no larger than `features.max_grid_unit` and with
+// at least `features.min_grid_resolution` cells along each direction.
+double GridUnit(double length, double width, const utility::ObjFeatures& features) {
+  double grid_unit = features.max_grid_unit;
+  if (features.min_grid_resolution > 0.) {
+    const double extent = std::min(length, width);
+    if (extent > 0.) {
+      grid_unit = std::min(grid_unit, extent / features.min_grid_resolution);
+    }
+  }
+  return grid_unit;
+}
+
+// Adds a `rows` by `cols` grid of `positions`, given row by row, to `mesh`. Normals are estimated from the neighbours
+// of each vertex. Rows are expected to advance along s and columns along r, so faces are counterclockwise when seen
+// from above the road.
+void AddGrid(const std::vector<math::Vector3>& positions, int rows, int cols, RoadMeshMaterial material,
+             RoadMesh* mesh) {
+  const int first_vertex = static_cast<int>(mesh->vertices.size());
+  const auto at = [&](int row, int col) -> const math::Vector3& { return positions[row * cols + col]; };
+  for (int row = 0; row < rows; ++row) {
+    for (int col = 0; col < cols; ++col) {
+      const math::Vector3 along_s = at(std::min(row + 1, rows - 1), col) - at(std::max(row - 1, 0), col);
+      const math::Vector3 along_r = at(row, std::min(col + 1, cols - 1)) - at(row, std::max(col - 1, 0));
+      mesh->vertices.push_back(at(row, col));
+      mesh->normals.push_back(Normalized(along_s.cross(along_r)));
+    }
+  }
+  for (int row = 0; row + 1 < rows; ++row) {
+    for (int col = 0; col + 1 < cols; ++col) {
+      const int vertex = first_vertex + row * cols + col;
+      mesh->faces.push_back({vertex, vertex + cols, vertex + cols + 1});
+      mesh->faces.push_back({vertex, vertex + cols + 1, vertex + 1});
+      mesh->face_materials.push_back(material);
+      mesh->face_materials.push_back(material);
+    }
+  }
+}
+
+// Adds a triangle with corners `a`, `b` and `c`, counterclockwise when seen from above, to `mesh`.
+void AddTriangle(const math::Vector3& a, const math::Vector3& b, const math::Vector3& c, RoadMeshMaterial material,
+                 RoadMesh* mesh) {
+  const int first_vertex = static_cast<int>(mesh->vertices.size());
+  const math::Vector3 normal = Normalized((b - a).cross(c - a));
+  for (const math::Vector3* vertex : {&a, &b, &c}) {
+    mesh->vertices.push_back(*vertex);
+    mesh->normals.push_back(normal);
+  }
+  mesh->faces.push_back({first_vertex, first_vertex + 1, first_vertex + 2});
+  mesh->face_materials.push_back(material);
+}
+
+// Returns the position of (`s`, `r`, `h`) on `lane` relative to `origin`.
+math::Vector3 ToMeshPosition(const api::Lane& lane, double s, double r, double h, const api::InertialPosition& origin) {
+  return lane.ToInertialPosition(api::LanePosition(s, r, h)).xyz() - origin.xyz();
+}
+
+// Adds a grid over `lane` between the r coordinates `r_bounds(s)` returns, at the elevation `h(s, r)` returns, to
+// `mesh`. The grid spans `num_r_cells` cells laterally and cells no longer than `grid_unit` along the lane.
+template <typename RBoundsFunction, typename HFunction>
+void AddLaneGrid(const api::Lane& lane, const RBoundsFunction& r_bounds, const HFunction& h, double grid_unit,
+                 int num_r_cells, RoadMeshMaterial material, const api::InertialPosition& origin, RoadMesh* mesh) {
+  const double length = lane.length();
+  const int rows = NumCells(length, grid_unit) + 1;
+  const int cols = num_r_cells + 1;
+  std::vector<math::Vector3> positions;
+  positions.reserve(rows * cols);
+  for (int row = 0; row < rows; ++row) {
+    const double s = length * row / (rows - 1);
+    const std::pair<double, double> r_range = r_bounds(s);
+    for (int col = 0; col < cols; ++col) {
+      const double r = r_range.first + (r_range.second - r_range.first) * col / (cols - 1);
+      positions.push_back(ToMeshPosition(lane, s, r, h(s, r), origin));
+    }
+  }
+  AddGrid(positions, rows, cols, material, mesh);
+}
+
+// Adds a stripe of `features.stripe_width` centered on the r coordinate `r_center(s)` of `lane` to `mesh`.
+template <typename RFunction>
+void AddStripe(const api::Lane& lane, const RFunction& r_center, double grid_unit, const utility::ObjFeatures& features,
+               RoadMesh* mesh) {
+  const double half_width = features.stripe_width / 2.;
+  AddLaneGrid(
+      lane,
+      [&](double s) {
+        const double r = r_center(s);
+        return std::make_pair(r - half_width, r + half_width);
+      },
+      [&](double, double) { return features.stripe_elevation; }, grid_unit, 1, RoadMeshMaterial::kMarkerPaint,
+      features.origin, mesh);
+}
+
+// Adds arrows pointing towards increasing s along the centerline of `lane` to `mesh`.
+void AddArrows(const api::Lane& lane, const utility::ObjFeatures& features, RoadMesh* mesh) {
+  const double length = lane.length();
+  const api::RBounds lane_bounds = lane.lane_bounds(length / 2.);
+  const double arrow_length = std::min(0.8 * (lane_bounds.max() - lane_bounds.min()), 0.5 * length);
+  if (arrow_length <= 0.) {
+    return;
+  }
+  const double half_length = arrow_length / 2.;
+  const double half_width = arrow_length / 4.;
+  const int num_arrows = std::max(1, static_cast<int>(length / (4. * arrow_length)));
+  const double h = features.arrow_elevation;
+  for (int i = 0; i < num_arrows; ++i) {
+    const double s = length * (i + 0.5) / num_arrows;
+    AddTriangle(ToMeshPosition(lane, s - half_length, -half_width, h, features.origin),
+                ToMeshPosition(lane, s + half_length, 0., h, features.origin),
+                ToMeshPosition(lane, s - half_length, half_width, h, features.origin), RoadMeshMaterial::kMarkerPaint,
+                mesh);
+  }
+}
+
+// Returns the widest segment bounds of `reference_lane` among its ends and middle.
+double SegmentWidth(const api::Lane& reference_lane) {
+  const double length = reference_lane.length();
+  double width = 0.;
+  for (const double s : {0., length / 2., length}) {
+    const api::RBounds segment_bounds = reference_lane.segment_bounds(s);
+    width = std::max(width, segment_bounds.max() - segment_bounds.min());
+  }
+  return width;
+}
+
+// Returns the width of the lane bounds of `lane` at its middle.
+double LaneWidth(const api::Lane& lane) {
+  const api::RBounds lane_bounds = lane.lane_bounds(lane.length() / 2.);
+  return lane_bounds.max() - lane_bounds.min();
+}
+
+// Returns the r coordinates `bounds` spans.
+std::pair<double, double> ToPair(const api::RBounds& bounds) { return {bounds.min(), bounds.max()}; }
+
+}  // namespace
+
+const char* RoadMeshMaterialName(RoadMeshMaterial material) {
+  switch (material) {
+    case RoadMeshMaterial::kAsphalt:
+      return "asphalt";
+    case RoadMeshMaterial::kGrayedAsphalt:
+      return "grayed_asphalt";
+    case RoadMeshMaterial::kLaneHaze:
+      return "lane_haze";
+    case RoadMeshMaterial::kMarkerPaint:
+      return "marker_paint";
+    case RoadMeshMaterial::kBranchPointGlow:
+      return "branch_point_glow";
+    case RoadMeshMaterial::kElevationBounds:
+      return "elevation_bounds";
+  }
+  throw std::invalid_argument("Unknown RoadMeshMaterial.");
+}
+
+void RoadMesh::Append(const RoadMesh& other) {
+  const int offset = static_cast<int>(vertices.size());
+  vertices.insert(vertices.end(), other.vertices.begin(), other.vertices.end());
+  normals.insert(normals.end(), other.normals.begin(), other.normals.end());
+  for (const std::array<int, 3>& face : other.faces) {
+    faces.push_back({face[0] + offset, face[1] + offset, face[2] + offset});
+  }
+  face_materials.insert(face_materials.end(), other.face_materials.begin(), other.face_materials.end());
+}
+
+std::size_t RoadMesh::memory_bytes() const {
+  return (vertices.capacity() + normals.capacity()) * sizeof(math::Vector3) +
+         faces.capacity() * sizeof(std::array<int, 3>) + face_materials.capacity() * sizeof(RoadMeshMaterial);
+}
+
+RoadMesh TessellateSegment(const api::Segment& segment, const utility::ObjFeatures& features, bool grayed) {
+  RoadMesh mesh;
+  if (segment.num_lanes() == 0) {
+    return mesh;
+  }
+  const api::Lane& reference_lane = *segment.lane(0);
+  const double width = SegmentWidth(reference_lane);
+  const double grid_unit = GridUnit(reference_lane.length(), width, features);
+  AddLaneGrid(
+      reference_lane, [&](double s) { return ToPair(reference_lane.segment_bounds(s)); },
+      [](double, double) { return 0.; }, grid_unit, NumCells(width, grid_unit),
+      grayed ? RoadMeshMaterial::kGrayedAsphalt : RoadMeshMaterial::kAsphalt, features.origin, &mesh);
+
+  for (int i = 0; i < segment.num_lanes(); ++i) {
+    const api::Lane& lane = *segment.lane(i);
+    const double lane_width = LaneWidth(lane);
+    const double lane_grid_unit = GridUnit(lane.length(), lane_width, features);
+    if (features.draw_lane_haze) {
+      AddLaneGrid(
+          lane, [&](double s) { return ToPair(lane.lane_bounds(s)); },
+          [&](double, double) { return features.lane_haze_elevation; }, lane_grid_unit,
+          NumCells(lane_width, lane_grid_unit), RoadMeshMaterial::kLaneHaze, features.origin, &mesh);
+    }
+    if (features.draw_elevation_bounds) {
+      // The upper elevation bound of the lane, as a translucent surface over it.
+      AddLaneGrid(
+          lane, [&](double s) { return ToPair(lane.lane_bounds(s)); },
+          [&](double s, double r) { return lane.elevation_bounds(s, r).max(); }, lane_grid_unit,
+          NumCells(lane_width, lane_grid_unit), RoadMeshMaterial::kElevationBounds, features.origin, &mesh);
+    }
+    if (features.draw_stripes) {
+      // Every lane draws its left boundary, and the first one its right boundary too.
+      AddStripe(lane, [&](double s) { return lane.lane_bounds(s).max(); }, lane_grid_unit, features, &mesh);
+      if (i == 0) {
+        AddStripe(lane, [&](double s) { return lane.lane_bounds(s).min(); }, lane_grid_unit, features, &mesh);
+      }
+    }
+    if (features.draw_arrows) {
+      AddArrows(lane, features, &mesh);
+    }
+  }
+  return mesh;
+}
+
+std::vector<double> SegmentGridUnits(const api::Segment& segment, const utility::ObjFeatures& features) {
+  std::vector<double> grid_units;
+  if (segment.num_lanes() == 0) {
+    return grid_units;
+  }
+  const api::Lane& reference_lane = *segment.lane(0);
+  grid_units.push_back(GridUnit(reference_lane.length(), SegmentWidth(reference_lane), features));
+  for (int i = 0; i < segment.num_lanes(); ++i) {
+    const api::Lane& lane = *segment.lane(i);
+    grid_units.push_back(GridUnit(lane.length(), LaneWidth(lane), features));
+  }
+  return grid_units;
+}
+
+RoadMesh TessellateBranchPoint(const api::BranchPoint& branch_point, const utility::ObjFeatures& features) {
+  RoadMesh mesh;
+  const api::LaneEndSet* lane_ends = branch_point.GetASide();
+  if (lane_ends == nullptr || lane_ends->size() == 0) {
+    lane_ends = branch_point.GetBSide();
+  }
+  if (lane_ends == nullptr || lane_ends->size() == 0) {
+    return mesh;
+  }
+  const api::LaneEnd& lane_end = lane_ends->get(0);
+  const double s = lane_end.end == api::LaneEnd::kStart ? 0. : lane_end.lane->length();
+  const math::Vector3 center = ToMeshPosition(*lane_end.lane, s, 0., features.branch_point_elevation, features.origin);
+  const double half_side = features.branch_point_height / 2.;
+  const math::Vector3 corners[4] = {
+      center + math::Vector3(-half_side, -half_side, 0.), center + math::Vector3(half_side, -half_side, 0.),
+      center + math::Vector3(half_side, half_side, 0.), center + math::Vector3(-half_side, half_side, 0.)};
+  AddTriangle(corners[0], corners[1], corners[2], RoadMeshMaterial::kBranchPointGlow, &mesh);
+  AddTriangle(corners[0], corners[2], corners[3], RoadMeshMaterial::kBranchPointGlow, &mesh);
+  return mesh;
+}
+
+void ValidateRoadMeshFeatures(const utility::ObjFeatures& features) {
+  if (!std::isfinite(features.max_grid_unit) || features.max_grid_unit <= 0.) {
+    throw std::invalid_argument("max_grid_unit must be positive and finite.");
+  }
+  if (!std::isfinite(features.min_grid_resolution) || features.min_grid_resolution < 0.) {
+    throw std::invalid_argument("min_grid_resolution must be non-negative and finite.");
+  }
+  if (features.off_grid_mesh_generation) {
+    throw std::invalid_argument("off_grid_mesh_generation is not supported.");
+  }
+  if (features.simplify_mesh_threshold != 0.) {
+    throw std::invalid_argument("simplify_mesh_threshold is not supported.");
+  }
+}
+
+bool IsGrayed(const api::SegmentId& segment_id, const utility::ObjFeatures& features) {
+  return !features.highlighted_segments.empty() &&
+         std::find(features.highlighted_segments.begin(), features.highlighted_segments.end(), segment_id) ==
+             features.highlighted_segments.end();
+}
+
+ObjFileWriter::ObjFileWriter(const std::string& dirpath, const std::string& fileroot) {
+  const std::string path_root = dirpath + "/" + fileroot;
+  std::ofstream mtl_file(path_root + ".mtl");
+  if (!mtl_file) {
+    throw std::runtime_error("Cannot create " + path_root + ".mtl");
+  }
+  for (int i = 0; i < kNumRoadMeshMaterials; ++i) {
+    const std::array<double, 3>& diffuse = kDiffuseColors[i];
+    mtl_file << "newmtl " << RoadMeshMaterialName(static_cast<RoadMeshMaterial>(i)) << "\n"
+             << "Ka " << diffuse[0] << " " << diffuse[1] << " " << diffuse[2] << "\n"
+             << "Kd " << diffuse[0] << " " << diffuse[1] << " " << diffuse[2] << "\n"
+             << "Ks 0.5 0.5 0.5\nNs 10\nillum 2\n"
+             << "d " << kOpacities[i] << "\n\n";
+  }
+  if (!mtl_file) {
+    throw std::runtime_error("Cannot write " + path_root + ".mtl");
+  }
+  obj_file_.open(path_root + ".obj");
+  if (!obj_file_) {
+    throw std::runtime_error("Cannot create " + path_root + ".obj");
+  }
+  obj_file_ << "# Generated by maliput_py\nmtllib " << fileroot << ".mtl\n";
+}
+
+void ObjFileWriter::Write(const std::string& name, const RoadMesh& mesh) {
+  if (mesh.faces.empty()) {
+    return;
+  }
+  std::string buffer = "o " + name + "\n";
+  char line[128];
+  const auto append_vector = [&](const char* prefix, const math::Vector3& vector) {
+    const int size =
+        std::snprintf(line, sizeof(line), "%s %.6f %.6f %.6f\n", prefix, vector.x(), vector.y(), vector.z());
+    buffer.append(line, size);
+  };
+  for (const math::Vector3& vertex : mesh.vertices) {
+    append_vector("v", vertex);
+  }
+  for (const math::Vector3& normal : mesh.normals) {
+    append_vector("vn", normal);
+  }
+  const RoadMeshMaterial* current_material = nullptr;
+  for (std::size_t i = 0; i < mesh.faces.size(); ++i) {
+    if (current_material == nullptr || *current_material != mesh.face_materials[i]) {
+      current_material = &mesh.face_materials[i];
+      buffer.append("usemtl ").append(RoadMeshMaterialName(*current_material)).append("\n");
+    }
+    const std::array<int, 3>& face = mesh.faces[i];
+    const std::size_t a = num_vertices_ + face[0] + 1;
+    const std::size_t b = num_vertices_ + face[1] + 1;
+    const std::size_t c = num_vertices_ + face[2] + 1;
+    const int size = std::snprintf(line, sizeof(line), "f %zu//%zu %zu//%zu %zu//%zu\n", a, a, b, b, c, c);
+    buffer.append(line, size);
+  }
+  obj_file_ << buffer;
+  if (!obj_file_) {
+    throw std::runtime_error("Cannot write the OBJ file.");
+  }
+  num_vertices_ += mesh.vertices.size();
+}
+
+void GenerateRoadMeshObjFile(const api::RoadGeometry& road_geometry, const std::string& dirpath,
+                             const std::string& fileroot, const utility::ObjFeatures& features, int num_threads,
+                             int batch_size, const std::function<void(int, int)>& progress) {
+  if (batch_size <= 0) {
+    throw std::invalid_argument("batch_size must be positive.");
+  }
+  ValidateRoadMeshFeatures(features);
+  const RoadMeshItems items(road_geometry, features);
+  ObjFileWriter writer(dirpath, fileroot);
+  std::vector<RoadMesh> meshes;
+  for (int first = 0; first < items.size(); first += batch_size) {
+    const int count = std::min(batch_size, items.size() - first);
+    meshes.assign(count, RoadMesh());
+    ParallelFor(count, num_threads, [&](int i) { meshes[i] = items.Tessellate(first + i, features); });
+    for (int i = 0; i < count; ++i) {
+      writer.Write(items.name(first + i), meshes[i]);
+    }
+    if (progress) {
+      progress(first + count, items.size());
+    }
+  }
+}
+
+RoadMeshItems::RoadMeshItems(const api::RoadGeometry& road_geometry, const utility::ObjFeatures& features) {
+  for (int i = 0; i < road_geometry.num_junctions(); ++i) {
+    const api::Junction* junction = road_geometry.junction(i);
+    for (int j = 0; j < junction->num_segments(); ++j) {
+      segments_.push_back(junction->segment(j));
+    }
+  }
+  if (features.draw_branch_points) {
+    for (int i = 0; i < road_geometry.num_branch_points(); ++i) {
+      branch_points_.push_back(road_geometry.branch_point(i));
+    }
+  }
+}
+
+const api::Segment* RoadMeshItems::segment(int index) const {
+  return index < static_cast<int>(segments_.size()) ? segments_[index] : nullptr;
+}
+
+RoadMesh RoadMeshItems::Tessellate(int index, const utility::ObjFeatures& features) const {
+  const int num_segments = static_cast<int>(segments_.size());
+  return index < num_segments
+             ? TessellateSegment(*segments_[index], features, IsGrayed(segments_[index]->id(), features))
+             : TessellateBranchPoint(*branch_points_[index - num_segments], features);
+}
+
+std::vector<double> RoadMeshItems::GridUnits(int index, const utility::ObjFeatures& features) const {
+  const int num_segments = static_cast<int>(segments_.size());
+  return index < num_segments ? SegmentGridUnits(*segments_[index], features) : std::vector<double>{};
+}
+
+std::string RoadMeshItems::name(int index) const {
+  const int num_segments = static_cast<int>(segments_.size());
+  return index < num_segments ? segments_[index]->id().string()
+                              : "branch_point_" + branch_points_[index - num_segments]->id().string();
+}
+
+RoadMesh AssembleRoadMesh(const RoadMeshItems& items, const std::vector<const RoadMesh*>& meshes,
+                          std::vector<std::string>* object_names, std::vector<int>* object_face_offsets) {
+  RoadMesh mesh;
+  std::size_t num_vertices = 0;
+  std::size_t num_faces = 0;
+  for (const RoadMesh* item_mesh : meshes) {
+    num_vertices += item_mesh->vertices.size();
+    num_faces += item_mesh->faces.size();
+  }
+  mesh.vertices.reserve(num_vertices);
+  mesh.normals.reserve(num_vertices);
+  mesh.faces.reserve(num_faces);
+  mesh.face_materials.reserve(num_faces);
+  if (object_names != nullptr) {
+    object_names->clear();
+  }
+  if (object_face_offsets != nullptr) {
+    object_face_offsets->assign(1, 0);
+  }
+  for (int i = 0; i < items.size(); ++i) {
+    if (meshes[i]->faces.empty()) {
+      continue;
+    }
+    mesh.Append(*meshes[i]);
+    if (object_names != nullptr) {
+      object_names->push_back(items.name(i));
+    }
+    if (object_face_offsets != nullptr) {
+      object_face_offsets->push_back(static_cast<int>(mesh.faces.size()));
+    }
+  }
+  return mesh;
+}
+
+RoadMesh GenerateRoadMesh(const api::RoadGeometry& road_geometry, const utility::ObjFeatures& features, int num_threads,
+                          std::vector<std::string>* object_names, std::vector<int>* object_face_offsets) {
+  ValidateRoadMeshFeatures(features);
+  const RoadMeshItems items(road_geometry, features);
+  std::vector<RoadMesh> meshes(items.size());
+  ParallelFor(items.size(), num_threads, [&](int i) { meshes[i] = items.Tessellate(i, features); });
+  std::vector<const RoadMesh*> mesh_pointers;
+  mesh_pointers.reserve(meshes.size());
+  for (const RoadMesh& mesh : meshes) {
+    mesh_pointers.push_back(&mesh);
+  }
+  return AssembleRoadMesh(items, mesh_pointers, object_names, object_face_offsets);
+}
+
+std::vector<RoadMesh> GenerateRoadMeshLods(const api::RoadGeometry& road_geometry, const utility::ObjFeatures& features,
+                                           const std::vector<double>& max_grid_units, int num_threads,
+                                           std::vector<std::vector<std::string>>* object_names,
+                                           std::vector<std::vector<int>>* object_face_offsets) {
+  if (max_grid_units.empty()) {
+    throw std::invalid_argument("max_grid_units must not be empty.");
+  }
+  const int num_levels = static_cast<int>(max_grid_units.size());
+  std::vector<utility::ObjFeatures> level_features(num_levels, features);
+  for (int level = 0; level < num_levels; ++level) {
+    level_features[level].max_grid_unit = max_grid_units[level];
+    ValidateRoadMeshFeatures(level_features[level]);
+  }
+  const RoadMeshItems items(road_geometry, features);
+  const int num_items = items.size();
+  const int num_level_items = num_levels * num_items;
+  std::vector<std::vector<double>> grid_units(num_level_items);
+  ParallelFor(num_level_items, num_threads,
+              [&](int i) { grid_units[i] = items.GridUnits(i % num_items, level_features[i / num_items]); });
+
+  // Levels only differ in their max_grid_unit, so an item tessellates alike at every level it samples with the same
+  // grid units. Each item is tessellated at the first of those levels and the others share its mesh.
+  std::vector<int> sources(num_level_items);
+  std::vector<int> tessellated;
+  for (int i = 0; i < num_level_items; ++i) {
+    sources[i] = i;
+    for (int j = i % num_items; j < i; j += num_items) {
+      if (grid_units[j] == grid_units[i]) {
+        sources[i] = sources[j];
+        break;
+      }
+    }
+    if (sources[i] == i) {
+      tessellated.push_back(i);
+    }
+  }
+  std::vector<RoadMesh> item_meshes(num_level_items);
+  ParallelFor(static_cast<int>(tessellated.size()), num_threads, [&](int k) {
+    const int i = tessellated[k];
+    item_meshes[i] = items.Tessellate(i % num_items, level_features[i / num_items]);
+  });
+
+  std::vector<RoadMesh> meshes(num_levels);
+  if (object_names != nullptr) {
+    object_names->resize(num_levels);
+  }
+  if (object_face_offsets != nullptr) {
+    object_face_offsets->resize(num_levels);
+  }
+  std::vector<const RoadMesh*> mesh_pointers(num_items);
+  for (int level = 0; level < num_levels; ++level) {
+    for (int i = 0; i < num_items; ++i) {
+      mesh_pointers[i] = &item_meshes[sources[level * num_items + i]];
+    }
+    meshes[level] = AssembleRoadMesh(items, mesh_pointers, object_names ? &(*object_names)[level] : nullptr,
+                                     object_face_offsets ? &(*object_face_offsets)[level] : nullptr);
+  }
+  return meshes;
+}
+
+}  // namespace bindings
+}  // namespace maliput
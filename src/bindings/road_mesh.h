@@ -0,0 +1,203 @@
+// BSD 3-Clause License
+//
+// Copyright (c) 2026, Woven by Toyota. All rights reserved.
+//
+// Redistribution and use in source and binary forms, with or without
+// modification, are permitted provided that the following conditions are met:
+//
+// * Redistributions of source code must retain the above copyright notice, this
+//   list of conditions and the following disclaimer.
+//
+// * Redistributions in binary form must reproduce the above copyright notice,
+//   this list of conditions and the following disclaimer in the documentation
+//   and/or other materials provided with the distribution.
+//
+// * Neither the name of the copyright holder nor the names of its
+//   contributors may be used to endorse or promote products derived from
+//   this software without specific prior written permission.
+//
+// THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+// AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+// IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+// DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+// FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+// DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+// SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+// CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+// OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+// OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+#pragma once
+
+#include <array>
+#include <cstddef>
+#include <fstream>
+#include <functional>
+#include <string>
+#include <vector>
+
+#include <maliput/api/branch_point.h>
+#include <maliput/api/road_geometry.h>
+#include <maliput/api/segment.h>
+#include <maliput/math/vector.h>
+#include <maliput/utility/generate_obj.h>
+
+namespace maliput {
+namespace bindings {
+
+// Materials of the faces of a RoadMesh.
+enum class RoadMeshMaterial {
+  kAsphalt = 0,
+  kGrayedAsphalt,
+  kLaneHaze,
+  kMarkerPaint,
+  kBranchPointGlow,
+  kElevationBounds,
+};
+
+// Number of RoadMeshMaterials.
+constexpr int kNumRoadMeshMaterials = 6;
+
+// Returns the name of `material` in MTL files.
+const char* RoadMeshMaterialName(RoadMeshMaterial material);
+
+// Triangle mesh with per vertex normals and per face materials. Positions are relative to the origin of the
+// utility::ObjFeatures the mesh was built with.
+struct RoadMesh {
+  // Appends the vertices and faces of `other`.
+  void Append(const RoadMesh& other);
+
+  // Approximate heap memory taken by the mesh, in bytes.
+  std::size_t memory_bytes() const;
+
+  std::vector<math::Vector3> vertices;
+  std::vector<math::Vector3> normals;
+  // Indices into `vertices` of the corners of each face, counterclockwise when seen from above the road.
+  std::vector<std::array<int, 3>> faces;
+  // RoadMeshMaterial of each face.
+  std::vector<RoadMeshMaterial> face_materials;
+};
+
+// Tessellates `segment` into a mesh of its road surface and, as enabled by `features`, the haze, upper elevation
+// bounds, stripes and arrows of its lanes.
+//
+// The road surface spans the segment bounds of the segment's first lane. Its grid cells are no larger than
+// `features.max_grid_unit` and there are at least `features.min_grid_resolution` of them along each direction. The
+// surface uses RoadMeshMaterial::kGrayedAsphalt when `grayed` and RoadMeshMaterial::kAsphalt otherwise.
+RoadMesh TessellateSegment(const api::Segment& segment, const utility::ObjFeatures& features, bool grayed);
+
+// Returns a mesh of a square marker of side `features.branch_point_height`, `features.branch_point_elevation` above
+// the lane ends that meet at `branch_point`.
+RoadMesh TessellateBranchPoint(const api::BranchPoint& branch_point, const utility::ObjFeatures& features);
+
+// Returns the grid units TessellateSegment() samples `segment` with under `features`: that of its road surface
+// followed by that of each of its lanes. Features that only differ in their max_grid_unit tessellate `segment` alike
+// when they give the same grid units.
+std::vector<double> SegmentGridUnits(const api::Segment& segment, const utility::ObjFeatures& features);
+
+// Checks that `features` can be tessellated into RoadMeshes.
+//
+// RoadMeshes are a separate, approximate tessellation rather than the meshes utility::GenerateObjFile() builds: they
+// sample their own grids, use their own materials and glyph shapes, draw elevation bounds as the upper bound of each
+// lane only, and support neither off grid mesh generation nor mesh simplification.
+//
+// @throws std::invalid_argument When `features.max_grid_unit` is not positive and finite,
+// `features.min_grid_resolution` is negative or not finite, `features.off_grid_mesh_generation` is set or
+// `features.simplify_mesh_threshold` is not zero.
+void ValidateRoadMeshFeatures(const utility::ObjFeatures& features);
+
+// Returns whether the segment identified by `segment_id` is drawn grayed out, which happens when
+// `features.highlighted_segments` is not empty and does not contain it.
+bool IsGrayed(const api::SegmentId& segment_id, const utility::ObjFeatures& features);
+
+// Segments and branch points of a road geometry that are tessellated under some utility::ObjFeatures, in the order
+// they are found in the road geometry: segments first, junction by junction, then branch points.
+class RoadMeshItems {
+ public:
+  // Lists the items of `road_geometry`, which must outlive this object. Branch points are listed only when
+  // `features.draw_branch_points`.
+  RoadMeshItems(const api::RoadGeometry& road_geometry, const utility::ObjFeatures& features);
+
+  int size() const { return static_cast<int>(segments_.size() + branch_points_.size()); }
+
+  // Returns the `index`-th item when it is a segment, nullptr otherwise.
+  const api::Segment* segment(int index) const;
+
+  // Returns the mesh of the `index`-th item under `features`.
+  RoadMesh Tessellate(int index, const utility::ObjFeatures& features) const;
+
+  // Returns the SegmentGridUnits() of the `index`-th item under `features` when it is a segment, and no grid units
+  // otherwise, since branch points are not sampled on a grid.
+  std::vector<double> GridUnits(int index, const utility::ObjFeatures& features) const;
+
+  // Returns the object name of the `index`-th item in OBJ files.
+  std::string name(int index) const;
+
+ private:
+  std::vector<const api::Segment*> segments_;
+  std::vector<const api::BranchPoint*> branch_points_;
+};
+
+// Streams RoadMeshes to a Wavefront OBJ file as named objects, and writes its MTL file.
+class ObjFileWriter {
+ public:
+  // Creates `dirpath`/`fileroot`.obj and `dirpath`/`fileroot`.mtl.
+  //
+  // @throws std::runtime_error When the files cannot be created.
+  ObjFileWriter(const std::string& dirpath, const std::string& fileroot);
+
+  // Appends `mesh` as an object named `name`.
+  //
+  // @throws std::runtime_error When writing fails.
+  void Write(const std::string& name, const RoadMesh& mesh);
+
+ private:
+  std::ofstream obj_file_;
+  // Number of vertices written so far.
+  std::size_t num_vertices_{0};
+};
+
+// Tessellates the segments and branch points of `road_geometry` into RoadMeshes, using up to `num_threads` threads,
+// and streams the meshes to `dirpath`/`fileroot`.obj in batches of `batch_size` segments or
+// branch points. Meshes are written in the order segments and branch points are found in `road_geometry`, so the
+// output does not depend on the number of threads, and at most one batch of meshes is held in memory.
+//
+// @param progress Called from the calling thread after each batch is written with the number of segments and branch
+// points written so far and their total. Exceptions it throws abort the export.
+// @throws std::invalid_argument When `batch_size` is not positive or ValidateRoadMeshFeatures() rejects `features`.
+void GenerateRoadMeshObjFile(const api::RoadGeometry& road_geometry, const std::string& dirpath,
+                             const std::string& fileroot, const utility::ObjFeatures& features, int num_threads,
+                             int batch_size, const std::function<void(int, int)>& progress);
+
+// Merges `meshes`, the meshes of each of `items`, into a single mesh. Items without faces are skipped.
+//
+// @param object_names When not nullptr, set to the names of the items in the mesh.
+// @param object_face_offsets When not nullptr, set to the index of the first face of each item in the mesh, followed
+// by the number of faces.
+RoadMesh AssembleRoadMesh(const RoadMeshItems& items, const std::vector<const RoadMesh*>& meshes,
+                          std::vector<std::string>* object_names, std::vector<int>* object_face_offsets);
+
+// Tessellates the segments and branch points of `road_geometry` as GenerateRoadMeshObjFile() does, using up to
+// `num_threads` threads, and assembles the result with AssembleRoadMesh().
+//
+// @throws std::invalid_argument When ValidateRoadMeshFeatures() rejects `features`.
+RoadMesh GenerateRoadMesh(const api::RoadGeometry& road_geometry, const utility::ObjFeatures& features, int num_threads,
+                          std::vector<std::string>* object_names, std::vector<int>* object_face_offsets);
+
+// Generates the meshes GenerateRoadMesh() would at several levels of detail, using each of `max_grid_units` in place of
+// `features.max_grid_unit`, and assembles each level with AssembleRoadMesh(). Items are listed once, and an item is
+// tessellated once for all the levels at which it has the same GridUnits(), e.g. every branch point and the segments
+// whose grid units `features.min_grid_resolution` bounds; those levels share its mesh. Levels with different grid units
+// are sampled independently, as GenerateRoadMesh() would. Tessellations are distributed among up to `num_threads`
+// threads.
+//
+// @param object_names When not nullptr, set to the object names of each level.
+// @param object_face_offsets When not nullptr, set to the object face offsets of each level.
+// @throws std::invalid_argument When `max_grid_units` is empty or ValidateRoadMeshFeatures() rejects the features of
+// any level.
+std::vector<RoadMesh> GenerateRoadMeshLods(const api::RoadGeometry& road_geometry, const utility::ObjFeatures& features,
+                                           const std::vector<double>& max_grid_units, int num_threads,
+                                           std::vector<std::vector<std::string>>* object_names,
+                                           std::vector<std::vector<int>>* object_face_offsets);
+
+}  // namespace bindings
+}  // namespace maliput
@@ -0,0 +1,154 @@
+// BSD 3-Clause License
+//
+// Copyright (c) 2026, Woven by Toyota. All rights reserved.
+//
+// Redistribution and use in source and binary forms, with or without
+// modification, are permitted provided that the following conditions are met:
+//
+// * Redistributions of source code must retain the above copyright notice, this
+//   list of conditions and the following disclaimer.
+//
+// * Redistributions in binary form must reproduce the above copyright notice,
+//   this list of conditions and the following disclaimer in the documentation
+//   and/or other materials provided with the distribution.
+//
+// * Neither the name of the copyright holder nor the names of its
+//   contributors may be used to endorse or promote products derived from
+//   this software without specific prior written permission.
+//
+// THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+// AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+// IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+// DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+// FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+// DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+// SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+// CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+// OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+// OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+#include "bindings/road_mesh_cache.h"
+
+#include "bindings/parallel_for.h"
+
+namespace maliput {
+namespace bindings {
+
+RoadMeshCache::RoadMeshCache(const api::RoadGeometry& road_geometry, std::size_t max_memory_bytes)
+    : road_geometry_(road_geometry), max_memory_bytes_(max_memory_bytes) {}
+
+RoadMesh RoadMeshCache::Generate(const utility::ObjFeatures& features, int num_threads,
+                                 std::vector<std::string>* object_names, std::vector<int>* object_face_offsets) {
+  ValidateRoadMeshFeatures(features);
+  const RoadMeshItems items(road_geometry_, features);
+  std::vector<TileKey> keys(items.size());
+  std::vector<std::shared_ptr<const RoadMesh>> meshes(items.size());
+  std::vector<int> missing;
+  {
+    std::lock_guard<std::mutex> lock(mutex_);
+    for (int i = 0; i < items.size(); ++i) {
+      keys[i] = MakeKey(items, i, features);
+      const auto it = tiles_.find(keys[i]);
+      if (it == tiles_.end()) {
+        missing.push_back(i);
+        continue;
+      }
+      meshes[i] = it->second.mesh;
+      lru_.splice(lru_.begin(), lru_, it->second.lru_position);
+    }
+    num_hits_ += items.size() - missing.size();
+    num_misses_ += missing.size();
+  }
+
+  ParallelFor(static_cast<int>(missing.size()), num_threads, [&](int i) {
+    meshes[missing[i]] = std::make_shared<const RoadMesh>(items.Tessellate(missing[i], features));
+  });
+
+  {
+    std::lock_guard<std::mutex> lock(mutex_);
+    for (const int i : missing) {
+      // Another call may have cached the same tile meanwhile.
+      if (tiles_.count(keys[i]) != 0) {
+        continue;
+      }
+      lru_.push_front(keys[i]);
+      tiles_.emplace(keys[i], Tile{meshes[i], lru_.begin()});
+      memory_bytes_ += meshes[i]->memory_bytes();
+    }
+    Evict();
+  }
+
+  std::vector<const RoadMesh*> mesh_pointers;
+  mesh_pointers.reserve(meshes.size());
+  for (const std::shared_ptr<const RoadMesh>& mesh : meshes) {
+    mesh_pointers.push_back(mesh.get());
+  }
+  return AssembleRoadMesh(items, mesh_pointers, object_names, object_face_offsets);
+}
+
+void RoadMeshCache::Clear() {
+  std::lock_guard<std::mutex> lock(mutex_);
+  tiles_.clear();
+  lru_.clear();
+  memory_bytes_ = 0;
+}
+
+std::size_t RoadMeshCache::memory_bytes() const {
+  std::lock_guard<std::mutex> lock(mutex_);
+  return memory_bytes_;
+}
+
+std::size_t RoadMeshCache::num_tiles() const {
+  std::lock_guard<std::mutex> lock(mutex_);
+  return tiles_.size();
+}
+
+std::size_t RoadMeshCache::num_hits() const {
+  std::lock_guard<std::mutex> lock(mutex_);
+  return num_hits_;
+}
+
+std::size_t RoadMeshCache::num_misses() const {
+  std::lock_guard<std::mutex> lock(mutex_);
+  return num_misses_;
+}
+
+RoadMeshCache::TileKey RoadMeshCache::MakeKey(const RoadMeshItems& items, int index,
+                                              const utility::ObjFeatures& features) {
+  const math::Vector3& origin = features.origin.xyz();
+  const api::Segment* segment = items.segment(index);
+  if (segment == nullptr) {
+    return {static_cast<double>(index),
+            features.branch_point_elevation,
+            features.branch_point_height,
+            origin.x(),
+            origin.y(),
+            origin.z()};
+  }
+  return {static_cast<double>(index),
+          static_cast<double>(IsGrayed(segment->id(), features)),
+          features.max_grid_unit,
+          features.min_grid_resolution,
+          static_cast<double>(features.draw_stripes),
+          static_cast<double>(features.draw_arrows),
+          static_cast<double>(features.draw_lane_haze),
+          static_cast<double>(features.draw_elevation_bounds),
+          features.stripe_width,
+          features.stripe_elevation,
+          features.arrow_elevation,
+          features.lane_haze_elevation,
+          origin.x(),
+          origin.y(),
+          origin.z()};
+}
+
+void RoadMeshCache::Evict() {
+  while (memory_bytes_ > max_memory_bytes_ && !lru_.empty()) {
+    const auto it = tiles_.find(lru_.back());
+    memory_bytes_ -= it->second.mesh->memory_bytes();
+    tiles_.erase(it);
+    lru_.pop_back();
+  }
+}
+
+}  // namespace bindings
+}  // namespace maliput
@@ -0,0 +1,105 @@
+// BSD 3-Clause License
+//
+// Copyright (c) 2026, Woven by Toyota. All rights reserved.
+//
+// Redistribution and use in source and binary forms, with or without
+// modification, are permitted provided that the following conditions are met:
+//
+// * Redistributions of source code must retain the above copyright notice, this
+//   list of conditions and the following disclaimer.
+//
+// * Redistributions in binary form must reproduce the above copyright notice,
+//   this list of conditions and the following disclaimer in the documentation
+//   and/or other materials provided with the distribution.
+//
+// * Neither the name of the copyright holder nor the names of its
+//   contributors may be used to endorse or promote products derived from
+//   this software without specific prior written permission.
+//
+// THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+// AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+// IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+// DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+// FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+// DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+// SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+// CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+// OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+// OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+#pragma once
+
+#include <cstddef>
+#include <list>
+#include <map>
+#include <memory>
+#include <mutex>
+#include <string>
+#include <vector>
+
+#include <maliput/api/road_geometry.h>
+#include <maliput/utility/generate_obj.h>
+
+#include "bindings/road_mesh.h"
+
+namespace maliput {
+namespace bindings {
+
+// Caches the meshes of the segments and branch points of a road geometry as tiles keyed by the utility::ObjFeatures
+// fields they depend on, so generating the mesh again under different features only tessellates the items those
+// changes affect. Changing `highlighted_segments`, for instance, only regenerates the segments that become grayed or
+// stop being grayed.
+//
+// Tiles are evicted in least recently used order once their memory exceeds a budget. This class is thread safe.
+class RoadMeshCache {
+ public:
+  // Creates an empty cache for `road_geometry`, which must outlive it, holding up to `max_memory_bytes` of tiles.
+  RoadMeshCache(const api::RoadGeometry& road_geometry, std::size_t max_memory_bytes);
+
+  // Returns the mesh GenerateRoadMesh() returns for the road geometry, tessellating the items that are not cached
+  // under `features` with up to `num_threads` threads.
+  //
+  // @throws std::invalid_argument When ValidateRoadMeshFeatures() rejects `features`.
+  RoadMesh Generate(const utility::ObjFeatures& features, int num_threads, std::vector<std::string>* object_names,
+                    std::vector<int>* object_face_offsets);
+
+  // Drops all tiles.
+  void Clear();
+
+  const api::RoadGeometry& road_geometry() const { return road_geometry_; }
+  std::size_t max_memory_bytes() const { return max_memory_bytes_; }
+  // Memory taken by the cached tiles, in bytes.
+  std::size_t memory_bytes() const;
+  std::size_t num_tiles() const;
+  // Number of tiles found in the cache and tessellated by Generate() so far.
+  std::size_t num_hits() const;
+  std::size_t num_misses() const;
+
+ private:
+  // Item index followed by the features the item's mesh depends on.
+  using TileKey = std::vector<double>;
+
+  struct Tile {
+    std::shared_ptr<const RoadMesh> mesh;
+    // Position in `lru_`.
+    std::list<TileKey>::iterator lru_position;
+  };
+
+  // Returns the key of the tile of the `index`-th of `items` under `features`.
+  static TileKey MakeKey(const RoadMeshItems& items, int index, const utility::ObjFeatures& features);
+
+  // Evicts least recently used tiles until they fit in the memory budget.
+  void Evict();
+
+  const api::RoadGeometry& road_geometry_;
+  const std::size_t max_memory_bytes_;
+  mutable std::mutex mutex_;
+  std::map<TileKey, Tile> tiles_;
+  // Tile keys, most recently used first.
+  std::list<TileKey> lru_;
+  std::size_t memory_bytes_{0};
+  std::size_t num_hits_{0};
+  std::size_t num_misses_{0};
+};
+
+}  // namespace bindings
+}  // namespace maliput
@@ -0,0 +1,109 @@
+// BSD 3-Clause License
+//
+// Copyright (c) 2026, Woven by Toyota. All rights reserved.
+//
+// Redistribution and use in source and binary forms, with or without
+// modification, are permitted provided that the following conditions are met:
+//
+// * Redistributions of source code must retain the above copyright notice, this
+//   list of conditions and the following disclaimer.
+//
+// * Redistributions in binary form must reproduce the above copyright notice,
+//   this list of conditions and the following disclaimer in the documentation
+//   and/or other materials provided with the distribution.
+//
+// * Neither the name of the copyright holder nor the names of its
+//   contributors may be used to endorse or promote products derived from
+//   this software without specific prior written permission.
+//
+// THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+// AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+// IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+// DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+// FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+// DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+// SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+// CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+// OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+// OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+#include "bindings/road_position_tracker.h"
+
+#include <algorithm>
+#include <stdexcept>
+#include <string>
+
+#include <maliput/api/branch_point.h>
+
+namespace maliput {
+namespace bindings {
+
+RoadPositionTracker::RoadPositionTracker(const api::RoadGeometry* road_geometry, int num_agents)
+    : road_geometry_(road_geometry) {
+  if (road_geometry_ == nullptr) {
+    throw std::invalid_argument("road_geometry must not be nullptr.");
+  }
+  if (num_agents < 0) {
+    throw std::invalid_argument("num_agents must not be negative.");
+  }
+  linear_tolerance_ = road_geometry_->linear_tolerance();
+  hints_.assign(num_agents, nullptr);
+}
+
+api::RoadPositionResult RoadPositionTracker::Update(int agent, const api::InertialPosition& inertial_position) {
+  if (agent < 0 || agent >= num_agents()) {
+    throw std::out_of_range("agent " + std::to_string(agent) + " is out of range.");
+  }
+  const api::Lane* hint = hints_[agent];
+  api::RoadPositionResult result;
+  const bool found = hint != nullptr && (TryLane(hint, inertial_position, &result) ||
+                                         TryLane(hint->to_left(), inertial_position, &result) ||
+                                         TryLane(hint->to_right(), inertial_position, &result) ||
+                                         TryOngoingBranches(hint, api::LaneEnd::kFinish, inertial_position, &result) ||
+                                         TryOngoingBranches(hint, api::LaneEnd::kStart, inertial_position, &result));
+  if (!found) {
+    result = road_geometry_->ToRoadPosition(inertial_position);
+    ++num_full_searches_;
+  }
+  hints_[agent] = result.road_position.lane;
+  return result;
+}
+
+void RoadPositionTracker::Reset() { std::fill(hints_.begin(), hints_.end(), nullptr); }
+
+bool RoadPositionTracker::TryLane(const api::Lane* lane, const api::InertialPosition& inertial_position,
+                                  api::RoadPositionResult* result) const {
+  if (lane == nullptr) {
+    return false;
+  }
+  const api::LanePositionResult lane_position_result = lane->ToLanePosition(inertial_position);
+  if (lane_position_result.distance > linear_tolerance_) {
+    return false;
+  }
+  const api::LanePosition& lane_position = lane_position_result.lane_position;
+  const api::RBounds lane_bounds = lane->lane_bounds(lane_position.s());
+  if (lane_position.r() < lane_bounds.min() - linear_tolerance_ ||
+      lane_position.r() > lane_bounds.max() + linear_tolerance_) {
+    return false;
+  }
+  *result = api::RoadPositionResult{api::RoadPosition(lane, lane_position), lane_position_result.nearest_position,
+                                    lane_position_result.distance};
+  return true;
+}
+
+bool RoadPositionTracker::TryOngoingBranches(const api::Lane* lane, api::LaneEnd::Which which,
+                                             const api::InertialPosition& inertial_position,
+                                             api::RoadPositionResult* result) const {
+  const api::LaneEndSet* ongoing_branches = lane->GetOngoingBranches(which);
+  if (ongoing_branches == nullptr) {
+    return false;
+  }
+  for (int i = 0; i < ongoing_branches->size(); ++i) {
+    if (TryLane(ongoing_branches->get(i).lane, inertial_position, result)) {
+      return true;
+    }
+  }
+  return false;
+}
+
+}  // namespace bindings
+}  // namespace maliput
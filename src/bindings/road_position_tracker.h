@@ -0,0 +1,93 @@
+// BSD 3-Clause License
+//
+// Copyright (c) 2026, Woven by Toyota. All rights reserved.
+//
+// Redistribution and use in source and binary forms, with or without
+// modification, are permitted provided that the following conditions are met:
+//
+// * Redistributions of source code must retain the above copyright notice, this
+//   list of conditions and the following disclaimer.
+//
+// * Redistributions in binary form must reproduce the above copyright notice,
+//   this list of conditions and the following disclaimer in the documentation
+//   and/or other materials provided with the distribution.
+//
+// * Neither the name of the copyright holder nor the names of its
+//   contributors may be used to endorse or promote products derived from
+//   this software without specific prior written permission.
+//
+// THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+// AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+// IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+// DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+// FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+// DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+// SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+// CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+// OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+// OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+#pragma once
+
+#include <atomic>
+#include <cstdint>
+#include <vector>
+
+#include <maliput/api/lane.h>
+#include <maliput/api/lane_data.h>
+#include <maliput/api/road_geometry.h>
+
+namespace maliput {
+namespace bindings {
+
+// Tracks the api::RoadPosition of a fixed number of moving agents.
+//
+// Each agent keeps the lane it was last localized on as a hint. A new inertial position is first projected onto that
+// lane, then onto its neighbours to the left and right and onto the lanes ongoing from both of its ends. The first of
+// them whose lane bounds contain the position, within the linear tolerance of the road geometry, is taken. Only when
+// none does, or when the agent has no hint yet, the position is localized with a full
+// api::RoadGeometry::ToRoadPosition() search. The hint lane is tried first, so agents stay on their lane where lanes
+// overlap.
+//
+// Agents are independent of each other, so different agents may be updated concurrently.
+class RoadPositionTracker {
+ public:
+  // Builds a tracker of `num_agents` agents without hints.
+  //
+  // @param road_geometry The road geometry agents are localized on. It must outlive this tracker.
+  // @param num_agents Number of tracked agents. Must not be negative.
+  // @throws std::invalid_argument When `road_geometry` is nullptr or `num_agents` is negative.
+  RoadPositionTracker(const api::RoadGeometry* road_geometry, int num_agents);
+
+  // Localizes the `agent`-th agent at `inertial_position` and keeps the result as its hint.
+  //
+  // @throws std::out_of_range When `agent` is not in [0, num_agents()).
+  api::RoadPositionResult Update(int agent, const api::InertialPosition& inertial_position);
+
+  // Forgets the hints of all agents.
+  void Reset();
+
+  const api::RoadGeometry* road_geometry() const { return road_geometry_; }
+
+  int num_agents() const { return static_cast<int>(hints_.size()); }
+
+  // Number of updates that fell back to a full search since construction.
+  std::int64_t num_full_searches() const { return num_full_searches_; }
+
+ private:
+  // Projects `inertial_position` onto `lane` and stores the result in `result` when the lane bounds contain it.
+  bool TryLane(const api::Lane* lane, const api::InertialPosition& inertial_position,
+               api::RoadPositionResult* result) const;
+
+  // Tries the lanes ongoing from the `which` end of `lane`.
+  bool TryOngoingBranches(const api::Lane* lane, api::LaneEnd::Which which,
+                          const api::InertialPosition& inertial_position, api::RoadPositionResult* result) const;
+
+  const api::RoadGeometry* road_geometry_{};
+  double linear_tolerance_{};
+  // Lane each agent was last localized on, nullptr when it has no hint.
+  std::vector<const api::Lane*> hints_;
+  std::atomic<std::int64_t> num_full_searches_{0};
+};
+
+}  // namespace bindings
+}  // namespace maliput
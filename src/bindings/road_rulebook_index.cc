@@ -0,0 +1,133 @@
+// BSD 3-Clause License
+//
+// Copyright (c) 2026, Woven by Toyota. All rights reserved.
+//
+// Redistribution and use in source and binary forms, with or without
+// modification, are permitted provided that the following conditions are met:
+//
+// * Redistributions of source code must retain the above copyright notice, this
+//   list of conditions and the following disclaimer.
+//
+// * Redistributions in binary form must reproduce the above copyright notice,
+//   this list of conditions and the following disclaimer in the documentation
+//   and/or other materials provided with the distribution.
+//
+// * Neither the name of the copyright holder nor the names of its
+//   contributors may be used to endorse or promote products derived from
+//   this software without specific prior written permission.
+//
+// THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+// AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+// IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+// DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+// FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+// DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+// SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+// CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+// OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+// OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+#include "bindings/road_rulebook_index.h"
+
+#include <algorithm>
+#include <stdexcept>
+
+namespace maliput {
+namespace bindings {
+
+RoadRulebookIndex::RoadRulebookIndex(const api::rules::RoadRulebook* rulebook, double tolerance) {
+  if (rulebook == nullptr) {
+    throw std::invalid_argument("rulebook must not be nullptr.");
+  }
+  if (tolerance < 0.) {
+    throw std::invalid_argument("tolerance must be non-negative.");
+  }
+  const api::rules::RoadRulebook::QueryResults rules = rulebook->Rules();
+  Index(rules.discrete_value_rules, tolerance, &discrete_value_rule_ids_, &discrete_value_rules_);
+  Index(rules.range_value_rules, tolerance, &range_value_rule_ids_, &range_value_rules_);
+}
+
+template <typename RuleMap>
+void RoadRulebookIndex::Index(const RuleMap& rules, double tolerance, std::vector<api::rules::Rule::Id>* rule_ids,
+                              LaneRulesMap* lanes) {
+  std::unordered_map<api::LaneId, std::vector<Interval>> intervals;
+  for (const auto& id_rule : rules) {
+    const int rule_index = static_cast<int>(rule_ids->size());
+    rule_ids->push_back(id_rule.first);
+    for (const api::LaneSRange& range : id_rule.second.zone().ranges()) {
+      const double s0 = range.s_range().s0();
+      const double s1 = range.s_range().s1();
+      intervals[range.lane_id()].push_back({std::min(s0, s1) - tolerance, std::max(s0, s1) + tolerance, rule_index});
+    }
+  }
+  for (const auto& lane_intervals : intervals) {
+    lanes->emplace(lane_intervals.first, MakeLaneRules(lane_intervals.second));
+  }
+}
+
+RoadRulebookIndex::LaneRules RoadRulebookIndex::MakeLaneRules(const std::vector<Interval>& intervals) {
+  LaneRules lane_rules;
+  for (const Interval& interval : intervals) {
+    lane_rules.boundaries.push_back(interval.s_min);
+    lane_rules.boundaries.push_back(interval.s_max);
+  }
+  std::sort(lane_rules.boundaries.begin(), lane_rules.boundaries.end());
+  lane_rules.boundaries.erase(std::unique(lane_rules.boundaries.begin(), lane_rules.boundaries.end()),
+                              lane_rules.boundaries.end());
+
+  // Interval [boundaries[i], boundaries[j]] covers pieces 2 * i to 2 * j.
+  const std::size_t num_pieces = 2 * lane_rules.boundaries.size() - 1;
+  std::vector<std::vector<int>> piece_rules(num_pieces);
+  for (const Interval& interval : intervals) {
+    const auto first = std::lower_bound(lane_rules.boundaries.begin(), lane_rules.boundaries.end(), interval.s_min);
+    const auto last = std::lower_bound(first, lane_rules.boundaries.end(), interval.s_max);
+    const std::size_t first_piece = 2 * static_cast<std::size_t>(first - lane_rules.boundaries.begin());
+    const std::size_t last_piece = 2 * static_cast<std::size_t>(last - lane_rules.boundaries.begin());
+    for (std::size_t piece = first_piece; piece <= last_piece; ++piece) {
+      piece_rules[piece].push_back(interval.rule_index);
+    }
+  }
+  lane_rules.piece_offsets.push_back(0);
+  for (std::vector<int>& rules : piece_rules) {
+    std::sort(rules.begin(), rules.end());
+    rules.erase(std::unique(rules.begin(), rules.end()), rules.end());
+    lane_rules.rule_indices.insert(lane_rules.rule_indices.end(), rules.begin(), rules.end());
+    lane_rules.piece_offsets.push_back(static_cast<std::int64_t>(lane_rules.rule_indices.size()));
+  }
+  return lane_rules;
+}
+
+RuleIndices RoadRulebookIndex::Find(const LaneRulesMap& lanes, const api::LaneId& lane_id, double s) {
+  const auto lane_it = lanes.find(lane_id);
+  if (lane_it == lanes.end()) {
+    return {};
+  }
+  const LaneRules& lane_rules = lane_it->second;
+  const std::vector<double>& boundaries = lane_rules.boundaries;
+  const auto upper = std::upper_bound(boundaries.begin(), boundaries.end(), s);
+  if (upper == boundaries.begin()) {
+    return {};
+  }
+  const std::size_t i = static_cast<std::size_t>(upper - boundaries.begin()) - 1;
+  std::size_t piece;
+  if (boundaries[i] == s) {
+    piece = 2 * i;
+  } else if (upper != boundaries.end()) {
+    piece = 2 * i + 1;
+  } else {
+    return {};
+  }
+  const std::int64_t begin = lane_rules.piece_offsets[piece];
+  const std::int64_t end = lane_rules.piece_offsets[piece + 1];
+  return {lane_rules.rule_indices.data() + begin, static_cast<std::size_t>(end - begin)};
+}
+
+RuleIndices RoadRulebookIndex::FindDiscreteValueRules(const api::LaneId& lane_id, double s) const {
+  return Find(discrete_value_rules_, lane_id, s);
+}
+
+RuleIndices RoadRulebookIndex::FindRangeValueRules(const api::LaneId& lane_id, double s) const {
+  return Find(range_value_rules_, lane_id, s);
+}
+
+}  // namespace bindings
+}  // namespace maliput
@@ -0,0 +1,113 @@
+// BSD 3-Clause License
+//
+// Copyright (c) 2026, Woven by Toyota. All rights reserved.
+//
+// Redistribution and use in source and binary forms, with or without
+// modification, are permitted provided that the following conditions are met:
+//
+// * Redistributions of source code must retain the above copyright notice, this
+//   list of conditions and the following disclaimer.
+//
+// * Redistributions in binary form must reproduce the above copyright notice,
+//   this list of conditions and the following disclaimer in the documentation
+//   and/or other materials provided with the distribution.
+//
+// * Neither the name of the copyright holder nor the names of its
+//   contributors may be used to endorse or promote products derived from
+//   this software without specific prior written permission.
+//
+// THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+// AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+// IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+// DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+// FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+// DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+// SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+// CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+// OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+// OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+#pragma once
+
+#include <cstddef>
+#include <cstdint>
+#include <unordered_map>
+#include <vector>
+
+#include <maliput/api/lane_data.h>
+#include <maliput/api/rules/road_rulebook.h>
+#include <maliput/api/rules/rule.h>
+
+namespace maliput {
+namespace bindings {
+
+// Indices into RoadRulebookIndex::discrete_value_rule_ids() or RoadRulebookIndex::range_value_rule_ids(), in
+// ascending order. They point into storage owned by the index.
+struct RuleIndices {
+  const int* data{};
+  std::size_t size{};
+};
+
+// Answers which api::rules::DiscreteValueRules and api::rules::RangeValueRules apply at a lane position without
+// querying the rulebook.
+//
+// The zone ranges of every rule are grouped by lane. The s boundaries of the ranges on a lane split it in points and
+// open intervals, and the rules covering each of them are precomputed, so a query binary searches the boundaries and
+// returns a precomputed list: it takes logarithmic time in the number of ranges on the lane and allocates nothing.
+//
+// The index copies what it needs from the rulebook and is immutable once built, so it can be queried concurrently.
+class RoadRulebookIndex {
+ public:
+  // Builds the index out of every rule in `rulebook`.
+  //
+  // @param rulebook The indexed rulebook. It is only used during construction.
+  // @param tolerance Non-negative distance zone ranges are extended by at both ends.
+  // @throws std::invalid_argument When `rulebook` is nullptr or `tolerance` is negative.
+  RoadRulebookIndex(const api::rules::RoadRulebook* rulebook, double tolerance);
+
+  // Finds the api::rules::DiscreteValueRules whose zone contains `s` on the lane `lane_id`.
+  RuleIndices FindDiscreteValueRules(const api::LaneId& lane_id, double s) const;
+
+  // Finds the api::rules::RangeValueRules whose zone contains `s` on the lane `lane_id`.
+  RuleIndices FindRangeValueRules(const api::LaneId& lane_id, double s) const;
+
+  // Ids of the indexed api::rules::DiscreteValueRules, sorted.
+  const std::vector<api::rules::Rule::Id>& discrete_value_rule_ids() const { return discrete_value_rule_ids_; }
+
+  // Ids of the indexed api::rules::RangeValueRules, sorted.
+  const std::vector<api::rules::Rule::Id>& range_value_rule_ids() const { return range_value_rule_ids_; }
+
+ private:
+  // Rules covering the pieces a lane is split in. With B sorted boundaries, piece 2 * i is the boundary i itself and
+  // piece 2 * i + 1 the open interval between boundaries i and i + 1. The rules covering piece p are the entries of
+  // `rule_indices` in [piece_offsets[p], piece_offsets[p + 1]).
+  struct LaneRules {
+    std::vector<double> boundaries;
+    std::vector<std::int64_t> piece_offsets;
+    std::vector<int> rule_indices;
+  };
+
+  // Zone range [s_min, s_max] of the rule_index-th rule.
+  struct Interval {
+    double s_min{};
+    double s_max{};
+    int rule_index{};
+  };
+
+  using LaneRulesMap = std::unordered_map<api::LaneId, LaneRules>;
+
+  static LaneRules MakeLaneRules(const std::vector<Interval>& intervals);
+
+  static RuleIndices Find(const LaneRulesMap& lanes, const api::LaneId& lane_id, double s);
+
+  // Indexes the zones of `rules`, storing their ids in `rule_ids` and their ranges in `lanes`.
+  template <typename RuleMap>
+  void Index(const RuleMap& rules, double tolerance, std::vector<api::rules::Rule::Id>* rule_ids, LaneRulesMap* lanes);
+
+  std::vector<api::rules::Rule::Id> discrete_value_rule_ids_;
+  std::vector<api::rules::Rule::Id> range_value_rule_ids_;
+  LaneRulesMap discrete_value_rules_;
+  LaneRulesMap range_value_rules_;
+};
+
+}  // namespace bindings
+}  // namespace maliput
@@ -26,17 +26,153 @@
 // CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
 // OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
 // OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+#include <algorithm>
+#include <cstddef>
+#include <functional>
+#include <limits>
+#include <memory>
+#include <stdexcept>
 #include <string>
+#include <utility>
+#include <vector>
 
 #include <maliput/utility/generate_obj.h>
+#include <pybind11/functional.h>
+#include <pybind11/numpy.h>
 #include <pybind11/pybind11.h>
 #include <pybind11/stl.h>
 
+#include "bindings/road_mesh.h"
+#include "bindings/road_mesh_cache.h"
+
 namespace maliput {
 namespace bindings {
 
 namespace py = pybind11;
 
+namespace {
+
+// Mesh of a road network as NumPy arrays.
+struct RoadMeshArrays {
+  // (V, 3) vertex positions as [x, y, z] rows, relative to the ObjFeatures origin.
+  py::array_t<double> vertices;
+  // (V, 3) unit vertex normals as [x, y, z] rows.
+  py::array_t<double> normals;
+  // (F, 3) indices into `vertices` of the corners of each face, counterclockwise when seen from above the road.
+  py::array_t<int> faces;
+  // (F,) RoadMeshMaterial value of each face.
+  py::array_t<int> face_materials;
+  // Names of the segments and branch points in the mesh, as in the OBJ file.
+  std::vector<std::string> object_names;
+  // (O + 1,) index of the first face of each object, followed by F.
+  py::array_t<int> object_face_offsets;
+  // (O, 2, 3) axis aligned bounding box of each object, as its [x, y, z] minimum and maximum corners.
+  py::array_t<double> object_bounding_boxes;
+};
+
+// Copies the rows of `vectors` into a new (N, 3) array.
+py::array_t<double> ToArray(const std::vector<math::Vector3>& vectors) {
+  const py::ssize_t n = static_cast<py::ssize_t>(vectors.size());
+  py::array_t<double> array({n, py::ssize_t{3}});
+  auto rows = array.mutable_unchecked<2>();
+  for (py::ssize_t i = 0; i < n; ++i) {
+    for (py::ssize_t j = 0; j < 3; ++j) {
+      rows(i, j) = vectors[i][j];
+    }
+  }
+  return array;
+}
+
+// Returns the road geometry of `road_network`.
+//
+// @throws std::invalid_argument When `road_network` is nullptr or has no road geometry.
+const api::RoadGeometry& GetRoadGeometry(const api::RoadNetwork* road_network) {
+  if (road_network == nullptr || road_network->road_geometry() == nullptr) {
+    throw std::invalid_argument("road_network must have a road geometry.");
+  }
+  return *road_network->road_geometry();
+}
+
+// Packs `mesh` and the names and face offsets of its objects into a RoadMeshArrays.
+RoadMeshArrays ToRoadMeshArrays(const RoadMesh& mesh, std::vector<std::string> object_names,
+                                const std::vector<int>& object_face_offsets) {
+  RoadMeshArrays arrays;
+  arrays.vertices = ToArray(mesh.vertices);
+  arrays.normals = ToArray(mesh.normals);
+  const py::ssize_t num_faces = static_cast<py::ssize_t>(mesh.faces.size());
+  arrays.faces = py::array_t<int>({num_faces, py::ssize_t{3}});
+  arrays.face_materials = py::array_t<int>(num_faces);
+  auto faces = arrays.faces.mutable_unchecked<2>();
+  auto face_materials = arrays.face_materials.mutable_unchecked<1>();
+  for (py::ssize_t i = 0; i < num_faces; ++i) {
+    for (py::ssize_t j = 0; j < 3; ++j) {
+      faces(i, j) = mesh.faces[i][j];
+    }
+    face_materials(i) = static_cast<int>(mesh.face_materials[i]);
+  }
+  arrays.object_names = std::move(object_names);
+  arrays.object_face_offsets =
+      py::array_t<int>(static_cast<py::ssize_t>(object_face_offsets.size()), object_face_offsets.data());
+
+  const py::ssize_t num_objects = static_cast<py::ssize_t>(arrays.object_names.size());
+  arrays.object_bounding_boxes = py::array_t<double>({num_objects, py::ssize_t{2}, py::ssize_t{3}});
+  auto bounding_boxes = arrays.object_bounding_boxes.mutable_unchecked<3>();
+  for (py::ssize_t i = 0; i < num_objects; ++i) {
+    for (py::ssize_t j = 0; j < 3; ++j) {
+      bounding_boxes(i, 0, j) = std::numeric_limits<double>::infinity();
+      bounding_boxes(i, 1, j) = -std::numeric_limits<double>::infinity();
+    }
+    for (int face = object_face_offsets[i]; face < object_face_offsets[i + 1]; ++face) {
+      for (const int vertex : mesh.faces[face]) {
+        for (py::ssize_t j = 0; j < 3; ++j) {
+          bounding_boxes(i, 0, j) = std::min(bounding_boxes(i, 0, j), mesh.vertices[vertex][j]);
+          bounding_boxes(i, 1, j) = std::max(bounding_boxes(i, 1, j), mesh.vertices[vertex][j]);
+        }
+      }
+    }
+  }
+  return arrays;
+}
+
+// Packs the mesh `generate(object_names, object_face_offsets)` returns, called without the GIL, into a
+// RoadMeshArrays.
+template <typename Generator>
+RoadMeshArrays GenerateRoadMeshArrays(const Generator& generate) {
+  RoadMesh mesh;
+  std::vector<std::string> object_names;
+  std::vector<int> object_face_offsets;
+  {
+    py::gil_scoped_release release;
+    mesh = generate(&object_names, &object_face_offsets);
+  }
+  return ToRoadMeshArrays(mesh, std::move(object_names), object_face_offsets);
+}
+
+// Generates the levels of detail of the mesh of `road_network` as GenerateRoadMeshLods() does and packs each of them
+// into a RoadMeshArrays.
+std::vector<RoadMeshArrays> GenerateRoadMeshLodArrays(const api::RoadNetwork* road_network,
+                                                      const utility::ObjFeatures& features,
+                                                      const std::vector<double>& max_grid_units, int num_threads) {
+  const api::RoadGeometry& road_geometry = GetRoadGeometry(road_network);
+  std::vector<RoadMesh> meshes;
+  std::vector<std::vector<std::string>> object_names;
+  std::vector<std::vector<int>> object_face_offsets;
+  {
+    py::gil_scoped_release release;
+    meshes =
+        GenerateRoadMeshLods(road_geometry, features, max_grid_units, num_threads, &object_names, &object_face_offsets);
+  }
+  std::vector<RoadMeshArrays> levels;
+  levels.reserve(meshes.size());
+  for (std::size_t level = 0; level < meshes.size(); ++level) {
+    levels.push_back(ToRoadMeshArrays(meshes[level], std::move(object_names[level]), object_face_offsets[level]));
+    meshes[level] = RoadMesh();
+  }
+  return levels;
+}
+
+}  // namespace
+
 PYBIND11_MODULE(utility, m) {
   py::class_<utility::ObjFeatures>(m, "ObjFeatures")
       .def(py::init<>())
@@ -58,11 +194,110 @@ PYBIND11_MODULE(utility, m) {
       .def_readwrite("origin", &utility::ObjFeatures::origin)
       .def_readwrite("highlighted_segments", &utility::ObjFeatures::highlighted_segments);
 
+  py::enum_<RoadMeshMaterial>(m, "RoadMeshMaterial")
+      .value("kAsphalt", RoadMeshMaterial::kAsphalt)
+      .value("kGrayedAsphalt", RoadMeshMaterial::kGrayedAsphalt)
+      .value("kLaneHaze", RoadMeshMaterial::kLaneHaze)
+      .value("kMarkerPaint", RoadMeshMaterial::kMarkerPaint)
+      .value("kBranchPointGlow", RoadMeshMaterial::kBranchPointGlow)
+      .value("kElevationBounds", RoadMeshMaterial::kElevationBounds)
+      .export_values();
+
+  py::class_<RoadMeshArrays>(m, "RoadMeshArrays")
+      .def(py::init<>())
+      .def_readonly("vertices", &RoadMeshArrays::vertices)
+      .def_readonly("normals", &RoadMeshArrays::normals)
+      .def_readonly("faces", &RoadMeshArrays::faces)
+      .def_readonly("face_materials", &RoadMeshArrays::face_materials)
+      .def_readonly("object_names", &RoadMeshArrays::object_names)
+      .def_readonly("object_face_offsets", &RoadMeshArrays::object_face_offsets)
+      .def_readonly("object_bounding_boxes", &RoadMeshArrays::object_bounding_boxes);
+
   m.def("GenerateObjFile",
         py::overload_cast<const api::RoadNetwork*, const std::string&, const std::string&, const utility::ObjFeatures&>(
             &maliput::utility::GenerateObjFile),
         "Generates a Wavefront OBJ model of the road surface of an maliput::api::RoadNetwork.", py::arg("road_network"),
         py::arg("dirpath"), py::arg("fileroot"), py::arg("features"));
+
+  m.def(
+      "GenerateRoadMeshObjFile",
+      [](const api::RoadNetwork* road_network, const std::string& dirpath, const std::string& fileroot,
+         const utility::ObjFeatures& features, int num_threads, int batch_size, const py::object& progress) {
+        const api::RoadGeometry& road_geometry = GetRoadGeometry(road_network);
+        std::function<void(int, int)> progress_callback;
+        if (!progress.is_none()) {
+          progress_callback = [&progress](int done, int total) {
+            py::gil_scoped_acquire acquire;
+            progress(done, total);
+          };
+        }
+        py::gil_scoped_release release;
+        GenerateRoadMeshObjFile(road_geometry, dirpath, fileroot, features, num_threads, batch_size, progress_callback);
+      },
+      "Generates a Wavefront OBJ model of the road surface, lane haze, stripes, arrows, elevation bounds and branch "
+      "points, tessellating segments and branch points with up to `num_threads` threads (0 for all cores) and "
+      "streaming them to disk in batches of `batch_size`. `progress`, when given, is called as "
+      "`progress(done, total)` after each batch. More than one thread requires the backend's "
+      "Lane::ToInertialPosition() to be thread-safe. This is not GenerateObjFile run in parallel but a separate, "
+      "approximate tessellation: the road surface covers the same area, but it is sampled on its own grid, the MTL "
+      "file declares its own materials (see RoadMeshMaterial), stripes, arrows and branch points have their own "
+      "glyph shapes and elevation bounds are drawn as a surface at the upper bound of each lane. Raises ValueError "
+      "when `features` sets off_grid_mesh_generation or simplify_mesh_threshold, which are not supported.",
+      py::arg("road_network"), py::arg("dirpath"), py::arg("fileroot"), py::arg("features"), py::arg("num_threads") = 1,
+      py::arg("batch_size") = 64, py::arg("progress") = py::none());
+
+  m.def(
+      "GenerateRoadMesh",
+      [](const api::RoadNetwork* road_network, const utility::ObjFeatures& features, int num_threads) {
+        const api::RoadGeometry& road_geometry = GetRoadGeometry(road_network);
+        return GenerateRoadMeshArrays(
+            [&](std::vector<std::string>* object_names, std::vector<int>* object_face_offsets) {
+              return GenerateRoadMesh(road_geometry, features, num_threads, object_names, object_face_offsets);
+            });
+      },
+      "Generates the meshes GenerateRoadMeshObjFile writes as NumPy vertex, normal, face and face material arrays "
+      "instead, tessellating with up to `num_threads` threads (0 for all cores). This is a separate, approximate "
+      "tessellation, not the meshes GenerateObjFile builds: it uses its own materials and glyph shapes and draws "
+      "elevation bounds as a surface at the upper bound of each lane. More than one thread requires the backend's "
+      "Lane::ToInertialPosition() to be thread-safe. Raises ValueError when `features` sets off_grid_mesh_generation "
+      "or simplify_mesh_threshold, which are not supported.",
+      py::arg("road_network"), py::arg("features"), py::arg("num_threads") = 1);
+
+  m.def("GenerateRoadMeshLods", &GenerateRoadMeshLodArrays,
+        "Generates the meshes GenerateRoadMesh returns once per level of detail, using each of `max_grid_units` as "
+        "the ObjFeatures max_grid_unit, with up to `num_threads` threads (0 for all cores). Returns a list with the "
+        "RoadMeshArrays of each level. Branch points, and segments whose grid units min_grid_resolution bounds at "
+        "several levels, are tessellated once and shared by those levels; every other level is sampled on its own "
+        "grid. More than one thread requires the backend's Lane::ToInertialPosition() to be thread-safe.",
+        py::arg("road_network"), py::arg("features"), py::arg("max_grid_units"), py::arg("num_threads") = 1);
+
+  py::class_<RoadMeshCache>(m, "RoadMeshCache")
+      .def(py::init([](const api::RoadNetwork* road_network, std::size_t max_memory_bytes) {
+             return std::make_unique<RoadMeshCache>(GetRoadGeometry(road_network), max_memory_bytes);
+           }),
+           "Caches the meshes of the segments and branch points of `road_network` keyed by the ObjFeatures fields "
+           "they depend on, evicting the least recently used ones beyond `max_memory_bytes`.",
+           py::arg("road_network"), py::arg("max_memory_bytes") = std::size_t{256} << 20,
+           // Keep alive, reference: `self` keeps `road_network` alive.
+           py::keep_alive<1, 2>())
+      .def(
+          "Generate",
+          [](RoadMeshCache& self, const utility::ObjFeatures& features, int num_threads) {
+            return GenerateRoadMeshArrays(
+                [&](std::vector<std::string>* object_names, std::vector<int>* object_face_offsets) {
+                  return self.Generate(features, num_threads, object_names, object_face_offsets);
+                });
+          },
+          "Returns the mesh GenerateRoadMesh() returns, tessellating only the segments and branch points that are "
+          "not cached under `features`. More than one thread requires the backend's Lane::ToInertialPosition() to "
+          "be thread-safe.",
+          py::arg("features"), py::arg("num_threads") = 1)
+      .def("Clear", &RoadMeshCache::Clear, "Drops all cached meshes.")
+      .def("max_memory_bytes", &RoadMeshCache::max_memory_bytes)
+      .def("memory_bytes", &RoadMeshCache::memory_bytes)
+      .def("num_tiles", &RoadMeshCache::num_tiles)
+      .def("num_hits", &RoadMeshCache::num_hits)
+      .def("num_misses", &RoadMeshCache::num_misses);
 }
 
 }  // namespace bindings
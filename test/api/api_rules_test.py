@@ -57,16 +57,22 @@ from maliput.api.rules import (
     BulbTypeMapper,
     DirectionUsageRule,
     DiscreteValueRule,
+    DiscreteValueRuleArrays,
+    DiscreteValueRuleStateArrays,
     DiscreteValueRuleStateProvider,
     Phase,
     PhaseProvider,
     PhaseRing,
     PhaseRingBook,
     RangeValueRule,
+    RangeValueRuleArrays,
+    RangeValueRuleStateArrays,
     RangeValueRuleStateProvider,
     RoadRulebook,
+    RoadRulebookIndex,
     RightOfWayRule,
     Rule,
+    RuleQueryResultArrays,
     RuleRegistry,
     SpeedLimitRule,
     TrafficLight,
@@ -470,17 +476,67 @@ class TestMaliputApiRules(unittest.TestCase):
         """
         dut_type_methods = dir(RoadRulebook)
         self.assertTrue('FindRules' in dut_type_methods)
+        self.assertTrue('FindRulesBatch' in dut_type_methods)
         self.assertTrue('Rules' in dut_type_methods)
         self.assertTrue('GetRule' in dut_type_methods)
         self.assertTrue('GetDiscreteValueRule' in dut_type_methods)
         self.assertTrue('GetRangeValueRule' in dut_type_methods)
 
+    def test_roadrulebookindex_methods(self):
+        """
+        Tests that RoadRulebookIndex exposes the right methods.
+        """
+        dut_type_methods = dir(RoadRulebookIndex)
+        self.assertTrue('discrete_value_rule_ids' in dut_type_methods)
+        self.assertTrue('range_value_rule_ids' in dut_type_methods)
+        self.assertTrue('FindDiscreteValueRules' in dut_type_methods)
+        self.assertTrue('FindRangeValueRules' in dut_type_methods)
+
+    def test_empty_discrete_value_rule_arrays(self):
+        """
+        Tests an empty DiscreteValueRuleArrays binding.
+        """
+        dut = DiscreteValueRuleArrays()
+        self.assertEqual([], dut.rule_ids)
+        self.assertEqual([], dut.type_ids)
+        self.assertEqual(0, dut.type_indices.size)
+        self.assertEqual([], dut.lane_ids)
+        self.assertEqual(0, dut.zone_offsets.size)
+        self.assertEqual(0, dut.zone_lane_indices.size)
+        self.assertEqual(0, dut.zone_s_ranges.size)
+        self.assertEqual(0, dut.state_offsets.size)
+        self.assertEqual(0, dut.severities.size)
+        self.assertEqual(0, dut.query_offsets.size)
+        self.assertEqual(0, dut.rule_indices.size)
+        self.assertEqual([], dut.values)
+        self.assertEqual(0, dut.value_indices.size)
+
+    def test_empty_range_value_rule_arrays(self):
+        """
+        Tests an empty RangeValueRuleArrays binding.
+        """
+        dut = RangeValueRuleArrays()
+        self.assertEqual([], dut.rule_ids)
+        self.assertEqual(0, dut.query_offsets.size)
+        self.assertEqual([], dut.descriptions)
+        self.assertEqual(0, dut.description_indices.size)
+        self.assertEqual(0, dut.ranges.size)
+
+    def test_empty_rule_query_result_arrays(self):
+        """
+        Tests an empty RuleQueryResultArrays binding.
+        """
+        dut = RuleQueryResultArrays()
+        self.assertEqual([], dut.discrete_value_rules.rule_ids)
+        self.assertEqual([], dut.range_value_rules.rule_ids)
+
     def test_discretevaluerulestateprovider_methods(self):
         """
         Tests that DiscreteValueRuleStateProvider exposes the right methods.
         """
         dut_type_methods = dir(DiscreteValueRuleStateProvider)
         self.assertTrue('GetState' in dut_type_methods)
+        self.assertTrue('GetStates' in dut_type_methods)
 
     def test_rangevaluerulestateprovider_methods(self):
         """
@@ -488,6 +544,27 @@ class TestMaliputApiRules(unittest.TestCase):
         """
         dut_type_methods = dir(RangeValueRuleStateProvider)
         self.assertTrue('GetState' in dut_type_methods)
+        self.assertTrue('GetStates' in dut_type_methods)
+
+    def test_empty_discrete_value_rule_state_arrays(self):
+        """
+        Tests an empty DiscreteValueRuleStateArrays binding.
+        """
+        dut = DiscreteValueRuleStateArrays()
+        self.assertEqual([], dut.states)
+        self.assertEqual(0, dut.state_indices.size)
+        self.assertEqual(0, dut.next_state_indices.size)
+        self.assertEqual(0, dut.next_durations.size)
+
+    def test_empty_range_value_rule_state_arrays(self):
+        """
+        Tests an empty RangeValueRuleStateArrays binding.
+        """
+        dut = RangeValueRuleStateArrays()
+        self.assertEqual([], dut.states)
+        self.assertEqual(0, dut.state_indices.size)
+        self.assertEqual(0, dut.next_state_indices.size)
+        self.assertEqual(0, dut.next_durations.size)
 
     def test_bulbcolor_values(self):
         """
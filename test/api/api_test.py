@@ -38,6 +38,7 @@ import unittest
 from maliput.api import (
     BranchPoint,
     BranchPointId,
+    BranchPointIdSequence,
     HBounds,
     InertialPosition,
     Intersection,
@@ -45,25 +46,40 @@ from maliput.api import (
     IsoLaneVelocity,
     Junction,
     JunctionId,
+    JunctionIdSequence,
     Lane,
     LaneEnd,
     LaneId,
+    LaneIdSequence,
     LanePosition,
     LanePositionResult,
+    LanePositionResultArrays,
+    LaneSamples,
     LaneType,
     LaneSRange,
     LaneSRoute,
     RBounds,
     RoadGeometry,
     RoadGeometryId,
+    RoadGeometryIdTable,
+    RoadGeometryRouter,
+    RoadGeometrySpatialIndex,
     RoadNetwork,
     RoadPosition,
+    RoadPositionQueryResultArrays,
     RoadPositionResult,
+    RoadPositionResultArrays,
+    RoadPositionTracker,
     Rotation,
+    RotationArrays,
+    RouteMatrix,
     Segment,
     SegmentId,
+    SegmentIdSequence,
     SRange,
     UniqueId,
+    WaypointArrays,
+    WaypointChunkIterator,
     Which,
 )
 
@@ -144,6 +160,27 @@ class TestMaliputApi(unittest.TestCase):
         self.assertEqual(Vector3(0., 0., 0.), dut.nearest_position.xyz())
         self.assertEqual(0., dut.distance)
 
+    def test_empty_road_position_query_result_arrays(self):
+        """
+        Tests an empty RoadPositionQueryResultArrays binding.
+        """
+        dut = RoadPositionQueryResultArrays()
+        self.assertEqual([], list(dut.lane_ids))
+        self.assertEqual(0, dut.lane_indices.size)
+        self.assertEqual(0, dut.lane_positions.size)
+        self.assertEqual(0, dut.nearest_positions.size)
+        self.assertEqual(0, dut.distances.size)
+        self.assertEqual(0, dut.query_offsets.size)
+
+    def test_empty_lane_position_result_arrays(self):
+        """
+        Tests an empty LanePositionResultArrays binding.
+        """
+        dut = LanePositionResultArrays()
+        self.assertEqual(0, dut.lane_positions.size)
+        self.assertEqual(0, dut.nearest_positions.size)
+        self.assertEqual(0, dut.distances.size)
+
     def test_empty_road_position(self):
         """
         Tests an empty RoadPosition binding.
@@ -163,6 +200,17 @@ class TestMaliputApi(unittest.TestCase):
         self.assertEqual(InertialPosition(0., 0., 0.), dut.nearest_position)
         self.assertEqual(0, dut.distance)
 
+    def test_empty_road_position_result_arrays(self):
+        """
+        Tests an empty RoadPositionResultArrays binding.
+        """
+        dut = RoadPositionResultArrays()
+        self.assertEqual([], list(dut.lane_ids))
+        self.assertEqual(0, dut.lane_indices.size)
+        self.assertEqual(0, dut.lane_positions.size)
+        self.assertEqual(0, dut.nearest_positions.size)
+        self.assertEqual(0, dut.distances.size)
+
     def test_identity_rotation(self):
         """
         Tests an empty Rotation binding.
@@ -173,6 +221,72 @@ class TestMaliputApi(unittest.TestCase):
         self.assertAlmostEqual(0., dut.rpy().pitch_angle())
         self.assertAlmostEqual(0., dut.rpy().yaw_angle())
 
+    def test_empty_rotation_arrays(self):
+        """
+        Tests an empty RotationArrays binding.
+        """
+        dut = RotationArrays()
+        self.assertEqual(0, dut.quaternions.size)
+        self.assertEqual(0, dut.rpys.size)
+
+    def test_empty_waypoint_arrays(self):
+        """
+        Tests an empty WaypointArrays binding.
+        """
+        dut = WaypointArrays()
+        self.assertEqual([], list(dut.lane_ids))
+        self.assertEqual(0, dut.lane_indices.size)
+        self.assertEqual(0, dut.s.size)
+        self.assertEqual(0, dut.xyz.size)
+
+    def test_waypoint_chunk_iterator_methods(self):
+        """
+        Tests that WaypointChunkIterator exposes the right methods.
+        """
+        dut_type_methods = dir(WaypointChunkIterator)
+        self.assertTrue('num_waypoints' in dut_type_methods)
+        self.assertTrue('__iter__' in dut_type_methods)
+        self.assertTrue('__next__' in dut_type_methods)
+
+    def test_empty_id_sequences(self):
+        """
+        Tests empty JunctionIdSequence, SegmentIdSequence, LaneIdSequence and BranchPointIdSequence
+        bindings.
+        """
+        for dut_type, id_type in ((JunctionIdSequence, JunctionId), (SegmentIdSequence, SegmentId),
+                                  (LaneIdSequence, LaneId), (BranchPointIdSequence, BranchPointId)):
+            dut = dut_type()
+            self.assertEqual(0, len(dut))
+            self.assertEqual([], list(dut))
+            self.assertEqual([], dut[[]])
+            self.assertFalse(id_type('x') in dut)
+            with self.assertRaises(IndexError):
+                dut[0]
+            with self.assertRaises(ValueError):
+                dut.index(id_type('x'))
+
+    def test_empty_route_matrix(self):
+        """
+        Tests an empty RouteMatrix binding.
+        """
+        dut = RouteMatrix()
+        self.assertEqual([], dut.routes)
+        self.assertEqual(0, dut.lengths.size)
+
+    def test_empty_lane_samples(self):
+        """
+        Tests an empty LaneSamples binding.
+        """
+        dut = LaneSamples()
+        self.assertEqual([], list(dut.lane_ids))
+        self.assertEqual(0, dut.lane_types.size)
+        self.assertEqual(0, dut.lane_offsets.size)
+        self.assertEqual(0, dut.s.size)
+        self.assertEqual(0, dut.centerlines.size)
+        self.assertEqual(0, dut.left_boundaries.size)
+        self.assertEqual(0, dut.right_boundaries.size)
+        self.assertEqual(0, dut.curvatures.size)
+
     def test_hbounds_default_init(self):
         """
         Tests the HBounds default initializer.
@@ -464,6 +578,7 @@ class TestMaliputApi(unittest.TestCase):
         self.assertTrue('id' in dut_type_methods)
         self.assertTrue('segment' in dut_type_methods)
         self.assertTrue('index' in dut_type_methods)
+        self.assertTrue('index_in_geometry' in dut_type_methods)
         self.assertTrue('to_left' in dut_type_methods)
         self.assertTrue('to_right' in dut_type_methods)
         self.assertTrue('length' in dut_type_methods)
@@ -472,7 +587,11 @@ class TestMaliputApi(unittest.TestCase):
         self.assertTrue('elevation_bounds' in dut_type_methods)
         self.assertTrue('ToInertialPosition' in dut_type_methods)
         self.assertTrue('ToLanePosition' in dut_type_methods)
+        self.assertTrue('ToInertialPositions' in dut_type_methods)
+        self.assertTrue('ToLanePositions' in dut_type_methods)
         self.assertTrue('ToSegmentPosition' in dut_type_methods)
+        self.assertTrue('GetOrientation' in dut_type_methods)
+        self.assertTrue('GetOrientations' in dut_type_methods)
         self.assertTrue('EvalMotionDerivatives' in dut_type_methods)
         self.assertTrue('GetBranchPoint' in dut_type_methods)
         self.assertTrue('GetConfluentBranches' in dut_type_methods)
@@ -489,6 +608,7 @@ class TestMaliputApi(unittest.TestCase):
         self.assertTrue('num_lanes' in dut_type_methods)
         self.assertTrue('junction' in dut_type_methods)
         self.assertTrue('lane' in dut_type_methods)
+        self.assertTrue('index_in_geometry' in dut_type_methods)
 
     def test_junction_methods(self):
         """
@@ -499,6 +619,7 @@ class TestMaliputApi(unittest.TestCase):
         self.assertTrue('num_segments' in dut_type_methods)
         self.assertTrue('segment' in dut_type_methods)
         self.assertTrue('road_geometry' in dut_type_methods)
+        self.assertTrue('index_in_geometry' in dut_type_methods)
 
     def test_brachpoint_methods(self):
         """
@@ -512,6 +633,7 @@ class TestMaliputApi(unittest.TestCase):
         self.assertTrue('GetDefaultBranch' in dut_type_methods)
         self.assertTrue('GetASide' in dut_type_methods)
         self.assertTrue('GetBSide' in dut_type_methods)
+        self.assertTrue('index_in_geometry' in dut_type_methods)
 
     def test_road_geometry_methods(self):
         """
@@ -526,10 +648,65 @@ class TestMaliputApi(unittest.TestCase):
         self.assertTrue('ById' in dut_type_methods)
         self.assertTrue('ToRoadPosition' in dut_type_methods)
         self.assertTrue('ToRoadPositionByHint' in dut_type_methods)
+        self.assertTrue('ToRoadPositions' in dut_type_methods)
         self.assertTrue('FindRoadPositions' in dut_type_methods)
         self.assertTrue('linear_tolerance' in dut_type_methods)
         self.assertTrue('angular_tolerance' in dut_type_methods)
         self.assertTrue('scale_length' in dut_type_methods)
         self.assertTrue('CheckInvariants' in dut_type_methods)
         self.assertTrue('SampleAheadWaypoints' in dut_type_methods)
+        self.assertTrue('SampleAheadWaypointArrays' in dut_type_methods)
+        self.assertTrue('SampleAheadWaypointChunks' in dut_type_methods)
         self.assertTrue('inertial_to_backend_frame_translation' in dut_type_methods)
+        self.assertTrue('SampleLanes' in dut_type_methods)
+        self.assertTrue('id_table' in dut_type_methods)
+
+    def test_road_geometry_spatial_index_methods(self):
+        """
+        Tests that RoadGeometrySpatialIndex exposes the right methods.
+        """
+        dut_type_methods = dir(RoadGeometrySpatialIndex)
+        self.assertTrue('road_geometry' in dut_type_methods)
+        self.assertTrue('num_boxes' in dut_type_methods)
+        self.assertTrue('FindRoadPositions' in dut_type_methods)
+
+    def test_road_position_tracker_methods(self):
+        """
+        Tests that RoadPositionTracker exposes the right methods.
+        """
+        dut_type_methods = dir(RoadPositionTracker)
+        self.assertTrue('road_geometry' in dut_type_methods)
+        self.assertTrue('num_agents' in dut_type_methods)
+        self.assertTrue('num_full_searches' in dut_type_methods)
+        self.assertTrue('Update' in dut_type_methods)
+        self.assertTrue('Reset' in dut_type_methods)
+
+    def test_road_geometry_id_table_methods(self):
+        """
+        Tests that RoadGeometryIdTable exposes the right methods.
+        """
+        dut_type_methods = dir(RoadGeometryIdTable)
+        self.assertTrue('road_geometry' in dut_type_methods)
+        for kind, type_name in (('junction', 'Junction'), ('segment', 'Segment'), ('lane', 'Lane'),
+                                ('branch_point', 'BranchPoint')):
+            self.assertTrue('num_' + kind + 's' in dut_type_methods)
+            self.assertTrue(kind + 's' in dut_type_methods)
+            self.assertTrue(kind in dut_type_methods)
+            self.assertTrue(kind + '_ids' in dut_type_methods)
+            self.assertTrue(type_name + 'Index' in dut_type_methods)
+        self.assertTrue('junction_segment_offsets' in dut_type_methods)
+        self.assertTrue('segment_junction_indices' in dut_type_methods)
+        self.assertTrue('segment_lane_offsets' in dut_type_methods)
+        self.assertTrue('lane_segment_indices' in dut_type_methods)
+        self.assertTrue('lane_branch_point_indices' in dut_type_methods)
+
+    def test_road_geometry_router_methods(self):
+        """
+        Tests that RoadGeometryRouter exposes the right methods.
+        """
+        dut_type_methods = dir(RoadGeometryRouter)
+        self.assertTrue('road_geometry' in dut_type_methods)
+        self.assertTrue('num_nodes' in dut_type_methods)
+        self.assertTrue('num_edges' in dut_type_methods)
+        self.assertTrue('FindRoute' in dut_type_methods)
+        self.assertTrue('FindRoutes' in dut_type_methods)
@@ -0,0 +1,301 @@
+# BSD 3-Clause License
+#
+# Copyright (c) 2026, Woven by Toyota. All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# * Neither the name of the copyright holder nor the names of its
+#   contributors may be used to endorse or promote products derived from
+#   this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+"""
+Behavior tests of the maliput::api python binding on a dragway.
+
+They are skipped when the maliput_dragway plugin is not installed.
+"""
+
+import gc
+import unittest
+import weakref
+
+import numpy as np
+
+from maliput.api import (
+    InertialPosition,
+    LanePosition,
+    LaneSRange,
+    LaneSRoute,
+    RoadGeometryRouter,
+    RoadGeometrySpatialIndex,
+    RoadPosition,
+    RoadPositionTracker,
+    SRange,
+    Which,
+)
+from maliput.api.rules import (
+    RoadRulebookIndex,
+)
+
+DRAGWAY_PLUGIN_ID = 'maliput_dragway'
+DRAGWAY_PROPERTIES = {
+    'num_lanes': '3',
+    'length': '100.',
+    'lane_width': '3.7',
+    'shoulder_width': '3.',
+    'maximum_height': '5.',
+    'linear_tolerance': '1e-3',
+    'angular_tolerance': '1e-3',
+}
+
+
+def _create_dragway():
+    """
+    Returns the dragway road network the tests run on, skipping them when it cannot be built.
+    """
+    import maliput.plugin
+    try:
+        road_network = maliput.plugin.create_road_network(DRAGWAY_PLUGIN_ID, DRAGWAY_PROPERTIES)
+    except Exception as error:
+        raise unittest.SkipTest('Cannot load the {} plugin: {}'.format(DRAGWAY_PLUGIN_ID, error))
+    if road_network is None:
+        raise unittest.SkipTest('The {} plugin built no road network.'.format(DRAGWAY_PLUGIN_ID))
+    return road_network
+
+
+class TestDragway(unittest.TestCase):
+    """
+    Evaluates the results of the maliput.api bindings on a three lane dragway.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        cls.road_network = _create_dragway()
+        cls.road_geometry = cls.road_network.road_geometry()
+        cls.lanes = [cls.road_geometry.junction(0).segment(0).lane(i) for i in range(3)]
+
+    def test_lane_wrappers_are_shared(self):
+        """
+        Tests that a lane is the same object however it is reached.
+        """
+        self.assertIs(self.lanes[0], self.road_geometry.junction(0).segment(0).lane(0))
+        self.assertIs(self.lanes[1], self.lanes[0].to_left())
+        self.assertIs(self.lanes[0], self.road_geometry.ById().GetLane(self.lanes[0].id()))
+        self.assertIs(self.lanes[0].segment(), self.lanes[2].segment())
+
+    def test_lane_wrappers_are_owned_by_road_network(self):
+        """
+        Tests that dropped lane wrappers are not allocated again, and that the road network and
+        its wrappers are released by the garbage collector.
+        """
+        road_network = _create_dragway()
+        lane_ref = weakref.ref(road_network.road_geometry().junction(0).segment(0).lane(0))
+        self.assertIsNotNone(lane_ref())
+        self.assertIs(lane_ref(), road_network.road_geometry().junction(0).segment(0).lane(0))
+        road_network_ref = weakref.ref(road_network)
+        del road_network
+        gc.collect()
+        self.assertIsNone(road_network_ref())
+        self.assertIsNone(lane_ref())
+
+    def test_id_table_is_built_once(self):
+        """
+        Tests that the id table of a road geometry is built once and keeps its road network alive
+        without retaining it once dropped.
+        """
+        self.assertIs(self.road_geometry.id_table(), self.road_geometry.id_table())
+        gc.disable()
+        try:
+            road_network = _create_dragway()
+            road_network_ref = weakref.ref(road_network)
+            id_table = road_network.road_geometry().id_table()
+            for _ in range(3):
+                self.assertIs(id_table, road_network.road_geometry().id_table())
+            del road_network
+            self.assertEqual(3, id_table.num_lanes())
+            del id_table
+            self.assertIsNone(road_network_ref())
+        finally:
+            gc.enable()
+
+    def test_spatial_index_matches_find_road_positions(self):
+        """
+        Tests that RoadGeometrySpatialIndex finds the same lanes and positions FindRoadPositions
+        does.
+        """
+        dut = RoadGeometrySpatialIndex(self.road_geometry, sampling_step=5., cell_size=4.)
+        for x, y, radius in ((10., 0., 0.5), (50., 3.7, 2.), (99., -5., 10.), (-20., 0., 1.),
+                             (50., 0., 1e6)):
+            position = InertialPosition(x, y, 0.)
+            expected = self.road_geometry.FindRoadPositions(position, radius)
+            results = dut.FindRoadPositions(position, radius)
+            self.assertEqual(sorted(result.road_position.lane.id().string() for result in expected),
+                             sorted(result.road_position.lane.id().string() for result in results))
+            expected_by_lane = {result.road_position.lane.id().string(): result
+                                for result in expected}
+            for result in results:
+                match = expected_by_lane[result.road_position.lane.id().string()]
+                self.assertAlmostEqual(match.distance, result.distance, places=6)
+                self.assertAlmostEqual(match.road_position.pos.s(), result.road_position.pos.s(),
+                                       places=6)
+
+    def test_spatial_index_rejects_non_finite_radius(self):
+        """
+        Tests that RoadGeometrySpatialIndex rejects infinite and NaN radii.
+        """
+        dut = RoadGeometrySpatialIndex(self.road_geometry)
+        for radius in (float('inf'), float('nan'), -1.):
+            with self.assertRaises(ValueError):
+                dut.FindRoadPositions(InertialPosition(0., 0., 0.), radius)
+
+    def test_waypoint_chunks_match_waypoint_arrays(self):
+        """
+        Tests that the iterator is its own iterator and that its chunks concatenate to the
+        waypoints SampleAheadWaypointArrays returns.
+        """
+        route = LaneSRoute([LaneSRange(self.lanes[0].id(), SRange(0., 100.)),
+                            LaneSRange(self.lanes[1].id(), SRange(100., 50.))])
+        expected = self.road_geometry.SampleAheadWaypointArrays(route, 1.)
+        dut = self.road_geometry.SampleAheadWaypointChunks(route, 1., chunk_size=16)
+        self.assertIs(dut, iter(dut))
+        self.assertEqual(len(expected.s), dut.num_waypoints())
+
+        first = next(dut)
+        self.assertEqual(16, len(first.s))
+        # A for loop over the iterator resumes where next() left it.
+        chunks = [first] + [chunk for chunk in dut]
+        with self.assertRaises(StopIteration):
+            next(dut)
+        self.assertTrue(all(len(chunk.s) <= 16 for chunk in chunks))
+        np.testing.assert_array_equal(expected.s, np.concatenate([chunk.s for chunk in chunks]))
+        np.testing.assert_array_equal(expected.lane_indices,
+                                      np.concatenate([chunk.lane_indices for chunk in chunks]))
+        np.testing.assert_array_equal(expected.xyz, np.concatenate([chunk.xyz for chunk in chunks]))
+
+    def test_find_rules_batch(self):
+        """
+        Tests that FindRulesBatch evaluates each query as FindRules does, including an empty batch.
+        """
+        rulebook = self.road_network.rulebook()
+        empty = rulebook.FindRulesBatch([], 1e-3)
+        self.assertEqual([0], list(empty.discrete_value_rules.query_offsets))
+        self.assertEqual([0], list(empty.range_value_rules.query_offsets))
+        self.assertEqual(0, len(empty.discrete_value_rules.rule_indices))
+
+        queries = [[LaneSRange(lane.id(), SRange(0., 100.))] for lane in self.lanes] + [[]]
+        dut = rulebook.FindRulesBatch(queries, 1e-3)
+        for arrays, name in ((dut.discrete_value_rules, 'discrete_value_rules'),
+                             (dut.range_value_rules, 'range_value_rules')):
+            self.assertEqual(len(queries) + 1, len(arrays.query_offsets))
+            for i, ranges in enumerate(queries):
+                expected = getattr(rulebook.FindRules(ranges, 1e-3), name)
+                begin, end = arrays.query_offsets[i], arrays.query_offsets[i + 1]
+                found = [arrays.rule_ids[index].string()
+                         for index in arrays.rule_indices[begin:end]]
+                self.assertEqual(sorted(rule_id.string() for rule_id in expected), sorted(found))
+
+    def test_rulebook_index_matches_find_rules(self):
+        """
+        Tests that RoadRulebookIndex finds the rules FindRules finds at a lane position.
+        """
+        rulebook = self.road_network.rulebook()
+        dut = RoadRulebookIndex(rulebook)
+        discrete_value_rule_ids = [rule_id.string() for rule_id in dut.discrete_value_rule_ids()]
+        range_value_rule_ids = [rule_id.string() for rule_id in dut.range_value_rule_ids()]
+        for lane in self.lanes:
+            for s in (0., 25., 50., 99.):
+                expected = rulebook.FindRules([LaneSRange(lane.id(), SRange(s, s))], 0.)
+                self.assertEqual(
+                    sorted(rule_id.string() for rule_id in expected.discrete_value_rules),
+                    sorted(discrete_value_rule_ids[i]
+                           for i in dut.FindDiscreteValueRules(lane.id(), s)))
+                self.assertEqual(
+                    sorted(rule_id.string() for rule_id in expected.range_value_rules),
+                    sorted(range_value_rule_ids[i] for i in dut.FindRangeValueRules(lane.id(), s)))
+
+    def test_router_follows_branches(self):
+        """
+        Tests that RoadGeometryRouter reaches exactly the lanes connected through ongoing branches,
+        so the lanes to the left and right of a dragway lane are not reachable from it.
+        """
+        dut = RoadGeometryRouter(self.road_geometry)
+        self.assertEqual(2 * len(self.lanes), dut.num_nodes())
+        for start_lane in self.lanes:
+            reachable = self._reachable_lane_ids(start_lane)
+            start = RoadPosition(start_lane, LanePosition(10., 0., 0.))
+            for end_lane in self.lanes:
+                route = dut.FindRoute(start, RoadPosition(end_lane, LanePosition(90., 0., 0.)))
+                if end_lane.id().string() not in reachable:
+                    self.assertIsNone(route)
+                    continue
+                ranges = route.ranges()
+                self.assertEqual(start_lane.id().string(), ranges[0].lane_id().string())
+                self.assertEqual(end_lane.id().string(), ranges[-1].lane_id().string())
+                for current, following in zip(ranges, ranges[1:]):
+                    lane = self.road_geometry.ById().GetLane(current.lane_id())
+                    end = Which.kStart if current.s_range().s1() == 0. else Which.kFinish
+                    self.assertIn(following.lane_id().string(),
+                                  self._ongoing_lane_ids(lane, end))
+        route = dut.FindRoute(RoadPosition(self.lanes[0], LanePosition(90., 0., 0.)),
+                              RoadPosition(self.lanes[0], LanePosition(10., 0., 0.)))
+        self.assertEqual(1, len(route.ranges()))
+        self.assertAlmostEqual(90., route.ranges()[0].s_range().s0())
+        self.assertAlmostEqual(10., route.ranges()[0].s_range().s1())
+
+    def test_tracker_matches_to_road_position(self):
+        """
+        Tests that RoadPositionTracker.Update localizes agents as ToRoadPosition does, also after
+        they change lanes.
+        """
+        dut = RoadPositionTracker(self.road_geometry, 4)
+        for y in (0., 3.7, -3.7, 1.9):
+            inertial_positions = np.array([[10., y, 0.], [50., -y, 0.], [99., y, 1.],
+                                           [-5., y, 0.]])
+            results = dut.Update(inertial_positions)
+            for i, xyz in enumerate(inertial_positions):
+                expected = self.road_geometry.ToRoadPosition(InertialPosition(*xyz))
+                self.assertEqual(expected.road_position.lane.id().string(),
+                                 results.lane_ids[int(results.lane_indices[i])].string())
+                pos = expected.road_position.pos
+                np.testing.assert_allclose([pos.s(), pos.r(), pos.h()],
+                                           results.lane_positions[i], atol=1e-6)
+                self.assertAlmostEqual(expected.distance, results.distances[i], places=6)
+
+    def _ongoing_lane_ids(self, lane, end):
+        """Returns the ids of the lanes ongoing from `end` of `lane`."""
+        branches = lane.GetOngoingBranches(end)
+        return {branches.get(i).lane.id().string() for i in range(branches.size())}
+
+    def _reachable_lane_ids(self, start_lane):
+        """Returns the ids of the lanes reachable from `start_lane` through ongoing branches."""
+        reachable = {start_lane.id().string()}
+        pending = [(start_lane, Which.kStart), (start_lane, Which.kFinish)]
+        while pending:
+            lane, end = pending.pop()
+            branches = lane.GetOngoingBranches(end)
+            for i in range(branches.size()):
+                branch = branches.get(i)
+                if branch.lane.id().string() not in reachable:
+                    reachable.add(branch.lane.id().string())
+                    # The branch lane is left through the end opposite to the one entered.
+                    other_end = Which.kFinish if branch.end == Which.kStart else Which.kStart
+                    pending.append((branch.lane, other_end))
+        return reachable
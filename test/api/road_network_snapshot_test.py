@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+
+# BSD 3-Clause License
+#
+# Copyright (c) 2026, Woven by Toyota. All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# * Neither the name of the copyright holder nor the names of its
+#   contributors may be used to endorse or promote products derived from
+#   this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+"""Unit tests for the maliput.road_network_snapshot module"""
+
+import os
+import tempfile
+import unittest
+
+import numpy as np
+
+from maliput.road_network_snapshot import (
+    RoadNetworkSnapshot,
+    _write,
+    load_snapshot,
+)
+
+
+def _two_lane_contents():
+    """
+    Returns the arrays and contents of a snapshot of two lanes in a row, `a` then `b`.
+    """
+    s = np.array([0., 1., 2., 0., 1.5, 3.])
+    centerlines = np.zeros((6, 3))
+    centerlines[:, 0] = [0., 1., 2., 2., 3.5, 5.]
+    arrays = {
+        'lane_types': np.zeros(2, dtype=np.int32),
+        'lane_offsets': np.array([0, 3, 6], dtype=np.int64),
+        'lane_segment_indices': np.array([0, 1], dtype=np.int32),
+        'segment_junction_indices': np.array([0, 1], dtype=np.int32),
+        's': s,
+        'centerlines': centerlines,
+        'left_boundaries': centerlines + [0., 1., 0.],
+        'right_boundaries': centerlines - [0., 1., 0.],
+        'curvatures': np.zeros(6),
+        # Branch points: 0 at the start of `a`, 1 between `a` and `b`, 2 at the finish of `b`.
+        'side_offsets': np.array([0, 1, 1, 2, 3, 4, 4], dtype=np.int64),
+        'side_lane_ends': np.array([[0, 0], [0, 1], [1, 0], [1, 1]], dtype=np.int32),
+        'lane_end_sides': np.array([[0, 2], [3, 4]], dtype=np.int32),
+        'default_branches': np.array([[[-1, -1], [1, 0]], [[0, 1], [-1, -1]]], dtype=np.int32),
+    }
+    contents = {
+        'road_geometry_id': 'two_lanes',
+        'linear_tolerance': 1e-3,
+        'angular_tolerance': 1e-3,
+        'scale_length': 1.,
+        's_resolution': 1.5,
+        'lane_ids': ['a', 'b'],
+        'segment_ids': ['a_segment', 'b_segment'],
+        'junction_ids': ['a_junction', 'b_junction'],
+        'branch_point_ids': ['0', '1', '2'],
+        'discrete_value_rules': [{
+            'id': 'rule', 'type_id': 'Direction-Usage Rule Type', 'zone': [['a', 0., 2.]],
+            'states': [{'severity': 0, 'related_rules': {}, 'related_unique_ids': {},
+                        'value': 'WithS'}],
+        }],
+        'range_value_rules': [],
+        'traffic_lights': [],
+        'phase_rings': [],
+    }
+    return arrays, contents
+
+
+class TestRoadNetworkSnapshot(unittest.TestCase):
+    """
+    Evaluates snapshot files and the RoadNetworkSnapshot class.
+    """
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, 'road_network.snapshot')
+        self.arrays, self.contents = _two_lane_contents()
+        _write(self.path, self.arrays, self.contents)
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_round_trip(self):
+        """
+        Tests that arrays and contents are loaded back both memory mapped and copied.
+        """
+        for mmap in (True, False):
+            dut = load_snapshot(self.path, mmap=mmap)
+            self.assertIsInstance(dut, RoadNetworkSnapshot)
+            self.assertEqual(['a', 'b'], dut.lane_ids)
+            self.assertEqual('two_lanes', dut.road_geometry_id)
+            self.assertEqual('WithS', dut.discrete_value_rules[0]['states'][0]['value'])
+            np.testing.assert_array_equal(self.arrays['centerlines'], dut.centerlines)
+            np.testing.assert_array_equal(self.arrays['default_branches'], dut.default_branches)
+            self.assertEqual(np.int64, dut.lane_offsets.dtype)
+
+    def test_memory_mapped_arrays_are_read_only(self):
+        """
+        Tests that memory mapped arrays cannot modify the snapshot.
+        """
+        dut = load_snapshot(self.path)
+        with self.assertRaises(ValueError):
+            dut.s[0] = 1.
+
+    def test_lanes(self):
+        """
+        Tests lane lookups and geometry samples.
+        """
+        dut = load_snapshot(self.path)
+        self.assertEqual(2, dut.num_lanes())
+        self.assertEqual(1, dut.lane_index('b'))
+        np.testing.assert_array_equal([0., 1.5, 3.], dut.s[dut.lane_samples(1)])
+        self.assertEqual(3., dut.lane_length(1))
+
+    def test_topology(self):
+        """
+        Tests branch point queries.
+        """
+        dut = load_snapshot(self.path)
+        self.assertEqual(1, dut.branch_point_index(0, 1))
+        self.assertEqual(1, dut.branch_point_index(1, 0))
+        np.testing.assert_array_equal([[1, 0]], dut.ongoing_branches(0, 1))
+        np.testing.assert_array_equal([[0, 1]], dut.confluent_branches(0, 1))
+        np.testing.assert_array_equal(np.zeros((0, 2)), dut.ongoing_branches(0, 0))
+        self.assertEqual((1, 0), dut.default_branch(0, 1))
+        self.assertIsNone(dut.default_branch(1, 1))
+
+    def test_invalid_file(self):
+        """
+        Tests that files which are not snapshots are rejected.
+        """
+        with open(self.path, 'wb') as snapshot:
+            snapshot.write(b'not a snapshot')
+        with self.assertRaises(ValueError):
+            load_snapshot(self.path)
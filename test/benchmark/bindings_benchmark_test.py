@@ -0,0 +1,194 @@
+#!/usr/bin/env python3
+
+# BSD 3-Clause License
+#
+# Copyright (c) 2026, Woven by Toyota. All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# * Neither the name of the copyright holder nor the names of its
+#   contributors may be used to endorse or promote products derived from
+#   this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+"""Benchmarks of the per-call overhead of the hot maliput binding paths"""
+
+import numpy as np
+import pytest
+
+pytest.importorskip('pytest_benchmark')
+
+from conftest import DRAGWAY_PLUGIN_ID, DRAGWAY_PROPERTIES  # noqa: E402
+
+from maliput.api import (  # noqa: E402
+    InertialPosition,
+    LanePosition,
+    LaneSRange,
+    LaneSRoute,
+    RoadPositionTracker,
+    SRange,
+)
+from maliput.math import Vector3  # noqa: E402
+from maliput.utility import (  # noqa: E402
+    GenerateRoadMesh,
+    GenerateRoadMeshLods,
+    ObjFeatures,
+    RoadMeshCache,
+)
+
+
+@pytest.fixture(scope='module')
+def lane(road_network):
+    return road_network.road_geometry().junction(0).segment(0).lane(0)
+
+
+def test_create_road_network(benchmark, road_network):
+    import maliput.plugin
+    benchmark.pedantic(maliput.plugin.create_road_network,
+                       args=(DRAGWAY_PLUGIN_ID, DRAGWAY_PROPERTIES), rounds=5)
+
+
+def test_to_road_position(benchmark, allocations, road_network):
+    road_geometry = road_network.road_geometry()
+    inertial_position = InertialPosition(500., 1., 0.5)
+    allocations(road_geometry.ToRoadPosition, inertial_position)
+    benchmark(road_geometry.ToRoadPosition, inertial_position)
+
+
+def test_to_road_positions(benchmark, allocations, road_network):
+    road_geometry = road_network.road_geometry()
+    inertial_positions = np.column_stack((np.linspace(0., 1000., 1000), np.ones(1000),
+                                          np.full(1000, 0.5)))
+    allocations(road_geometry.ToRoadPositions, inertial_positions, iterations=10)
+    benchmark(road_geometry.ToRoadPositions, inertial_positions)
+
+
+def test_road_position_tracker_update(benchmark, allocations, road_network):
+    road_geometry = road_network.road_geometry()
+    inertial_positions = np.column_stack((np.linspace(0., 1000., 1000), np.ones(1000),
+                                          np.full(1000, 0.5)))
+    tracker = RoadPositionTracker(road_geometry, len(inertial_positions))
+    tracker.Update(inertial_positions)
+    allocations(tracker.Update, inertial_positions, iterations=10)
+    benchmark(tracker.Update, inertial_positions)
+
+
+def test_lane_to_inertial_position(benchmark, allocations, lane):
+    lane_position = LanePosition(500., 0.5, 0.)
+    allocations(lane.ToInertialPosition, lane_position)
+    benchmark(lane.ToInertialPosition, lane_position)
+
+
+def test_lane_to_lane_position(benchmark, allocations, lane):
+    inertial_position = InertialPosition(500., 0.5, 0.)
+    allocations(lane.ToLanePosition, inertial_position)
+    benchmark(lane.ToLanePosition, inertial_position)
+
+
+def test_lane_traversal(benchmark, allocations, lane):
+    def traverse():
+        return lane.segment().lane(0).to_left()
+
+    allocations(traverse)
+    benchmark(traverse)
+
+
+def test_find_rules(benchmark, allocations, road_network, lane):
+    rulebook = road_network.rulebook()
+    ranges = [LaneSRange(lane.id(), SRange(0., 100.))]
+    allocations(rulebook.FindRules, ranges, 1e-3)
+    benchmark(rulebook.FindRules, ranges, 1e-3)
+
+
+def test_sample_ahead_waypoints(benchmark, allocations, road_network, lane):
+    road_geometry = road_network.road_geometry()
+    route = LaneSRoute([LaneSRange(lane.id(), SRange(0., 1000.))])
+    allocations(road_geometry.SampleAheadWaypoints, route, 0.1, iterations=10)
+    benchmark(road_geometry.SampleAheadWaypoints, route, 0.1)
+
+
+def test_sample_ahead_waypoint_arrays(benchmark, allocations, road_network, lane):
+    road_geometry = road_network.road_geometry()
+    route = LaneSRoute([LaneSRange(lane.id(), SRange(0., 1000.))])
+    allocations(road_geometry.SampleAheadWaypointArrays, route, 0.1, iterations=10)
+    benchmark(road_geometry.SampleAheadWaypointArrays, route, 0.1)
+
+
+def test_sample_ahead_waypoint_chunks(benchmark, allocations, road_network, lane):
+    road_geometry = road_network.road_geometry()
+    route = LaneSRoute([LaneSRange(lane.id(), SRange(0., 1000.))])
+
+    def consume():
+        for _ in road_geometry.SampleAheadWaypointChunks(route, 0.1, chunk_size=1024):
+            pass
+
+    allocations(consume, iterations=10)
+    benchmark(consume)
+
+
+def test_generate_road_mesh(benchmark, road_network):
+    benchmark.pedantic(GenerateRoadMesh, args=(road_network, ObjFeatures()), rounds=5)
+
+
+def test_generate_road_mesh_lods(benchmark, road_network):
+    benchmark.pedantic(GenerateRoadMeshLods, args=(road_network, ObjFeatures(), [0.5, 2., 8.]),
+                       rounds=5)
+
+
+def test_road_mesh_cache_generate(benchmark, road_network, lane):
+    cache = RoadMeshCache(road_network)
+    plain = ObjFeatures()
+    highlighted = ObjFeatures()
+    highlighted.highlighted_segments = [lane.segment().id()]
+    cache.Generate(plain)
+    cache.Generate(highlighted)
+
+    def toggle():
+        cache.Generate(highlighted)
+        return cache.Generate(plain)
+
+    benchmark(toggle)
+
+
+def test_vector3_construction(benchmark, allocations):
+    allocations(Vector3, 1., 2., 3.)
+    benchmark(Vector3, 1., 2., 3.)
+
+
+def test_vector3_add(benchmark, allocations):
+    a = Vector3(1., 2., 3.)
+    b = Vector3(4., 5., 6.)
+    allocations(a.__add__, b)
+    benchmark(a.__add__, b)
+
+
+def test_vector3_dot(benchmark, allocations):
+    a = Vector3(1., 2., 3.)
+    b = Vector3(4., 5., 6.)
+    allocations(a.dot, b)
+    benchmark(a.dot, b)
+
+
+def test_vector3_cross(benchmark, allocations):
+    a = Vector3(1., 2., 3.)
+    b = Vector3(4., 5., 6.)
+    allocations(a.cross, b)
+    benchmark(a.cross, b)
@@ -0,0 +1,160 @@
+# BSD 3-Clause License
+#
+# Copyright (c) 2026, Woven by Toyota. All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# * Neither the name of the copyright holder nor the names of its
+#   contributors may be used to endorse or promote products derived from
+#   this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+"""
+Fixtures of the maliput binding benchmarks.
+
+The benchmarks run on pytest-benchmark, which reports the calls per second (OPS) of every
+benchmarked binding, and are not part of the colcon test suite. Run them with:
+
+    pytest test/benchmark --benchmark-columns=ops,mean,stddev,rounds
+
+Timings are compared against a stored baseline with pytest-benchmark's own storage:
+
+    pytest test/benchmark --benchmark-save=baseline
+    pytest test/benchmark --benchmark-compare=0001_baseline --benchmark-compare-fail=mean:10%
+
+The `allocations` fixture records the Python heap usage of each binding and compares it against
+the committed allocation_baseline.json, which `--allocation-save` refreshes. Benchmarks missing
+from the baseline are measured but not checked.
+
+Road network benchmarks run on an eight lane dragway built by the maliput_dragway plugin, an
+external dependency of these benchmarks only, and are skipped when it is not installed. Their
+allocation baseline must therefore be recorded where the plugin is available.
+"""
+
+import json
+import os
+import tracemalloc
+
+import pytest
+
+DRAGWAY_PLUGIN_ID = 'maliput_dragway'
+DRAGWAY_PROPERTIES = {
+    'num_lanes': '8',
+    'length': '1000.',
+    'lane_width': '3.7',
+    'shoulder_width': '3.',
+    'maximum_height': '5.',
+    'linear_tolerance': '1e-3',
+    'angular_tolerance': '1e-3',
+}
+
+_ALLOCATION_BASELINE = os.path.join(os.path.dirname(__file__), 'allocation_baseline.json')
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup('maliput allocations')
+    group.addoption('--allocation-baseline', default=_ALLOCATION_BASELINE,
+                    help='JSON file with the allocation baseline of each benchmark.')
+    group.addoption('--allocation-save', action='store_true',
+                    help='Overwrite the allocation baseline with the measured allocations.')
+    group.addoption('--allocation-tolerance', type=float, default=0.1,
+                    help='Relative allocation growth over the baseline that fails a benchmark.')
+
+
+def pytest_configure(config):
+    config.maliput_allocations = {}
+
+
+def pytest_sessionfinish(session, exitstatus):
+    config = session.config
+    if config.getoption('--allocation-save', default=False) and config.maliput_allocations:
+        path = config.getoption('--allocation-baseline')
+        # Entries of benchmarks that did not run, such as skipped road network ones, are kept.
+        allocations = _load_allocation_baseline(path)
+        allocations.update(config.maliput_allocations)
+        with open(path, 'w') as baseline:
+            json.dump(allocations, baseline, indent=2, sort_keys=True)
+            baseline.write('\n')
+
+
+def _load_allocation_baseline(path):
+    if not os.path.isfile(path):
+        return {}
+    with open(path) as baseline:
+        return json.load(baseline)
+
+
+@pytest.fixture
+def allocations(request, benchmark):
+    """
+    Returns a function measuring the Python heap allocations of calling `function(*args)`.
+
+    Two figures are recorded into the benchmark's extra info: the peak of bytes allocated while
+    a single call runs, and the blocks still allocated per call after `iterations` calls, which
+    exposes leaked references. Allocations made by maliput itself through the C++ allocator are
+    not traced.
+    """
+    def measure(function, *args, iterations=1000):
+        function(*args)
+        tracemalloc.start()
+        try:
+            function(*args)
+            peak_bytes = tracemalloc.get_traced_memory()[1]
+            before = tracemalloc.take_snapshot()
+            for _ in range(iterations):
+                function(*args)
+            after = tracemalloc.take_snapshot()
+        finally:
+            tracemalloc.stop()
+        retained_blocks = sum(
+            stat.count_diff for stat in after.compare_to(before, 'filename')) / iterations
+        measured = {'peak_bytes_per_call': peak_bytes,
+                    'retained_blocks_per_call': retained_blocks}
+        benchmark.extra_info.update(measured)
+        request.config.maliput_allocations[request.node.name] = measured
+
+        if request.config.getoption('--allocation-save'):
+            return measured
+        baseline = _load_allocation_baseline(
+            request.config.getoption('--allocation-baseline')).get(request.node.name)
+        if baseline is not None:
+            tolerance = 1. + request.config.getoption('--allocation-tolerance')
+            for name, value in measured.items():
+                # One extra block or 64 bytes are tolerated on top of the relative growth.
+                slack = 64 if name == 'peak_bytes_per_call' else 1
+                assert value <= baseline[name] * tolerance + slack, \
+                    '{} grew from {} to {}.'.format(name, baseline[name], value)
+        return measured
+
+    return measure
+
+
+@pytest.fixture(scope='session')
+def road_network():
+    """Returns the dragway road network shared by the benchmarks."""
+    import maliput.plugin
+    try:
+        road_network = maliput.plugin.create_road_network(DRAGWAY_PLUGIN_ID, DRAGWAY_PROPERTIES)
+    except Exception as error:
+        pytest.skip('Cannot load the {} plugin: {}'.format(DRAGWAY_PLUGIN_ID, error))
+    if road_network is None:
+        pytest.skip('The {} plugin built no road network.'.format(DRAGWAY_PLUGIN_ID))
+    return road_network
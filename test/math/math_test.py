@@ -35,10 +35,13 @@
 import math as m
 import unittest
 
+import numpy as np
+
 from maliput.math import (
     Quaternion,
     RollPitchYaw,
     Vector3,
+    Vector3Array,
     Vector4,
 )
 
@@ -143,3 +146,85 @@ class TestMaliputMath(unittest.TestCase):
         self.assertTrue(kDut.z() == 0.306)
         self.assertTrue(kDut.coeffs() == Vector4(0.884, 0.306, 0.177, 0.306))
         self.assertEqual(kDut.__str__(), "(w: 0.884, x: 0.306, y: 0.177, z: 0.306)")
+
+    def test_vector3_numpy(self):
+        """
+        Evaluates the NumPy constructor and the buffer protocol.
+        """
+        kDut = Vector3(np.array([25., 158., 33.]))
+        self.assertEqual(kDut, Vector3(25., 158., 33.))
+        self.assertEqual(Vector3([1, 2, 3]), Vector3(1., 2., 3.))
+        with self.assertRaises(ValueError):
+            Vector3(np.array([1., 2.]))
+
+        kView = np.asarray(kDut)
+        self.assertEqual((3,), kView.shape)
+        self.assertEqual([25., 158., 33.], kView.tolist())
+        kView[0] = 1.
+        self.assertEqual(1., kDut.x())
+
+    def test_vector4_numpy(self):
+        """
+        Evaluates the NumPy constructor and the buffer protocol.
+        """
+        kDut = Vector4(np.array([25., 158., 33., 0.02]))
+        self.assertEqual(kDut, Vector4(25., 158., 33., 0.02))
+        with self.assertRaises(ValueError):
+            Vector4(np.array([1., 2., 3.]))
+
+        kView = np.asarray(kDut)
+        self.assertEqual((4,), kView.shape)
+        self.assertEqual([25., 158., 33., 0.02], kView.tolist())
+        kView[3] = 1.
+        self.assertEqual(1., kDut.w())
+
+    def test_quaternion_numpy(self):
+        """
+        Evaluates the NumPy constructor and conversion.
+        """
+        kDut = Quaternion(np.array([0.884, 0.306, 0.177, 0.306]))
+        self.assertEqual(0.884, kDut.w())
+        self.assertEqual(0.306, kDut.x())
+        self.assertEqual(0.177, kDut.y())
+        self.assertEqual(0.306, kDut.z())
+        self.assertEqual([0.884, 0.306, 0.177, 0.306], np.asarray(kDut).tolist())
+        self.assertEqual(np.float32, np.asarray(kDut, dtype=np.float32).dtype)
+
+    def test_vector3_array(self):
+        """
+        Evaluates the constructors, accessors and vectorized operations.
+        """
+        kDut = Vector3Array(2)
+        self.assertEqual(2, len(kDut))
+        self.assertEqual(2, kDut.size())
+        self.assertEqual(Vector3(0., 0., 0.), kDut[1])
+        kDut[1] = Vector3(1., 2., 3.)
+        self.assertEqual(Vector3(1., 2., 3.), kDut[-1])
+        with self.assertRaises(IndexError):
+            kDut[2]
+
+        kDut = Vector3Array(np.array([[2., 3., 6.], [1., 2., 3.]]))
+        kView = np.asarray(kDut)
+        self.assertEqual((2, 3), kView.shape)
+        self.assertEqual([[2., 3., 6.], [1., 2., 3.]], kView.tolist())
+        kView[0, 0] = 3.
+        self.assertEqual(Vector3(3., 3., 6.), kDut[0])
+        kView[0, 0] = 2.
+
+        self.assertEqual([7., m.sqrt(14.)], kDut.norm().tolist())
+        self.assertEqual([49., 14.], kDut.dot(kDut).tolist())
+        kOther = Vector3Array(np.array([[1., 0., 0.], [4., 5., 6.]]))
+        self.assertEqual([[0., 6., -3.], [-3., 6., -3.]], np.asarray(kDut.cross(kOther)).tolist())
+        np.testing.assert_allclose(np.asarray(kDut.normalized()),
+                                   [[2. / 7., 3. / 7., 6. / 7.],
+                                    [1. / m.sqrt(14.), 2. / m.sqrt(14.), 3. / m.sqrt(14.)]])
+        with self.assertRaises(ValueError):
+            kDut.dot(Vector3Array(3))
+        with self.assertRaises(ValueError):
+            Vector3Array(1).normalized()
+        with self.assertRaises(ValueError):
+            Vector3Array(np.array([1., 2., 3.]))
+        with self.assertRaises(ValueError):
+            Vector3Array(-1)
+        with self.assertRaises(ValueError):
+            Vector3Array(-(1 << 62))
@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+
+# BSD 3-Clause License
+#
+# Copyright (c) 2026, Woven by Toyota. All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# * Neither the name of the copyright holder nor the names of its
+#   contributors may be used to endorse or promote products derived from
+#   this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+"""Import-time regression tests for the maliput package"""
+
+import os
+import subprocess
+import sys
+import textwrap
+import unittest
+
+
+def _run(code, plugin_path=None):
+    """
+    Runs `code` in a fresh interpreter and returns its standard output.
+    """
+    env = dict(os.environ)
+    env.pop('MALIPUT_PLUGIN_PATH', None)
+    if plugin_path is not None:
+        env['MALIPUT_PLUGIN_PATH'] = plugin_path
+    return subprocess.run([sys.executable, '-c', textwrap.dedent(code)], env=env, check=True,
+                          stdout=subprocess.PIPE, universal_newlines=True).stdout.strip()
+
+
+class TestMaliputImport(unittest.TestCase):
+    """
+    Evaluates what importing maliput and its submodules loads.
+    """
+
+    def test_import_loads_no_extension(self):
+        """
+        Tests that importing maliput neither imports submodules nor discovers plugin paths.
+        """
+        output = _run('''
+            import os
+            import sys
+            import maliput
+            print(sorted(name for name in sys.modules if name.startswith('maliput.')))
+            print('MALIPUT_PLUGIN_PATH' in os.environ)
+            ''')
+        self.assertEqual('[]\nFalse', output)
+
+    def test_submodule_is_imported_on_first_access(self):
+        """
+        Tests that accessing a submodule only imports that submodule.
+        """
+        output = _run('''
+            import sys
+            import maliput
+            vector = maliput.math.Vector3(1., 2., 3.)
+            print(sorted(name for name in sys.modules if name.startswith('maliput.')))
+            print(maliput.math is sys.modules['maliput.math'])
+            ''')
+        self.assertEqual("['maliput.math']\nTrue", output)
+
+    def test_unknown_attribute(self):
+        """
+        Tests that unknown attributes still raise AttributeError.
+        """
+        output = _run('''
+            import maliput
+            print(hasattr(maliput, 'not_a_submodule'))
+            print('plugin' in dir(maliput))
+            ''')
+        self.assertEqual('False\nTrue', output)
+
+    def test_plugin_import_updates_plugin_path(self):
+        """
+        Tests that importing maliput.plugin updates MALIPUT_PLUGIN_PATH once, keeping its value.
+        """
+        output = _run('''
+            import os
+            import maliput
+            import maliput.plugin
+            plugin_path = os.environ['MALIPUT_PLUGIN_PATH']
+            maliput.update_plugin_path()
+            print(plugin_path == os.environ['MALIPUT_PLUGIN_PATH'])
+            print(plugin_path.split(os.pathsep)[-1])
+            ''', plugin_path='/my/plugins')
+        self.assertEqual('True\n/my/plugins', output)
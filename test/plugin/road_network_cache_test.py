@@ -0,0 +1,193 @@
+#!/usr/bin/env python3
+
+# BSD 3-Clause License
+#
+# Copyright (c) 2026, Woven by Toyota. All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# * Neither the name of the copyright holder nor the names of its
+#   contributors may be used to endorse or promote products derived from
+#   this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+"""Unit tests for the maliput.road_network_cache module"""
+
+import itertools
+import os
+import tempfile
+import unittest
+import warnings
+from unittest import mock
+
+from maliput.road_network_cache import (
+    RoadNetworkCache,
+)
+
+
+class FakeLoader:
+    """
+    Stands in for maliput.plugin.create_road_network, counting the road networks built.
+    """
+
+    def __init__(self):
+        self.calls = 0
+
+    def __call__(self, plugin_id, properties):
+        self.calls += 1
+        return object()
+
+
+class TestRoadNetworkCache(unittest.TestCase):
+    """
+    Evaluates the RoadNetworkCache class.
+    """
+
+    def test_hit_returns_shared_road_network(self):
+        """
+        Tests that repeated requests share the same road network.
+        """
+        loader = FakeLoader()
+        dut = RoadNetworkCache(loader=loader)
+        road_network = dut.get('maliput_dragway', {'num_lanes': '2'})
+        self.assertIs(road_network, dut.get('maliput_dragway', {'num_lanes': '2'}))
+        self.assertEqual(1, loader.calls)
+        self.assertEqual(1, dut.hits)
+        self.assertEqual(1, dut.misses)
+        self.assertEqual(1, len(dut))
+
+    def test_key_includes_plugin_and_properties(self):
+        """
+        Tests that different plugins or properties are cached separately.
+        """
+        loader = FakeLoader()
+        dut = RoadNetworkCache(loader=loader)
+        first = dut.get('maliput_dragway', {'num_lanes': '2'})
+        self.assertIsNot(first, dut.get('maliput_dragway', {'num_lanes': '3'}))
+        self.assertIsNot(first, dut.get('maliput_multilane', {'num_lanes': '2'}))
+        self.assertEqual(3, loader.calls)
+
+    def test_modified_source_file_invalidates_entry(self):
+        """
+        Tests that editing a source file referenced by the properties rebuilds the road network.
+        """
+        loader = FakeLoader()
+        dut = RoadNetworkCache(loader=loader)
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'map.xodr')
+            with open(path, 'w') as source:
+                source.write('first')
+            first = dut.get('maliput_malidrive', {'opendrive_file': path})
+            self.assertIs(first, dut.get('maliput_malidrive', {'opendrive_file': path}))
+            with open(path, 'w') as source:
+                source.write('second version')
+            self.assertIsNot(first, dut.get('maliput_malidrive', {'opendrive_file': path}))
+        self.assertEqual(2, loader.calls)
+
+    def test_hash_files(self):
+        """
+        Tests that content hashing ignores modification times.
+        """
+        loader = FakeLoader()
+        dut = RoadNetworkCache(hash_files=True, loader=loader)
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'map.xodr')
+            with open(path, 'w') as source:
+                source.write('contents')
+            first = dut.get('maliput_malidrive', {'opendrive_file': path})
+            os.utime(path, ns=(0, 0))
+            self.assertIs(first, dut.get('maliput_malidrive', {'opendrive_file': path}))
+        self.assertEqual(1, loader.calls)
+
+    def test_lru_eviction(self):
+        """
+        Tests that the least recently used entry is evicted beyond max_entries.
+        """
+        loader = FakeLoader()
+        dut = RoadNetworkCache(max_entries=2, loader=loader)
+        first = dut.get('plugin', {'id': '1'})
+        dut.get('plugin', {'id': '2'})
+        self.assertIs(first, dut.get('plugin', {'id': '1'}))
+        dut.get('plugin', {'id': '3'})
+        self.assertEqual(2, len(dut))
+        self.assertIs(first, dut.get('plugin', {'id': '1'}))
+        self.assertEqual(3, loader.calls)
+        dut.get('plugin', {'id': '2'})
+        self.assertEqual(4, loader.calls)
+
+    def test_memory_cap(self):
+        """
+        Tests that entries are evicted beyond max_memory_bytes.
+        """
+        dut = RoadNetworkCache(max_memory_bytes=150, loader=FakeLoader())
+        # Every road network appears to grow the resident set size by 100 bytes.
+        with mock.patch('maliput.road_network_cache._rss_bytes',
+                        side_effect=itertools.count(0, 100)):
+            dut.get('plugin', {'id': '1'})
+            self.assertEqual(100, dut.memory_bytes())
+            dut.get('plugin', {'id': '2'})
+        self.assertEqual(1, len(dut))
+        self.assertEqual(100, dut.memory_bytes())
+        dut.clear()
+        self.assertEqual(0, len(dut))
+        self.assertEqual(0, dut.memory_bytes())
+
+    def test_size_estimator(self):
+        """
+        Tests that a size_estimator replaces the resident set size estimate.
+        """
+        sizes = {}
+
+        def loader(plugin_id, properties):
+            road_network = object()
+            sizes[road_network] = int(properties['size'])
+            return road_network
+
+        dut = RoadNetworkCache(max_memory_bytes=150, loader=loader, size_estimator=sizes.get)
+        with mock.patch('maliput.road_network_cache._rss_bytes', return_value=0):
+            first = dut.get('plugin', {'size': '100'})
+            self.assertEqual(100, dut.memory_bytes())
+            dut.get('plugin', {'size': '40'})
+            self.assertEqual(140, dut.memory_bytes())
+            dut.get('plugin', {'size': '20'})
+        self.assertEqual(2, len(dut))
+        self.assertEqual(60, dut.memory_bytes())
+        self.assertIsNot(first, dut.get('plugin', {'size': '100'}))
+
+    def test_memory_cap_warns_without_rss(self):
+        """
+        Tests that a memory cap warns when the resident set size is not available and no
+        size_estimator is given.
+        """
+        with mock.patch('maliput.road_network_cache._rss_bytes', return_value=0):
+            with self.assertWarns(RuntimeWarning):
+                RoadNetworkCache(max_memory_bytes=150, loader=FakeLoader())
+            with warnings.catch_warnings():
+                warnings.simplefilter('error')
+                RoadNetworkCache(max_memory_bytes=150, loader=FakeLoader(), size_estimator=len)
+                RoadNetworkCache(loader=FakeLoader())
+
+    def test_invalid_max_entries(self):
+        """
+        Tests that max_entries must be positive.
+        """
+        with self.assertRaises(ValueError):
+            RoadNetworkCache(max_entries=0)
@@ -0,0 +1,152 @@
+# BSD 3-Clause License
+#
+# Copyright (c) 2026, Woven by Toyota. All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# * Neither the name of the copyright holder nor the names of its
+#   contributors may be used to endorse or promote products derived from
+#   this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+"""Unit tests for the maliput.road_network_handle module"""
+
+import multiprocessing
+import pickle
+import unittest
+from unittest import mock
+
+from maliput.road_network_cache import (
+    RoadNetworkCache,
+)
+from maliput.road_network_handle import (
+    RoadNetworkHandle,
+)
+
+
+class FakeLoader:
+    """
+    Stands in for maliput.plugin.create_road_network, counting the road networks built.
+    """
+
+    def __init__(self):
+        self.calls = 0
+
+    def __call__(self, plugin_id, properties):
+        self.calls += 1
+        return object()
+
+
+def _resolve_and_count(handle, loader):
+    """
+    Resolves `handle` and returns how many road networks `loader` built in this process.
+    """
+    handle.road_network()
+    return loader.calls
+
+
+class TestRoadNetworkHandle(unittest.TestCase):
+    """
+    Evaluates the RoadNetworkHandle class.
+    """
+
+    def setUp(self):
+        self.loader = FakeLoader()
+        patcher = mock.patch('maliput.road_network_cache.default_cache',
+                             return_value=RoadNetworkCache(loader=self.loader))
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_requires_plugin_id_or_snapshot_path(self):
+        """
+        Tests that a handle must refer to something.
+        """
+        with self.assertRaises(ValueError):
+            RoadNetworkHandle()
+
+    def test_road_network_is_built_lazily_and_shared(self):
+        """
+        Tests that road networks are built on first use and shared between equal handles.
+        """
+        dut = RoadNetworkHandle('maliput_dragway', {'num_lanes': 2})
+        self.assertEqual(0, self.loader.calls)
+        road_network = dut.road_network()
+        self.assertIs(road_network, dut.road_network())
+        same = RoadNetworkHandle('maliput_dragway', {'num_lanes': '2'})
+        self.assertIs(road_network, same.road_network())
+        self.assertEqual(1, self.loader.calls)
+
+    def test_pickle_round_trip(self):
+        """
+        Tests that pickling only carries how the road network is built.
+        """
+        dut = RoadNetworkHandle('maliput_dragway', {'num_lanes': '2'}, snapshot_path='map.snapshot')
+        dut.road_network()
+        restored = pickle.loads(pickle.dumps(dut))
+        self.assertEqual(dut, restored)
+        self.assertEqual(hash(dut), hash(restored))
+        self.assertEqual('maliput_dragway', restored.plugin_id)
+        self.assertEqual({'num_lanes': '2'}, restored.properties)
+        self.assertEqual('map.snapshot', restored.snapshot_path)
+        self.assertIsNone(restored._road_network)
+
+    def test_equality(self):
+        """
+        Tests that handles compare by plugin id, properties and snapshot path.
+        """
+        properties = {'num_lanes': '2', 'length': '100'}
+        dut = RoadNetworkHandle('maliput_dragway', properties)
+        reordered = dict(reversed(list(properties.items())))
+        self.assertEqual(dut, RoadNetworkHandle('maliput_dragway', reordered))
+        self.assertNotEqual(dut, RoadNetworkHandle('maliput_dragway', {'num_lanes': '3'}))
+        self.assertNotEqual(dut, RoadNetworkHandle('maliput_dragway', properties,
+                                                   snapshot_path='map.snapshot'))
+
+    def test_snapshot_only_handle(self):
+        """
+        Tests that a snapshot only handle loads the snapshot memory mapped and cannot build the
+        road network.
+        """
+        dut = RoadNetworkHandle(snapshot_path='map.snapshot')
+        with self.assertRaises(ValueError):
+            dut.road_network()
+        with mock.patch('maliput.road_network_snapshot.load_snapshot') as load_snapshot:
+            snapshot = dut.snapshot()
+            self.assertIs(snapshot, dut.snapshot())
+        load_snapshot.assert_called_once_with('map.snapshot', mmap=True)
+
+    def test_snapshot_requires_snapshot_path(self):
+        """
+        Tests that snapshot() fails without a snapshot path.
+        """
+        with self.assertRaises(ValueError):
+            RoadNetworkHandle('maliput_dragway', {}).snapshot()
+
+    @unittest.skipUnless('fork' in multiprocessing.get_all_start_methods(), 'fork is not available')
+    def test_forked_workers_reuse_inherited_road_network(self):
+        """
+        Tests that workers forked after the road network was built resolve handles to it instead
+        of building it again.
+        """
+        dut = RoadNetworkHandle('maliput_dragway', {'num_lanes': '2'})
+        dut.road_network()
+        with multiprocessing.get_context('fork').Pool(1) as pool:
+            self.assertEqual(1, pool.apply(_resolve_and_count, (dut, self.loader)))
@@ -0,0 +1,299 @@
+# BSD 3-Clause License
+#
+# Copyright (c) 2026, Woven by Toyota. All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# * Neither the name of the copyright holder nor the names of its
+#   contributors may be used to endorse or promote products derived from
+#   this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+"""
+Behavior tests of the maliput::utility python binding on a dragway.
+
+They are skipped when the maliput_dragway plugin is not installed.
+"""
+
+import os
+import tempfile
+import unittest
+
+import numpy as np
+
+from maliput.api import (
+    SegmentId,
+)
+
+from maliput.utility import (
+    GenerateObjFile,
+    GenerateRoadMesh,
+    GenerateRoadMeshLods,
+    GenerateRoadMeshObjFile,
+    ObjFeatures,
+    RoadMeshCache,
+    RoadMeshMaterial,
+)
+
+DRAGWAY_PLUGIN_ID = 'maliput_dragway'
+DRAGWAY_PROPERTIES = {
+    'num_lanes': '3',
+    'length': '100.',
+    'lane_width': '3.7',
+    'shoulder_width': '3.',
+    'maximum_height': '5.',
+    'linear_tolerance': '1e-3',
+    'angular_tolerance': '1e-3',
+}
+
+
+def _create_dragway():
+    """
+    Returns the dragway road network the tests run on, skipping them when it cannot be built.
+    """
+    import maliput.plugin
+    try:
+        road_network = maliput.plugin.create_road_network(DRAGWAY_PLUGIN_ID, DRAGWAY_PROPERTIES)
+    except Exception as error:
+        raise unittest.SkipTest('Cannot load the {} plugin: {}'.format(DRAGWAY_PLUGIN_ID, error))
+    if road_network is None:
+        raise unittest.SkipTest('The {} plugin built no road network.'.format(DRAGWAY_PLUGIN_ID))
+    return road_network
+
+
+def _read_obj(path):
+    """
+    Returns the (V, 3) vertices and the (F, 3) zero based vertex indices of the triangles of the
+    OBJ file at `path`. Polygons are split in triangle fans.
+    """
+    vertices = []
+    triangles = []
+    with open(path) as obj_file:
+        for line in obj_file:
+            fields = line.split()
+            if not fields:
+                continue
+            if fields[0] == 'v':
+                vertices.append([float(value) for value in fields[1:4]])
+            elif fields[0] == 'f':
+                corners = [int(field.split('/')[0]) - 1 for field in fields[1:]]
+                triangles.extend([corners[0], corners[i], corners[i + 1]]
+                                 for i in range(1, len(corners) - 1))
+    return np.array(vertices), np.array(triangles)
+
+
+def _area(vertices, triangles):
+    """
+    Returns the total area of `triangles`.
+    """
+    a, b, c = (vertices[triangles[:, i]] for i in range(3))
+    return 0.5 * np.linalg.norm(np.cross(b - a, c - a), axis=1).sum()
+
+
+class TestDragway(unittest.TestCase):
+    """
+    Evaluates the results of the maliput.utility bindings on a three lane dragway.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        cls.road_network = _create_dragway()
+
+    def test_road_mesh_obj_file_matches_generate_obj_file(self):
+        """
+        Tests that GenerateRoadMeshObjFile covers the same road surface GenerateObjFile does.
+        """
+        features = ObjFeatures()
+        features.draw_stripes = False
+        features.draw_arrows = False
+        features.draw_lane_haze = False
+        features.draw_branch_points = False
+        features.draw_elevation_bounds = False
+        with tempfile.TemporaryDirectory() as directory:
+            GenerateObjFile(self.road_network, directory, 'expected', features)
+            GenerateRoadMeshObjFile(self.road_network, directory, 'dut', features, num_threads=2,
+                                    batch_size=1)
+            self.assertTrue(os.path.isfile(os.path.join(directory, 'dut.mtl')))
+            expected_vertices, expected_triangles = _read_obj(
+                os.path.join(directory, 'expected.obj'))
+            vertices, triangles = _read_obj(os.path.join(directory, 'dut.obj'))
+
+        np.testing.assert_allclose(expected_vertices.min(axis=0), vertices.min(axis=0), atol=1e-6)
+        np.testing.assert_allclose(expected_vertices.max(axis=0), vertices.max(axis=0), atol=1e-6)
+        self.assertAlmostEqual(_area(expected_vertices, expected_triangles),
+                               _area(vertices, triangles), delta=1e-3)
+
+    def test_road_mesh_obj_file_elevation_bounds_match_generate_obj_file(self):
+        """
+        Tests that GenerateRoadMeshObjFile draws elevation bounds up to the same height
+        GenerateObjFile does, over the same road surface.
+        """
+        features = ObjFeatures()
+        features.draw_stripes = False
+        features.draw_arrows = False
+        features.draw_lane_haze = False
+        features.draw_branch_points = False
+        features.draw_elevation_bounds = True
+        with tempfile.TemporaryDirectory() as directory:
+            GenerateObjFile(self.road_network, directory, 'expected', features)
+            GenerateRoadMeshObjFile(self.road_network, directory, 'dut', features)
+            expected_vertices, _ = _read_obj(os.path.join(directory, 'expected.obj'))
+            vertices, _ = _read_obj(os.path.join(directory, 'dut.obj'))
+
+        np.testing.assert_allclose(expected_vertices.min(axis=0), vertices.min(axis=0), atol=1e-6)
+        np.testing.assert_allclose(expected_vertices.max(axis=0), vertices.max(axis=0), atol=1e-6)
+        self.assertAlmostEqual(float(DRAGWAY_PROPERTIES['maximum_height']), vertices[:, 2].max())
+
+    def test_road_mesh_obj_file_rejects_unsupported_features(self):
+        """
+        Tests that GenerateRoadMeshObjFile rejects the features it cannot honor.
+        """
+        with tempfile.TemporaryDirectory() as directory:
+            for name, value in (('off_grid_mesh_generation', True),
+                                ('simplify_mesh_threshold', 0.1),
+                                ('max_grid_unit', 0.)):
+                features = ObjFeatures()
+                setattr(features, name, value)
+                with self.assertRaises(ValueError):
+                    GenerateRoadMeshObjFile(self.road_network, directory, 'dut', features)
+
+    def test_road_mesh_matches_road_mesh_obj_file(self):
+        """
+        Tests that GenerateRoadMesh returns the meshes GenerateRoadMeshObjFile writes.
+        """
+        features = ObjFeatures()
+        dut = GenerateRoadMesh(self.road_network, features, num_threads=2)
+        with tempfile.TemporaryDirectory() as directory:
+            GenerateRoadMeshObjFile(self.road_network, directory, 'expected', features)
+            expected_vertices, expected_triangles = _read_obj(
+                os.path.join(directory, 'expected.obj'))
+
+        np.testing.assert_allclose(expected_vertices, dut.vertices, atol=1e-6)
+        np.testing.assert_array_equal(expected_triangles, dut.faces)
+        self.assertEqual((len(dut.vertices), 3), dut.normals.shape)
+        np.testing.assert_allclose(1., np.linalg.norm(dut.normals, axis=1))
+        self.assertEqual(len(dut.faces), len(dut.face_materials))
+        self.assertIn(int(RoadMeshMaterial.kAsphalt), dut.face_materials)
+        self.assertIn(int(RoadMeshMaterial.kBranchPointGlow), dut.face_materials)
+
+        # The segment and every branch point.
+        num_branch_points = self.road_network.road_geometry().num_branch_points()
+        self.assertEqual(1 + num_branch_points, len(dut.object_names))
+        self.assertEqual(0, dut.object_face_offsets[0])
+        self.assertEqual(len(dut.faces), dut.object_face_offsets[-1])
+        self.assertTrue(np.all(np.diff(dut.object_face_offsets) > 0))
+        for i in range(len(dut.object_names)):
+            faces = dut.faces[dut.object_face_offsets[i]:dut.object_face_offsets[i + 1]]
+            corners = dut.vertices[faces.ravel()]
+            np.testing.assert_allclose(corners.min(axis=0), dut.object_bounding_boxes[i, 0])
+            np.testing.assert_allclose(corners.max(axis=0), dut.object_bounding_boxes[i, 1])
+
+    def test_road_mesh_draws_upper_elevation_bounds(self):
+        """
+        Tests that GenerateRoadMesh draws the upper elevation bound of the lanes when
+        draw_elevation_bounds is set, and nothing of it otherwise.
+        """
+        features = ObjFeatures()
+        features.draw_elevation_bounds = True
+        dut = GenerateRoadMesh(self.road_network, features)
+        faces = dut.faces[dut.face_materials == int(RoadMeshMaterial.kElevationBounds)]
+        self.assertGreater(len(faces), 0)
+        maximum_height = float(DRAGWAY_PROPERTIES['maximum_height'])
+        np.testing.assert_allclose(maximum_height, dut.vertices[faces.ravel(), 2], atol=1e-6)
+
+        features.draw_elevation_bounds = False
+        dut = GenerateRoadMesh(self.road_network, features)
+        self.assertNotIn(int(RoadMeshMaterial.kElevationBounds), dut.face_materials)
+
+    def test_road_mesh_cache_only_regenerates_changed_tiles(self):
+        """
+        Tests that RoadMeshCache returns the meshes GenerateRoadMesh does and only tessellates
+        the segments whose highlighting changed.
+        """
+        num_items = 1 + self.road_network.road_geometry().num_branch_points()
+        features = ObjFeatures()
+        dut = RoadMeshCache(self.road_network)
+
+        dut.Generate(features)
+        self.assertEqual((0, num_items), (dut.num_hits(), dut.num_misses()))
+        self.assertEqual(num_items, dut.num_tiles())
+        self.assertGreater(dut.memory_bytes(), 0)
+        dut.Generate(features)
+        self.assertEqual((num_items, num_items), (dut.num_hits(), dut.num_misses()))
+
+        # Highlighting another segment grays out the only one, which is the only tile rebuilt.
+        features.highlighted_segments = [SegmentId('another_segment')]
+        mesh = dut.Generate(features)
+        self.assertEqual((2 * num_items - 1, num_items + 1), (dut.num_hits(), dut.num_misses()))
+        self.assertIn(int(RoadMeshMaterial.kGrayedAsphalt), mesh.face_materials)
+        expected = GenerateRoadMesh(self.road_network, features)
+        np.testing.assert_array_equal(expected.vertices, mesh.vertices)
+        np.testing.assert_array_equal(expected.faces, mesh.faces)
+        np.testing.assert_array_equal(expected.face_materials, mesh.face_materials)
+
+        dut.Clear()
+        self.assertEqual(0, dut.num_tiles())
+        self.assertEqual(0, dut.memory_bytes())
+
+    def test_road_mesh_cache_evicts_beyond_memory_budget(self):
+        """
+        Tests that RoadMeshCache keeps no more tiles than fit in its memory budget.
+        """
+        dut = RoadMeshCache(self.road_network, max_memory_bytes=0)
+        mesh = dut.Generate(ObjFeatures())
+        self.assertGreater(len(mesh.faces), 0)
+        self.assertEqual(0, dut.num_tiles())
+        self.assertEqual(0, dut.memory_bytes())
+
+    def test_road_mesh_lods_match_road_mesh(self):
+        """
+        Tests that every level of detail matches GenerateRoadMesh with its max_grid_unit, and
+        that coarser levels have fewer faces.
+        """
+        features = ObjFeatures()
+        features.min_grid_resolution = 1.
+        max_grid_units = [0.5, 2., 8.]
+        dut = GenerateRoadMeshLods(self.road_network, features, max_grid_units)
+        self.assertEqual(len(max_grid_units), len(dut))
+        for max_grid_unit, level in zip(max_grid_units, dut):
+            features.max_grid_unit = max_grid_unit
+            expected = GenerateRoadMesh(self.road_network, features)
+            np.testing.assert_array_equal(expected.vertices, level.vertices)
+            np.testing.assert_array_equal(expected.faces, level.faces)
+            np.testing.assert_array_equal(expected.object_bounding_boxes,
+                                          level.object_bounding_boxes)
+        self.assertGreater(len(dut[0].faces), len(dut[1].faces))
+        self.assertGreater(len(dut[1].faces), len(dut[2].faces))
+        for max_grid_units in ([], [1., 0.], [float('inf')]):
+            with self.assertRaises(ValueError):
+                GenerateRoadMeshLods(self.road_network, features, max_grid_units)
+
+    def test_road_mesh_lods_share_levels_with_the_same_grid_units(self):
+        """
+        Tests that levels whose grid units min_grid_resolution bounds alike get the same mesh.
+        """
+        features = ObjFeatures()
+        features.min_grid_resolution = 1.
+        # Both exceed the width of the dragway, which bounds every grid unit at either level.
+        dut = GenerateRoadMeshLods(self.road_network, features, [50., 100.])
+        np.testing.assert_array_equal(dut[0].vertices, dut[1].vertices)
+        np.testing.assert_array_equal(dut[0].faces, dut[1].faces)
+        np.testing.assert_array_equal(dut[0].face_materials, dut[1].face_materials)
@@ -41,7 +41,13 @@ from maliput.api import (
 
 from maliput.utility import (
     GenerateObjFile,
-    ObjFeatures
+    GenerateRoadMesh,
+    GenerateRoadMeshLods,
+    GenerateRoadMeshObjFile,
+    ObjFeatures,
+    RoadMeshArrays,
+    RoadMeshCache,
+    RoadMeshMaterial,
 )
 
 
@@ -60,6 +66,93 @@ class TestMaliputUtility(unittest.TestCase):
         dut_name = GenerateObjFile.__name__
         self.assertEqual('GenerateObjFile', dut_name)
 
+    def test_generate_road_mesh_obj_file_method(self):
+        """
+        Tests that GenerateRoadMeshObjFile method exists.
+        """
+        dut_name = GenerateRoadMeshObjFile.__name__
+        self.assertEqual('GenerateRoadMeshObjFile', dut_name)
+
+    def test_generate_road_mesh_obj_file_rejects_none(self):
+        """
+        Tests that GenerateRoadMeshObjFile rejects a missing road network.
+        """
+        with self.assertRaises(ValueError):
+            GenerateRoadMeshObjFile(None, '/tmp', 'road_mesh', ObjFeatures())
+
+    def test_generate_road_mesh_method(self):
+        """
+        Tests that GenerateRoadMesh method exists.
+        """
+        dut_name = GenerateRoadMesh.__name__
+        self.assertEqual('GenerateRoadMesh', dut_name)
+
+    def test_generate_road_mesh_rejects_none(self):
+        """
+        Tests that GenerateRoadMesh rejects a missing road network.
+        """
+        with self.assertRaises(ValueError):
+            GenerateRoadMesh(None, ObjFeatures())
+
+    def test_generate_road_mesh_lods_method(self):
+        """
+        Tests that GenerateRoadMeshLods method exists.
+        """
+        dut_name = GenerateRoadMeshLods.__name__
+        self.assertEqual('GenerateRoadMeshLods', dut_name)
+
+    def test_generate_road_mesh_lods_rejects_none(self):
+        """
+        Tests that GenerateRoadMeshLods rejects a missing road network.
+        """
+        with self.assertRaises(ValueError):
+            GenerateRoadMeshLods(None, ObjFeatures(), [1.])
+
+    def test_empty_road_mesh_arrays(self):
+        """
+        Tests an empty RoadMeshArrays binding.
+        """
+        dut = RoadMeshArrays()
+
+        self.assertEqual(0, dut.vertices.size)
+        self.assertEqual(0, dut.normals.size)
+        self.assertEqual(0, dut.faces.size)
+        self.assertEqual(0, dut.face_materials.size)
+        self.assertEqual([], dut.object_names)
+        self.assertEqual(0, dut.object_face_offsets.size)
+        self.assertEqual(0, dut.object_bounding_boxes.size)
+
+    def test_road_mesh_cache_methods(self):
+        """
+        Tests that RoadMeshCache exposes the right methods.
+        """
+        dut_type_methods = dir(RoadMeshCache)
+        self.assertTrue('Generate' in dut_type_methods)
+        self.assertTrue('Clear' in dut_type_methods)
+        self.assertTrue('max_memory_bytes' in dut_type_methods)
+        self.assertTrue('memory_bytes' in dut_type_methods)
+        self.assertTrue('num_tiles' in dut_type_methods)
+        self.assertTrue('num_hits' in dut_type_methods)
+        self.assertTrue('num_misses' in dut_type_methods)
+
+    def test_road_mesh_cache_rejects_none(self):
+        """
+        Tests that RoadMeshCache rejects a missing road network.
+        """
+        with self.assertRaises(ValueError):
+            RoadMeshCache(None)
+
+    def test_road_mesh_material(self):
+        """
+        Tests the RoadMeshMaterial binding.
+        """
+        self.assertEqual(0, int(RoadMeshMaterial.kAsphalt))
+        self.assertEqual(1, int(RoadMeshMaterial.kGrayedAsphalt))
+        self.assertEqual(2, int(RoadMeshMaterial.kLaneHaze))
+        self.assertEqual(3, int(RoadMeshMaterial.kMarkerPaint))
+        self.assertEqual(4, int(RoadMeshMaterial.kBranchPointGlow))
+        self.assertEqual(5, int(RoadMeshMaterial.kElevationBounds))
+
     def test_obj_features(self):
         """
         Tests the ObjFeatures binding.